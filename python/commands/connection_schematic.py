@@ -416,20 +416,13 @@ class ConnectionManager:
                 # If we have PinLocator and schematic_path, do accurate pin matching
                 if locator and schematic_path:
                     try:
-                        # Get all pins for this symbol
-                        pins = locator.get_symbol_pins(schematic_path, lib_id)
+                        # Get the locations of all pins on this symbol
+                        pins = locator.get_all_symbol_pins(schematic_path, ref)
                         if not pins:
                             continue
 
                         # Check each pin
-                        for pin_num in pins:
-                            # Get pin location
-                            pin_loc = locator.get_pin_location(
-                                schematic_path, ref, pin_num
-                            )
-                            if not pin_loc:
-                                continue
-
+                        for pin_num, pin_loc in pins.items():
                             # Check if pin coincides with any wire point
                             for wire_pt in connected_wire_points:
                                 if points_coincide(pin_loc, wire_pt):
@@ -46,6 +46,7 @@ class JLCPCBClient:
     """
 
     BASE_URL = "https://jlcpcb.com/external"
+    _AUTH_TMPL = 'JOP appid="{0}",accesskey="{1}",nonce="{2}",timestamp="{3}",signature="{4}"'
 
     def __init__(
         self,
@@ -70,6 +71,14 @@ class JLCPCBClient:
                 "Set JLCPCB_APP_ID, JLCPCB_API_KEY, and JLCPCB_API_SECRET environment variables."
             )
 
+        # Keyed HMAC state is computed once and copied per signature, which
+        # skips re-deriving the inner/outer pads on every request.
+        self._hmac_template: hmac.HMAC | None = (
+            hmac.new(self.secret_key.encode("utf-8"), None, hashlib.sha256)
+            if self.secret_key
+            else None
+        )
+
     @staticmethod
     def _generate_nonce() -> str:
         """Generate a 32-character random nonce.
@@ -102,7 +111,7 @@ class JLCPCBClient:
         Returns:
             Signature string
         """
-        return f"{method}\n{path}\n{timestamp}\n{nonce}\n{body}\n"
+        return "\n".join((method, path, str(timestamp), nonce, body, ""))
 
     def _sign(self, signature_string: str) -> str:
         """Sign the signature string with HMAC-SHA256.
@@ -113,14 +122,14 @@ class JLCPCBClient:
         Returns:
             Base64-encoded signature
         """
-        if self.secret_key is None:
+        if self._hmac_template is None:
             msg = "Secret key is not configured"
             raise JLCPCBCredentialsError(msg)
 
-        signature_bytes = hmac.new(
-            self.secret_key.encode("utf-8"), signature_string.encode("utf-8"), hashlib.sha256
-        ).digest()
-        return base64.b64encode(signature_bytes).decode("utf-8")
+        mac = self._hmac_template.copy()
+        mac.update(signature_string.encode("utf-8"))
+        signature_bytes = mac.digest()
+        return base64.b64encode(signature_bytes).decode("ascii")
 
     def _get_auth_header(self, method: str, path: str, body: str = "") -> str:
         """Generate the Authorization header for JLCPCB API requests.
@@ -152,21 +161,16 @@ class JLCPCBClient:
         signature_string = self._build_signature_string(method, path, timestamp, nonce, body)
         signature = self._sign(signature_string)
 
-        logger.debug("Signature string: %r", signature_string)
-        logger.debug("Signature: %s", signature)
-        logger.debug(
-            'Auth header: JOP appid="%s",accesskey="%s",nonce="%s",timestamp="%s",signature="%s"',
-            self.app_id,
-            self.access_key,
-            nonce,
-            timestamp,
-            signature,
+        auth_header = self._AUTH_TMPL.format(
+            self.app_id, self.access_key, nonce, timestamp, signature
         )
 
-        return (
-            f'JOP appid="{self.app_id}",accesskey="{self.access_key}",'
-            f'nonce="{nonce}",timestamp="{timestamp}",signature="{signature}"'
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Signature string: %r", signature_string)
+            logger.debug("Signature: %s", signature)
+            logger.debug("Auth header: %s", auth_header)
+
+        return auth_header
 
     def fetch_parts_page(self, last_key: str | None = None) -> dict[str, Any]:
         """Fetch one page of parts from JLCPCB API.
@@ -182,13 +186,9 @@ class JLCPCBClient:
         """
         path = "/component/getComponentInfos"
 
-        payload: dict[str, str] = {}
-        if last_key:
-            payload["lastKey"] = last_key
-
         # Convert payload to JSON string for signing
         # For POST requests, we always send JSON, even if empty dict
-        body_str = json.dumps(payload, separators=(",", ":"))
+        body_str = json.dumps({"lastKey": last_key}, separators=(",", ":")) if last_key else "{}"
 
         # Generate authorization header
         auth_header = self._get_auth_header("POST", path, body_str)
@@ -196,13 +196,21 @@ class JLCPCBClient:
         headers = {"Authorization": auth_header, "Content-Type": "application/json"}
 
         try:
+            # Send the exact bytes that were signed instead of letting requests
+            # re-serialize the payload.
             response = requests.post(
-                f"{self.BASE_URL}{path}", headers=headers, json=payload, timeout=60
+                f"{self.BASE_URL}{path}",
+                headers=headers,
+                data=body_str.encode("utf-8"),
+                timeout=60,
             )
 
-            logger.debug("Response status: %s", response.status_code)
-            logger.debug("Response headers: %s", response.headers)
-            logger.debug("Response text: %s", response.text)
+            # response.text forces a full-body charset decode, so only touch it
+            # when DEBUG output is actually going somewhere.
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response status: %s", response.status_code)
+                logger.debug("Response headers: %s", response.headers)
+                logger.debug("Response text: %s", response.text)
 
             response.raise_for_status()
             data: dict[str, Any] = response.json()
@@ -239,6 +247,7 @@ class JLCPCBClient:
         """
         all_parts: list[dict[str, Any]] = []
         last_key: str | None = None
+        prev_key: str | None = None
         page = 0
 
         logger.info("Starting full JLCPCB parts database download...")
@@ -253,6 +262,13 @@ class JLCPCBClient:
                 all_parts.extend(parts)
 
                 last_key = data.get("lastKey")
+                if last_key and last_key == prev_key:
+                    logger.warning(
+                        "API returned the same lastKey twice at page %d; stopping download",
+                        page,
+                    )
+                    break
+                prev_key = last_key
 
                 if callback:
                     callback(page, len(all_parts), f"Downloaded {len(all_parts)} parts...")
@@ -6,18 +6,225 @@ and component selection.
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from contextlib import contextmanager, suppress
+from functools import lru_cache
+from itertools import islice
 import json
 import logging
 from pathlib import Path
+import queue
+import re
 import sqlite3
-from typing import TYPE_CHECKING, Any
+import threading
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable, Iterator
 
 logger = logging.getLogger("kicad_interface")
 
+# Parts are bound and inserted this many rows at a time
+_IMPORT_CHUNK_SIZE = 1000
+
+# Reader connections are opened on demand up to this many; each has its own
+# page cache and mmap, and the server mostly queries from one thread
+_MAX_READERS = 4
+
+
+class ComponentRow(NamedTuple):
+    """One row of the components table, in column order."""
+
+    lcsc: str
+    category: str | None
+    subcategory: str | None
+    mfr_part: str | None
+    package: str | None
+    solder_joints: int | None
+    manufacturer: str | None
+    library_type: str | None
+    description: str | None
+    datasheet: str | None
+    stock: int | None
+    price_json: str | None
+    last_updated: int | None
+    first_price: float | None
+
+
+def _component_row(_cursor: sqlite3.Cursor, row: tuple[Any, ...]) -> ComponentRow:
+    """Row factory building ComponentRow tuples instead of sqlite3.Row mappings."""
+    return ComponentRow._make(row)
+
+
+# Explicit select list so rows always line up with ComponentRow's fields
+_COMPONENT_COLUMNS = ", ".join(f"c.{name}" for name in ComponentRow._fields)
+_SELECT_COMPONENTS = f"SELECT {_COMPONENT_COLUMNS} FROM components c"  # noqa: S608
+
+# Incremental imports at least this large merge FTS segments afterwards
+_FTS_OPTIMIZE_THRESHOLD = 10_000
+
+# Upsert rather than INSERT OR REPLACE: an update keeps the rowid and fires the
+# FTS update trigger, while REPLACE's implicit delete would skip the delete trigger.
+_INSERT_COMPONENT_SQL = """
+    INSERT INTO components (
+        lcsc, category, subcategory, mfr_part, package,
+        solder_joints, manufacturer, library_type, description,
+        datasheet, stock, price_json, last_updated, first_price
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(lcsc) DO UPDATE SET
+        category = excluded.category,
+        subcategory = excluded.subcategory,
+        mfr_part = excluded.mfr_part,
+        package = excluded.package,
+        solder_joints = excluded.solder_joints,
+        manufacturer = excluded.manufacturer,
+        library_type = excluded.library_type,
+        description = excluded.description,
+        datasheet = excluded.datasheet,
+        stock = excluded.stock,
+        price_json = excluded.price_json,
+        last_updated = excluded.last_updated,
+        first_price = excluded.first_price
+"""
+
+# Column values sqlite binds directly; anything else makes a part malformed
+_SQL_SCALARS = (str, int, float, type(None))
+
+# sqlite stores integers as signed 64-bit; larger ones raise OverflowError on bind
+_SQL_INT_MIN = -(2**63)
+_SQL_INT_MAX = 2**63 - 1
+
+
+def _is_bindable_row(row: tuple[Any, ...]) -> bool:
+    """Check that sqlite can bind every value of a row tuple."""
+    for value in row:
+        if not isinstance(value, _SQL_SCALARS):
+            return False
+        if isinstance(value, int) and not _SQL_INT_MIN <= value <= _SQL_INT_MAX:
+            return False
+    return True
+
+
+# Secondary indexes by name; dropped and recreated around bulk imports. The
+# columns search_parts filters with LIKE are indexed NOCASE, matching LIKE's
+# case-insensitive comparison, so a "prefix%" pattern can range-scan them.
+_INDEX_DDL = {
+    "idx_category_nocase": (
+        "CREATE INDEX IF NOT EXISTS idx_category_nocase "
+        "ON components(category COLLATE NOCASE, subcategory)"
+    ),
+    "idx_package_nocase": (
+        "CREATE INDEX IF NOT EXISTS idx_package_nocase ON components(package COLLATE NOCASE)"
+    ),
+    "idx_manufacturer_nocase": (
+        "CREATE INDEX IF NOT EXISTS idx_manufacturer_nocase "
+        "ON components(manufacturer COLLATE NOCASE)"
+    ),
+    "idx_library_type": "CREATE INDEX IF NOT EXISTS idx_library_type ON components(library_type)",
+    "idx_mfr_part": "CREATE INDEX IF NOT EXISTS idx_mfr_part ON components(mfr_part)",
+    "idx_cat_pkg_price": (
+        "CREATE INDEX IF NOT EXISTS idx_cat_pkg_price "
+        "ON components(subcategory, package, first_price)"
+    ),
+    # Partial index matching search_parts' in_stock=True default
+    "idx_lt_pkg_stock": (
+        "CREATE INDEX IF NOT EXISTS idx_lt_pkg_stock "
+        "ON components(library_type, package, stock) WHERE stock > 0"
+    ),
+}
+
+# Binary-collation indexes the NOCASE ones above replace
+_RETIRED_INDEXES = ("idx_category", "idx_package", "idx_manufacturer")
+
+_FTS_DDL = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS components_fts USING fts5(
+        lcsc,
+        description,
+        mfr_part,
+        manufacturer,
+        content=components
+    )
+"""
+
+# Keep the external-content FTS table in step with components row by row
+_FTS_TRIGGER_DDL = {
+    "components_ai": """
+        CREATE TRIGGER IF NOT EXISTS components_ai AFTER INSERT ON components BEGIN
+            INSERT INTO components_fts(rowid, lcsc, description, mfr_part, manufacturer)
+            VALUES (new.rowid, new.lcsc, new.description, new.mfr_part, new.manufacturer);
+        END
+    """,
+    "components_ad": """
+        CREATE TRIGGER IF NOT EXISTS components_ad AFTER DELETE ON components BEGIN
+            INSERT INTO components_fts(
+                components_fts, rowid, lcsc, description, mfr_part, manufacturer
+            )
+            VALUES ('delete', old.rowid, old.lcsc, old.description, old.mfr_part,
+                    old.manufacturer);
+        END
+    """,
+    "components_au": """
+        CREATE TRIGGER IF NOT EXISTS components_au AFTER UPDATE ON components BEGIN
+            INSERT INTO components_fts(
+                components_fts, rowid, lcsc, description, mfr_part, manufacturer
+            )
+            VALUES ('delete', old.rowid, old.lcsc, old.description, old.mfr_part,
+                    old.manufacturer);
+            INSERT INTO components_fts(rowid, lcsc, description, mfr_part, manufacturer)
+            VALUES (new.rowid, new.lcsc, new.description, new.mfr_part, new.manufacturer);
+        END
+    """,
+}
+
+# JLCPCB package name -> candidate KiCAD footprints; keys are upper-case
+_PACKAGE_MAP: dict[str, tuple[str, ...]] = {
+    "0402": (
+        "Resistor_SMD:R_0402_1005Metric",
+        "Capacitor_SMD:C_0402_1005Metric",
+        "LED_SMD:LED_0402_1005Metric",
+    ),
+    "0603": (
+        "Resistor_SMD:R_0603_1608Metric",
+        "Capacitor_SMD:C_0603_1608Metric",
+        "LED_SMD:LED_0603_1608Metric",
+    ),
+    "0805": ("Resistor_SMD:R_0805_2012Metric", "Capacitor_SMD:C_0805_2012Metric"),
+    "1206": ("Resistor_SMD:R_1206_3216Metric", "Capacitor_SMD:C_1206_3216Metric"),
+    "SOT-23": ("Package_TO_SOT_SMD:SOT-23", "Package_TO_SOT_SMD:SOT-23-3"),
+    "SOT-23-5": ("Package_TO_SOT_SMD:SOT-23-5",),
+    "SOT-23-6": ("Package_TO_SOT_SMD:SOT-23-6",),
+    "SOIC-8": ("Package_SO:SOIC-8_3.9x4.9mm_P1.27mm",),
+    "SOIC-16": ("Package_SO:SOIC-16_3.9x9.9mm_P1.27mm",),
+    "QFN-20": ("Package_DFN_QFN:QFN-20-1EP_4x4mm_P0.5mm_EP2.5x2.5mm",),
+    "QFN-32": ("Package_DFN_QFN:QFN-32-1EP_5x5mm_P0.5mm_EP3.45x3.45mm",),
+}
+
+# Fallback for decorated package names such as "SOT-23-5_L2.9-W1.6"; longest
+# keys are tried first so "SOT-23-5" wins over "SOT-23".
+_PACKAGE_RE = re.compile("|".join(map(re.escape, sorted(_PACKAGE_MAP, key=len, reverse=True))))
+
+
+@lru_cache(maxsize=256)
+def _footprints_for_package(package: str) -> tuple[str, ...]:
+    """Resolve a JLCPCB package name to KiCAD footprints, memoized per raw name.
+
+    BOM lookups repeat the same few package strings many times.
+
+    Args:
+        package: JLCPCB package name as stored in the database
+
+    Returns:
+        Matching footprint library refs (empty if unknown)
+    """
+    package_normalized = package.strip().upper()
+
+    footprints = _PACKAGE_MAP.get(package_normalized)
+    if footprints is None:
+        match = _PACKAGE_RE.search(package_normalized)
+        footprints = _PACKAGE_MAP[match.group()] if match else ()
+
+    return footprints
+
 
 class JLCPCBPartsManager:
     """Manages local database of JLCPCB parts.
@@ -39,15 +246,36 @@ class JLCPCBPartsManager:
             db_path = str(data_dir / "jlcpcb_parts.db")
 
         self.db_path = db_path
-        self.conn = None
+        # One writer serialized by a lock, plus a pool of reader connections
+        # that WAL lets run alongside an import. Readers are opened lazily;
+        # every one ever opened is tracked so close() reaches borrowed ones too.
+        self._write_lock = threading.Lock()
+        self._write_conn = self._connect()
+        self._read_pool: queue.Queue[sqlite3.Connection] = queue.Queue()
+        self._readers: list[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        self._max_readers = _MAX_READERS
         self._init_database()
 
+        if db_path == ":memory:":
+            # Each connection to :memory: is a separate database
+            self._readers.append(self._write_conn)
+            self._read_pool.put(self._write_conn)
+            self._max_readers = 1
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a tuned connection that may be handed between threads.
+
+        Returns:
+            New SQLite connection returning plain tuple rows
+        """
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._apply_pragmas(conn)
+        return conn
+
     def _init_database(self) -> None:
         """Initialize SQLite database with schema."""
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.row_factory = sqlite3.Row  # Return rows as dicts
-
-        cursor = self.conn.cursor()
+        cursor = self._write_conn.cursor()
 
         # Create components table
         cursor.execute("""
@@ -64,98 +292,271 @@ class JLCPCBPartsManager:
                 datasheet TEXT,
                 stock INTEGER,
                 price_json TEXT,
-                last_updated INTEGER
+                last_updated INTEGER,
+                first_price REAL
             )
         """)
 
+        # Databases created before first_price existed get it added and backfilled
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(components)")}
+        if "first_price" not in columns:
+            cursor.execute("ALTER TABLE components ADD COLUMN first_price REAL")
+            cursor.execute(
+                "UPDATE components SET first_price = json_extract(price_json, '$[0].price')"
+            )
+
+        for name in _RETIRED_INDEXES:
+            cursor.execute(f"DROP INDEX IF EXISTS {name}")
+        self._create_search_indexes(cursor)
+
+        self._write_conn.commit()
+        logger.info("Initialized JLCPCB parts database at %s", self.db_path)
+
+    @staticmethod
+    def _create_search_indexes(cursor: sqlite3.Cursor) -> None:
+        """Create the secondary B-tree indexes, FTS table and FTS triggers if missing.
+
+        Args:
+            cursor: Cursor to run the DDL on
+        """
         # Create indexes for fast searching
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_category ON components(category, subcategory)"
-        )
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_package ON components(package)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_manufacturer ON components(manufacturer)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_library_type ON components(library_type)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_mfr_part ON components(mfr_part)")
+        for ddl in _INDEX_DDL.values():
+            cursor.execute(ddl)
 
         # Full-text search index for descriptions
-        cursor.execute("""
-            CREATE VIRTUAL TABLE IF NOT EXISTS components_fts USING fts5(
-                lcsc,
-                description,
-                mfr_part,
-                manufacturer,
-                content=components
-            )
+        cursor.execute(_FTS_DDL)
+        for ddl in _FTS_TRIGGER_DDL.values():
+            cursor.execute(ddl)
+
+    @staticmethod
+    def _drop_search_indexes(cursor: sqlite3.Cursor) -> None:
+        """Drop the secondary indexes, FTS triggers and FTS table ahead of a bulk load.
+
+        Args:
+            cursor: Cursor to run the DDL on
+        """
+        for name in _INDEX_DDL:
+            cursor.execute(f"DROP INDEX IF EXISTS {name}")
+        for name in _FTS_TRIGGER_DDL:
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+        cursor.execute("DROP TABLE IF EXISTS components_fts")
+
+    def _apply_pragmas(self, conn: sqlite3.Connection) -> None:
+        """Tune a connection for a read-heavy catalog with periodic bulk refreshes.
+
+        WAL lets searches keep reading while an import is writing, and
+        synchronous=NORMAL is durable enough under WAL without an fsync per commit.
+
+        Args:
+            conn: Connection to configure
+        """
+        if self.db_path != ":memory:":
+            conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript("""
+            PRAGMA synchronous=NORMAL;
+            PRAGMA busy_timeout=5000;
+            PRAGMA cache_size=-20000;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
         """)
 
-        self.conn.commit()
-        logger.info("Initialized JLCPCB parts database at %s", self.db_path)
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Run a block of writes inside a single explicit transaction.
+
+        Holds the write lock for the duration, commits on success and rolls
+        back if the block raises.
+
+        Yields:
+            Cursor bound to the open transaction.
+        """
+        with self._write_lock:
+            cursor = self._write_conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+            except BaseException:
+                self._write_conn.rollback()
+                raise
+            self._write_conn.commit()
+
+    @contextmanager
+    def _read_cursor(self) -> Iterator[sqlite3.Cursor]:
+        """Borrow a reader connection from the pool for the duration of a query.
+
+        Yields:
+            Cursor on a pooled read connection.
+        """
+        conn = self._acquire_reader()
+        try:
+            yield conn.cursor()
+        finally:
+            self._read_pool.put(conn)
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        """Take an idle reader, opening a new one while under the cap.
+
+        Returns:
+            Reader connection; waits for one to be returned once all
+            _max_readers are open and busy.
+        """
+        with suppress(queue.Empty):
+            return self._read_pool.get_nowait()
+        with self._readers_lock:
+            if len(self._readers) < self._max_readers:
+                conn = self._connect()
+                self._readers.append(conn)
+                return conn
+        return self._read_pool.get()
+
+    def _import_rows(
+        self,
+        parts: Iterable[dict[str, Any]],
+        build_row: Callable[[dict[str, Any], int], tuple[Any, ...] | None],
+        progress_callback: Callable[[int, int, str], None] | None,
+        *,
+        bulk: bool,
+    ) -> None:
+        """Bulk-insert parts in chunks with one prepared INSERT per chunk.
+
+        Every part is converted and validated before the write transaction
+        begins, so consuming a lazy stream (and waiting on the network behind
+        it) never holds the database write lock.
+
+        Args:
+            parts: Raw part dicts from the API; may be a lazy stream
+            build_row: Converts a part dict and import timestamp to a row tuple,
+                or None if the part is malformed and should be skipped
+            progress_callback: Optional callback(current, total, message)
+            bulk: Drop secondary indexes and FTS for the load and rebuild them after
+        """
+        now_ts = int(time.time())
+        rows = []
+        skipped = 0
+        for part in parts:
+            row = build_row(part, now_ts)
+            if row is None:
+                skipped += 1
+            else:
+                rows.append(row)
+
+        total = len(rows)
+        processed = 0
+        imported = 0
+
+        with self._transaction() as cursor:
+            if bulk:
+                self._drop_search_indexes(cursor)
+
+            row_iter = iter(rows)
+            while chunk := list(islice(row_iter, _IMPORT_CHUNK_SIZE)):
+                inserted = self._insert_rows(cursor, chunk)
+                imported += inserted
+                skipped += len(chunk) - inserted
+                processed += len(chunk)
+
+                if progress_callback:
+                    progress_callback(processed, total, f"Imported {imported} parts...")
+
+            if bulk:
+                # The FTS table was recreated empty, so index everything once
+                self._create_search_indexes(cursor)
+                cursor.execute("INSERT INTO components_fts(components_fts) VALUES('rebuild')")
+                cursor.execute("ANALYZE components")
+            elif imported >= _FTS_OPTIMIZE_THRESHOLD:
+                # Triggers kept FTS current; merge the many small segments they left
+                cursor.execute("INSERT INTO components_fts(components_fts) VALUES('optimize')")
+
+        logger.info("Import complete: %d parts imported, %d skipped", imported, skipped)
+
+    @staticmethod
+    def _insert_rows(cursor: sqlite3.Cursor, rows: list[tuple[Any, ...]]) -> int:
+        """Insert one chunk of rows, retrying row by row if the batch fails.
+
+        One value sqlite cannot bind aborts the whole executemany; replaying the
+        chunk one row at a time keeps the good rows and drops only the bad ones.
+        Rows the failed batch already wrote are upserted again unchanged.
+
+        Args:
+            cursor: Cursor inside the import transaction
+            rows: Row tuples in _INSERT_COMPONENT_SQL column order
+
+        Returns:
+            Number of rows inserted
+        """
+        try:
+            cursor.executemany(_INSERT_COMPONENT_SQL, rows)
+        except (sqlite3.InterfaceError, sqlite3.ProgrammingError, OverflowError):
+            logger.debug("Batch insert failed, retrying %d rows individually", len(rows))
+        else:
+            return len(rows)
+
+        inserted = 0
+        for row in rows:
+            try:
+                cursor.execute(_INSERT_COMPONENT_SQL, row)
+            except (sqlite3.InterfaceError, sqlite3.ProgrammingError, OverflowError):
+                logger.debug("Skipping part %s with an unbindable field", row[0])
+            else:
+                inserted += 1
+        return inserted
 
     def import_parts(
         self,
         parts: list[dict[str, Any]],
         progress_callback: Callable[[int, int, str], None] | None = None,
+        *,
+        bulk: bool = False,
     ) -> None:
         """Import parts into database from JLCPCB API response.
 
         Args:
             parts: List of part dicts from JLCPCB API
             progress_callback: Optional callback(current, total, message)
+            bulk: Full-catalog load; defer index and FTS maintenance until the end
         """
-        cursor = self.conn.cursor()
-        imported = 0
-        skipped = 0
+        self._import_rows(parts, self._jlcpcb_row, progress_callback, bulk=bulk)
 
-        for i, part in enumerate(parts):
-            try:
-                # Extract price breaks
-                price_json = json.dumps(part.get("prices", []))
-
-                # Determine library type
-                library_type = self._determine_library_type(part)
-
-                cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO components (
-                        lcsc, category, subcategory, mfr_part, package,
-                        solder_joints, manufacturer, library_type, description,
-                        datasheet, stock, price_json, last_updated
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        part.get("componentCode"),  # lcsc
-                        part.get("firstSortName"),  # category
-                        part.get("secondSortName"),  # subcategory
-                        part.get("componentModelEn"),  # mfr_part
-                        part.get("componentSpecificationEn"),  # package
-                        part.get("soldPoint"),  # solder_joints
-                        part.get("componentBrandEn"),  # manufacturer
-                        library_type,  # library_type
-                        part.get("describe"),  # description
-                        part.get("dataManualUrl"),  # datasheet
-                        part.get("stockCount", 0),  # stock
-                        price_json,  # price_json
-                        int(datetime.now(tz=UTC).timestamp()),  # last_updated
-                    ),
-                )
-
-                imported += 1
-
-                if progress_callback and (i + 1) % 1000 == 0:
-                    progress_callback(i + 1, len(parts), f"Imported {imported} parts...")
-
-            except Exception:
-                logger.exception("Error importing part %s", part.get("componentCode"))
-                skipped += 1
+    def _jlcpcb_row(self, part: dict[str, Any], now_ts: int) -> tuple[Any, ...] | None:
+        """Build a components row from a JLCPCB API part.
 
-        # Update FTS index
-        cursor.execute("""
-            INSERT INTO components_fts(components_fts, rowid, lcsc, description, mfr_part, manufacturer)
-            SELECT 'rebuild', rowid, lcsc, description, mfr_part, manufacturer FROM components
-        """)
+        Args:
+            part: Part dictionary from the JLCPCB API
+            now_ts: Import timestamp stored as last_updated
 
-        self.conn.commit()
-        logger.info("Import complete: %d parts imported, %d skipped", imported, skipped)
+        Returns:
+            Row tuple in _INSERT_COMPONENT_SQL column order, or None if the part
+            has no LCSC number or any field is not a plain scalar
+        """
+        lcsc = part.get("componentCode")
+        if not lcsc:
+            return None
+
+        try:
+            prices = part.get("prices", [])
+            first_price = self._parse_price(prices[0].get("price") if prices else None)
+            price_json = json.dumps(prices)
+            library_type = self._determine_library_type(part)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return None
+
+        row = (
+            lcsc,  # lcsc
+            part.get("firstSortName"),  # category
+            part.get("secondSortName"),  # subcategory
+            part.get("componentModelEn"),  # mfr_part
+            part.get("componentSpecificationEn"),  # package
+            part.get("soldPoint"),  # solder_joints
+            part.get("componentBrandEn"),  # manufacturer
+            library_type,  # library_type
+            part.get("describe"),  # description
+            part.get("dataManualUrl"),  # datasheet
+            part.get("stockCount", 0),  # stock
+            price_json,  # price_json
+            now_ts,  # last_updated
+            first_price,  # first_price
+        )
+        return row if _is_bindable_row(row) else None
 
     def _determine_library_type(self, part: dict[str, Any]) -> str:
         """Determine if part is Basic, Extended, or Preferred."""
@@ -184,6 +585,23 @@ class JLCPCBPartsManager:
             return f"C{lcsc}"
         return str(lcsc) if lcsc else ""
 
+    @staticmethod
+    def _parse_price(price: float | str | None) -> float | None:
+        """Convert a unit price from API data to a float for the first_price column.
+
+        Args:
+            price: Raw price value (number, numeric string, or None)
+
+        Returns:
+            Price as float, or None if missing or not numeric
+        """
+        if price is None:
+            return None
+        try:
+            return float(price)
+        except (TypeError, ValueError):
+            return None
+
     @staticmethod
     def _build_price_json(part: dict[str, Any]) -> str:
         """Build price JSON from JLCSearch part data.
@@ -242,70 +660,58 @@ class JLCPCBPartsManager:
 
     def import_jlcsearch_parts(
         self,
-        parts: list[dict[str, Any]],
+        parts: Iterable[dict[str, Any]],
         progress_callback: Callable[[int, int, str], None] | None = None,
+        *,
+        bulk: bool = False,
     ) -> None:
         """Import parts into database from JLCSearch API response.
 
         Args:
-            parts: List of part dicts from JLCSearch API
+            parts: Part dicts from JLCSearch API, e.g. a JLCSearchClient stream
             progress_callback: Optional callback(current, total, message)
+            bulk: Full-catalog load; defer index and FTS maintenance until the end
         """
-        cursor = self.conn.cursor()
-        imported = 0
-        skipped = 0
+        self._import_rows(parts, self._jlcsearch_row, progress_callback, bulk=bulk)
 
-        for i, part in enumerate(parts):
-            try:
-                # Normalize and prepare part data
-                lcsc = self._normalize_lcsc_number(part.get("lcsc"))
-                price_json = self._build_price_json(part)
-                library_type = self._determine_library_type(part)
-                description = self._build_description(part)
-
-                # Insert into database
-                cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO components (
-                        lcsc, category, subcategory, mfr_part, package,
-                        solder_joints, manufacturer, library_type, description,
-                        datasheet, stock, price_json, last_updated
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        lcsc,  # lcsc with C prefix
-                        part.get("category", ""),  # category
-                        part.get("subcategory", ""),  # subcategory
-                        part.get("mfr", ""),  # mfr_part
-                        part.get("package", ""),  # package
-                        0,  # solder_joints (not in jlcsearch)
-                        part.get("manufacturer", ""),  # manufacturer
-                        library_type,  # library_type
-                        description,  # description
-                        "",  # datasheet (not in jlcsearch)
-                        part.get("stock", 0),  # stock
-                        price_json,  # price_json
-                        int(datetime.now(tz=UTC).timestamp()),  # last_updated
-                    ),
-                )
-
-                imported += 1
-
-                if progress_callback and (i + 1) % 1000 == 0:
-                    progress_callback(i + 1, len(parts), f"Imported {imported} parts...")
-
-            except Exception:
-                logger.exception("Error importing part %s", part.get("lcsc"))
-                skipped += 1
+    def _jlcsearch_row(self, part: dict[str, Any], now_ts: int) -> tuple[Any, ...] | None:
+        """Build a components row from a JLCSearch part.
 
-        # Update FTS index
-        cursor.execute("""
-            INSERT INTO components_fts(components_fts)
-            VALUES('rebuild')
-        """)
+        Args:
+            part: Part dictionary from JLCSearch
+            now_ts: Import timestamp stored as last_updated
 
-        self.conn.commit()
-        logger.info("Import complete: %d parts imported, %d skipped", imported, skipped)
+        Returns:
+            Row tuple in _INSERT_COMPONENT_SQL column order, or None if the part
+            has no LCSC number or any field is not a plain scalar
+        """
+        lcsc = self._normalize_lcsc_number(part.get("lcsc"))
+        if not lcsc:
+            return None
+
+        try:
+            description = self._build_description(part)
+            price_json = self._build_price_json(part)
+        except (KeyError, TypeError, ValueError):
+            return None
+
+        row = (
+            lcsc,  # lcsc with C prefix
+            part.get("category", ""),  # category
+            part.get("subcategory", ""),  # subcategory
+            part.get("mfr", ""),  # mfr_part
+            part.get("package", ""),  # package
+            0,  # solder_joints (not in jlcsearch)
+            part.get("manufacturer", ""),  # manufacturer
+            self._determine_library_type(part),  # library_type
+            description,  # description
+            "",  # datasheet (not in jlcsearch)
+            part.get("stock", 0),  # stock
+            price_json,  # price_json
+            now_ts,  # last_updated
+            self._parse_price(part.get("price") or part.get("price1")),  # first_price
+        )
+        return row if _is_bindable_row(row) else None
 
     def search_parts(
         self,
@@ -320,6 +726,10 @@ class JLCPCBPartsManager:
     ) -> list[dict[str, Any]]:
         """Search for parts with filters.
 
+        Text filters match anywhere in the column, case-insensitively. A value
+        ending in "*" (e.g. "SOT-23*") is an anchored prefix match instead,
+        also case-insensitive, which can be answered from the column index.
+
         Args:
             query: Free-text search (searches description, mfr part, LCSC)
             category: Filter by category name
@@ -332,40 +742,35 @@ class JLCPCBPartsManager:
         Returns:
             List of matching parts
         """
-        cursor = self.conn.cursor()
-
         # Build query
-        sql_parts = ["SELECT * FROM components WHERE 1=1"]
-        params = []
-
+        params: list[Any] = []
         if query:
-            # Use FTS for text search
-            sql_parts.append("""
-                AND lcsc IN (
-                    SELECT lcsc FROM components_fts
-                    WHERE components_fts MATCH ?
-                )
-            """)
+            # Use FTS for text search; its rowids are the components rowids
+            # (content=components), so join on rowid instead of an IN subquery.
+            sql_parts = [
+                _SELECT_COMPONENTS,
+                "JOIN components_fts f ON f.rowid = c.rowid",
+                "WHERE components_fts MATCH ?",
+            ]
             params.append(query)
+        else:
+            sql_parts = [_SELECT_COMPONENTS, "WHERE 1=1"]
 
         if category:
-            sql_parts.append("AND category LIKE ?")
-            params.append(f"%{category}%")
+            self._add_text_filter(sql_parts, params, "c.category", category)
 
         if package:
-            sql_parts.append("AND package LIKE ?")
-            params.append(f"%{package}%")
+            self._add_text_filter(sql_parts, params, "c.package", package)
 
         if library_type:
-            sql_parts.append("AND library_type = ?")
+            sql_parts.append("AND c.library_type = ?")
             params.append(library_type)
 
         if manufacturer:
-            sql_parts.append("AND manufacturer LIKE ?")
-            params.append(f"%{manufacturer}%")
+            self._add_text_filter(sql_parts, params, "c.manufacturer", manufacturer)
 
         if in_stock:
-            sql_parts.append("AND stock > 0")
+            sql_parts.append("AND c.stock > 0")
 
         sql_parts.append("LIMIT ?")
         params.append(limit)
@@ -373,13 +778,38 @@ class JLCPCBPartsManager:
         sql = " ".join(sql_parts)
 
         try:
-            cursor.execute(sql, params)
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            with self._read_cursor() as cursor:
+                cursor.execute(sql, params)
+                cursor.row_factory = _component_row
+                rows: list[ComponentRow] = cursor.fetchall()
+            return [row._asdict() for row in rows]
         except Exception:
             logger.exception("Search error")
             return []
 
+    @staticmethod
+    def _add_text_filter(sql_parts: list[str], params: list[Any], column: str, value: str) -> None:
+        """Append a category/package/manufacturer predicate to a search query.
+
+        A leading "%" makes LIKE unusable for the B-tree index, so prefix
+        searches ("value*") become a "value%" pattern with its wildcards
+        escaped, which SQLite turns into a range scan on the NOCASE index.
+
+        Args:
+            sql_parts: SQL fragments being assembled
+            params: Bound parameters being assembled
+            column: Column to filter on (trusted, never user input)
+            value: User-supplied filter value
+        """
+        prefix = value[:-1]
+        if value.endswith("*") and prefix and "*" not in prefix:
+            escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            sql_parts.append(f"AND {column} LIKE ? ESCAPE '\\'")
+            params.append(f"{escaped}%")
+        else:
+            sql_parts.append(f"AND {column} LIKE ?")
+            params.append(f"%{value}%")
+
     def get_part_info(self, lcsc_number: str) -> dict[str, Any] | None:
         """Get detailed information for specific LCSC part.
 
@@ -389,12 +819,13 @@ class JLCPCBPartsManager:
         Returns:
             Part info dict or None if not found
         """
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM components WHERE lcsc = ?", (lcsc_number,))
-        row = cursor.fetchone()
+        with self._read_cursor() as cursor:
+            cursor.row_factory = _component_row
+            cursor.execute(_SELECT_COMPONENTS + " WHERE lcsc = ?", (lcsc_number,))
+            row: ComponentRow | None = cursor.fetchone()
 
         if row:
-            part = dict(row)
+            part = row._asdict()
             # Parse price JSON
             if part.get("price_json"):
                 try:
@@ -406,21 +837,17 @@ class JLCPCBPartsManager:
 
     def get_database_stats(self) -> dict[str, Any]:
         """Get statistics about the database."""
-        cursor = self.conn.cursor()
-
-        cursor.execute("SELECT COUNT(*) as total FROM components")
-        total = cursor.fetchone()["total"]
-
-        cursor.execute("SELECT COUNT(*) as basic FROM components WHERE library_type = 'Basic'")
-        basic = cursor.fetchone()["basic"]
-
-        cursor.execute(
-            "SELECT COUNT(*) as extended FROM components WHERE library_type = 'Extended'"
-        )
-        extended = cursor.fetchone()["extended"]
-
-        cursor.execute("SELECT COUNT(*) as in_stock FROM components WHERE stock > 0")
-        in_stock = cursor.fetchone()["in_stock"]
+        # One pass over the table instead of one COUNT per figure
+        with self._read_cursor() as cursor:
+            cursor.execute("""
+                SELECT
+                    COUNT(*) AS total,
+                    COALESCE(SUM(library_type = 'Basic'), 0) AS basic,
+                    COALESCE(SUM(library_type = 'Extended'), 0) AS extended,
+                    COALESCE(SUM(stock > 0), 0) AS in_stock
+                FROM components
+            """)
+            total, basic, extended, in_stock = cursor.fetchone()
 
         return {
             "total_parts": total,
@@ -439,37 +866,7 @@ class JLCPCBPartsManager:
         Returns:
             List of possible KiCAD footprint library refs
         """
-        # Load mapping from JSON file or use defaults
-        mappings = {
-            "0402": [
-                "Resistor_SMD:R_0402_1005Metric",
-                "Capacitor_SMD:C_0402_1005Metric",
-                "LED_SMD:LED_0402_1005Metric",
-            ],
-            "0603": [
-                "Resistor_SMD:R_0603_1608Metric",
-                "Capacitor_SMD:C_0603_1608Metric",
-                "LED_SMD:LED_0603_1608Metric",
-            ],
-            "0805": ["Resistor_SMD:R_0805_2012Metric", "Capacitor_SMD:C_0805_2012Metric"],
-            "1206": ["Resistor_SMD:R_1206_3216Metric", "Capacitor_SMD:C_1206_3216Metric"],
-            "SOT-23": ["Package_TO_SOT_SMD:SOT-23", "Package_TO_SOT_SMD:SOT-23-3"],
-            "SOT-23-5": ["Package_TO_SOT_SMD:SOT-23-5"],
-            "SOT-23-6": ["Package_TO_SOT_SMD:SOT-23-6"],
-            "SOIC-8": ["Package_SO:SOIC-8_3.9x4.9mm_P1.27mm"],
-            "SOIC-16": ["Package_SO:SOIC-16_3.9x9.9mm_P1.27mm"],
-            "QFN-20": ["Package_DFN_QFN:QFN-20-1EP_4x4mm_P0.5mm_EP2.5x2.5mm"],
-            "QFN-32": ["Package_DFN_QFN:QFN-32-1EP_5x5mm_P0.5mm_EP3.45x3.45mm"],
-        }
-
-        # Normalize package name
-        package_normalized = package.strip().upper()
-
-        for key, footprints in mappings.items():
-            if key.upper() in package_normalized:
-                return footprints
-
-        return []
+        return list(_footprints_for_package(package))
 
     def suggest_alternatives(self, lcsc_number: str, limit: int = 5) -> list[dict]:
         """Find alternative parts similar to the given LCSC number.
@@ -487,34 +884,34 @@ class JLCPCBPartsManager:
         if not part:
             return []
 
-        # Search for parts in same category with same package
-        alternatives = self.search_parts(
-            category=part["subcategory"], package=part["package"], in_stock=True, limit=limit * 3
-        )
-
-        # Filter out the original part
-        alternatives = [p for p in alternatives if p["lcsc"] != lcsc_number]
-
-        # Sort by: Basic first, then by price, then by stock
-        def sort_key(p: dict[str, Any]) -> tuple[int, float, int]:
-            is_basic = 1 if p.get("library_type") == "Basic" else 0
-            try:
-                prices = json.loads(p.get("price_json", "[]"))
-                price = float(prices[0].get("price", 999)) if prices else 999
-            except (json.JSONDecodeError, IndexError, KeyError, TypeError, ValueError):
-                price = 999
-            stock = p.get("stock", 0)
-
-            return (-is_basic, price, -stock)
-
-        alternatives.sort(key=sort_key)
+        # Same subcategory and package, ranked by: Basic first, then by price,
+        # then by stock. idx_cat_pkg_price serves the lookup and price order.
+        with self._read_cursor() as cursor:
+            cursor.row_factory = _component_row
+            cursor.execute(
+                _SELECT_COMPONENTS
+                + """
+                WHERE subcategory IS ? AND package IS ? AND stock > 0 AND lcsc <> ?
+                ORDER BY library_type = 'Basic' DESC, first_price IS NULL, first_price,
+                         stock DESC
+                LIMIT ?
+                """,
+                (part["subcategory"], part["package"], lcsc_number, limit),
+            )
+            rows: list[ComponentRow] = cursor.fetchall()
 
-        return alternatives[:limit]
+        return [row._asdict() for row in rows]
 
     def close(self) -> None:
-        """Close database connection."""
-        if self.conn:
-            self.conn.close()
+        """Close all database connections, including readers still borrowed."""
+        with self._readers_lock:
+            for conn in self._readers:
+                if conn is not self._write_conn:
+                    conn.close()
+            self._readers.clear()
+        while not self._read_pool.empty():
+            self._read_pool.get_nowait()
+        self._write_conn.close()
 
 
 if __name__ == "__main__":
@@ -4,15 +4,77 @@ Alternative to official JLCPCB API using the community-maintained
 jlcsearch service at https://jlcsearch.tscircuit.com/
 """
 
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import threading
 import time
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger("kicad_interface")
 
+# Minimum spacing between catalog page requests, shared by all download workers
+_MIN_REQUEST_INTERVAL = 0.1
+
+
+class _RateLimiter:
+    """Space out calls from any number of threads by a minimum interval."""
+
+    def __init__(self, interval: float) -> None:
+        """Initialize the limiter.
+
+        Args:
+            interval: Minimum number of seconds between consecutive calls
+        """
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def wait(self) -> None:
+        """Block until the caller's turn in the shared schedule."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class _ThreadSessions:
+    """Give each thread its own HTTP session; requests.Session is not thread-safe."""
+
+    def __init__(self, factory: Callable[[], requests.Session]) -> None:
+        """Initialize with no sessions created yet.
+
+        Args:
+            factory: Creates a session the first time a thread asks for one
+        """
+        self._factory = factory
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions: list[requests.Session] = []
+
+    def get(self) -> requests.Session:
+        """Get the calling thread's session, creating it on first use."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self._factory()
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def close(self) -> None:
+        """Close every session handed out."""
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+
 
 class JLCSearchClient:
     """Client for JLCSearch public API (tscircuit).
@@ -24,7 +86,27 @@ class JLCSearchClient:
     BASE_URL = "https://jlcsearch.tscircuit.com"
 
     def __init__(self) -> None:
-        """Initialize JLCSearch API client."""
+        """Initialize JLCSearch API client.
+
+        Requests go through a pooled keep-alive session so paginated
+        downloads reuse one TLS connection instead of reconnecting per batch.
+        """
+        self.session = self._new_session()
+
+    @staticmethod
+    def _new_session() -> requests.Session:
+        """Create a keep-alive session that retries transient server errors."""
+        session = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.2, status_forcelist=(429, 500, 502, 503, 504))
+        session.mount(
+            "https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries)
+        )
+        session.headers.update({"Accept-Encoding": "gzip", "User-Agent": "kicad-mcp/1.0"})
+        return session
+
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        self.session.close()
 
     def search_components(
         self,
@@ -41,6 +123,28 @@ class JLCSearchClient:
             offset: Offset for pagination
             **filters: Additional filters (e.g., package="0603", resistance=1000)
 
+        Returns:
+            List of component dicts
+        """
+        return self._search(self.session, category, limit, offset, filters)
+
+    def _search(
+        self,
+        session: requests.Session,
+        category: str,
+        limit: int,
+        offset: int,
+        filters: dict[str, str | int | bool],
+    ) -> list[dict[str, Any]]:
+        """Fetch one page of a category listing through the given session.
+
+        Args:
+            session: Session owned by the calling thread
+            category: Component category
+            limit: Maximum number of results
+            offset: Offset for pagination
+            filters: Additional query filters
+
         Returns:
             List of component dicts
         """
@@ -49,7 +153,7 @@ class JLCSearchClient:
         params = {"limit": limit, "offset": offset, **filters}
 
         try:
-            response = requests.get(url, params=params, timeout=30)
+            response = session.get(url, params=params, timeout=30)
             response.raise_for_status()
             data = response.json()
 
@@ -140,6 +244,9 @@ class JLCSearchClient:
     ) -> list[dict]:
         """Download all components from jlcsearch database.
 
+        Holds the whole catalog in memory; prefer iter_all_components to
+        stream parts into the database.
+
         Args:
             callback: Optional progress callback function(parts_count, status_msg)
             batch_size: Number of parts per batch
@@ -147,42 +254,86 @@ class JLCSearchClient:
         Returns:
             List of all parts
         """
-        all_parts = []
-        offset = 0
+        return list(self.iter_all_components(callback, batch_size))
 
-        logger.info("Starting full jlcsearch parts database download...")
+    def iter_all_components(
+        self,
+        callback: Callable[[int, str], None] | None = None,
+        batch_size: int = 1000,
+        max_workers: int = 4,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream all components from the jlcsearch database, one part at a time.
+
+        Up to ``max_workers`` pages are requested ahead of the consumer so
+        network round-trips overlap, while parts are still yielded in catalog
+        order and the overall request rate stays capped. requests.Session is
+        not thread-safe, so each worker thread fetches through its own
+        session. Pages still queued are cancelled once the stream ends, fails
+        or is closed by the consumer.
+
+        Args:
+            callback: Optional progress callback function(parts_count, status_msg)
+            batch_size: Number of parts per batch
+            max_workers: Maximum number of page requests in flight
 
-        while True:
-            try:
-                batch = self.search_components("components", limit=batch_size, offset=offset)
+        Yields:
+            Part dicts in catalog order
 
-                if not batch:
-                    break
+        Raises:
+            Exception: If the very first batch cannot be downloaded. Later
+                failures end the stream early with a warning instead.
+        """
+        # Rate limiting - be nice to the API
+        limiter = _RateLimiter(_MIN_REQUEST_INTERVAL)
+
+        sessions = _ThreadSessions(self._new_session)
+
+        def fetch(page_offset: int) -> list[dict[str, Any]]:
+            limiter.wait()
+            return self._search(sessions.get(), "components", batch_size, page_offset, {})
+
+        offset = 0
+
+        logger.info("Starting full jlcsearch parts database download...")
 
-                all_parts.extend(batch)
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+        pending = deque(pool.submit(fetch, i * batch_size) for i in range(max_workers))
+        next_offset = max_workers * batch_size
+        try:
+            while pending:
+                try:
+                    batch = pending.popleft().result()
+                except Exception:
+                    logger.exception("Error downloading parts at offset %d", offset)
+                    if offset > 0:
+                        logger.warning("Partial download available: %d parts", offset)
+                        return
+                    raise
+
+                yield from batch
                 offset += len(batch)
 
-                if callback:
-                    callback(len(all_parts), f"Downloaded {len(all_parts)} parts...")
-                else:
-                    logger.info("Downloaded %d parts so far...", len(all_parts))
+                if batch:
+                    if callback:
+                        callback(offset, f"Downloaded {offset} parts...")
+                    else:
+                        logger.info("Downloaded %d parts so far...", offset)
 
                 # If we got fewer results than requested, we've reached the end
                 if len(batch) < batch_size:
                     break
 
-                # Rate limiting - be nice to the API
-                time.sleep(0.1)
-
-            except Exception:
-                logger.exception("Error downloading parts at offset %d", offset)
-                if len(all_parts) > 0:
-                    logger.warning("Partial download available: %d parts", len(all_parts))
-                    return all_parts
-                raise
-
-        logger.info("Download complete: %d parts retrieved", len(all_parts))
-        return all_parts
+                pending.append(pool.submit(fetch, next_offset))
+                next_offset += batch_size
+        finally:
+            # Also reached when the consumer stops early: drop queued pages and
+            # let the ones already running finish before closing their sessions
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=True, cancel_futures=True)
+            sessions.close()
+
+        logger.info("Download complete: %d parts retrieved", offset)
 
 
 def test_jlcsearch_connection() -> bool:
@@ -6,15 +6,123 @@ and providing search functionality for component placement.
 
 from __future__ import annotations
 
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import json
 import logging
 import os
 from pathlib import Path
 import re
-from typing import Any
+import threading
+from typing import TYPE_CHECKING, Any
+import weakref
+
+from utils.platform_helper import PlatformHelper
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 logger = logging.getLogger("kicad_interface")
 
+_FOOTPRINT_SUFFIX = ".kicad_mod"
+
+# On-disk footprint listings and parsed lib-table entries, reused across runs
+# while a library's mtime (or a table's mtime and size) is unchanged
+_FOOTPRINT_INDEX_FILE = "footprint_index.json"
+_FOOTPRINT_INDEX_VERSION = 2
+
+# library path -> (directory mtime_ns, footprint names)
+_LibraryIndex = dict[str, tuple[int, list[str]]]
+# table path -> (mtime_ns, size, [(nickname, unresolved uri)])
+_TableIndex = dict[str, tuple[int, int, list[tuple[str, str]]]]
+
+# Directory scans are I/O bound, so warm the cache with more threads than cores
+_WARM_CACHE_WORKERS = 16
+
+# ${VAR} or $VAR reference inside a library URI
+_ENV_VAR_RE = re.compile(r"\$\{(\w+)\}|\$(\w+)")
+
+# One S-expression token: a paren, a double-quoted string or a bare atom.
+# Alternatives never overlap, so matching is a single linear scan.
+_SEXP_TOKEN_RE = re.compile(r'[()]|"((?:[^"\\]|\\.)*)"|[^\s()"]+')
+_SEXP_ESCAPE_RE = re.compile(r"\\(.)")
+
+# Depth of the (lib ...) lists inside the root (fp_lib_table ...) list
+_LIB_DEPTH = 2
+
+
+@lru_cache(maxsize=64)
+def _compile_search_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a footprint search pattern, cached for repeated searches.
+
+    Args:
+        pattern: Search pattern where * matches any run of characters.
+
+    Returns:
+        Case-insensitive regex matching the pattern anywhere in a name.
+    """
+    # Convert wildcards to regex, escaping everything else literally.
+    # IGNORECASE avoids lowercasing every candidate name.
+    regex_pattern = ".*".join(re.escape(part) for part in pattern.split("*"))
+    return re.compile(regex_pattern, re.IGNORECASE)
+
+
+def _sexp_atom(match: re.Match[str]) -> str:
+    """Return the value of an atom token, unquoting and unescaping strings."""
+    quoted = match.group(1)
+    if quoted is None:
+        return match.group()
+    if "\\" in quoted:
+        return _SEXP_ESCAPE_RE.sub(r"\1", quoted)
+    return quoted
+
+
+def _iter_lib_entries(content: str) -> Iterator[tuple[str, str]]:
+    """Yield (name, uri) for each (lib ...) entry of a lib-table.
+
+    Tokenizes the text in one pass and tracks list depth, so the child fields
+    of a lib entry may appear in any order and quoted values may contain
+    spaces, parentheses or escaped quotes.
+
+    Args:
+        content: Contents of an fp-lib-table file.
+
+    Yields:
+        Tuples of (library nickname, unresolved URI).
+    """
+    depth = 0
+    in_lib = False  # Inside a (lib ...) list
+    fields: dict[str, str] = {}
+    field: str | None = None  # Field whose value is expected next
+    expect_head = False  # Next atom names the list just opened
+
+    for match in _SEXP_TOKEN_RE.finditer(content):
+        text = match.group()
+        if text == "(":
+            depth += 1
+            expect_head = True
+            field = None
+            continue
+        if text == ")":
+            if in_lib and depth == _LIB_DEPTH and "name" in fields and "uri" in fields:
+                yield fields["name"], fields["uri"]
+            depth -= 1
+            field = None
+            continue
+
+        atom = _sexp_atom(match)
+        if expect_head:
+            expect_head = False
+            if depth == _LIB_DEPTH:
+                in_lib = atom.lower() == "lib"
+                fields = {}
+            elif in_lib and depth == _LIB_DEPTH + 1:
+                field = atom.lower()
+        elif field is not None:
+            fields.setdefault(field, atom)
+            field = None
+
 
 class LibraryManager:
     """Manages KiCAD footprint libraries.
@@ -23,19 +131,74 @@ class LibraryManager:
     indexes available footprints, and provides search functionality.
     """
 
-    def __init__(self, project_path: Path | None = None) -> None:
+    __slots__ = (
+        "__weakref__",
+        "_cache_lock",
+        "_env_vars",
+        "_footprint_index",
+        "_footprint_owners",
+        "_footprint_sets",
+        "_index_dirty",
+        "_index_path",
+        "_libraries",
+        "_load_lock",
+        "_loaded",
+        "_path_to_nickname",
+        "_table_index",
+        "footprint_cache",
+        "project_path",
+    )
+
+    def __init__(self, project_path: Path | None = None, index_path: Path | None = None) -> None:
         """Initialize library manager.
 
         Args:
             project_path: Optional path to project directory for project-specific libraries
+            index_path: Optional path of the persistent footprint index
+                (default: footprint_index.json in the platform cache directory)
         """
         self.project_path = project_path
-        self.libraries: dict[str, str] = {}  # nickname -> path mapping
+        self._libraries: dict[str, str] = {}  # nickname -> path mapping
+        self._path_to_nickname: dict[str, str] = {}  # path -> first nickname using it
         self.footprint_cache: dict[str, list[str]] = {}  # library -> [footprint names]
-        self._load_libraries()
+        self._footprint_sets: dict[str, frozenset[str]] = {}  # library -> footprint names
+        # footprint name -> first library containing it, built on first unqualified lookup
+        self._footprint_owners: dict[str, str] | None = None
+        self._env_vars: dict[str, str] = {}  # variable name -> value
+        self._cache_lock = threading.Lock()  # Guards footprint cache/index updates
+
+        self._index_path = index_path or PlatformHelper.get_cache_dir() / _FOOTPRINT_INDEX_FILE
+        self._footprint_index: _LibraryIndex = {}
+        self._table_index: _TableIndex = {}
+        self._index_dirty = False
+        _live_managers.add(self)
+
+        # Library tables and the footprint index are read on first use
+        self._loaded = False
+        self._load_lock = threading.Lock()
+
+    @property
+    def libraries(self) -> dict[str, str]:
+        """Library nickname -> path mapping, loading the lib tables on first access."""
+        self._ensure_loaded()
+        return self._libraries
+
+    def _ensure_loaded(self) -> None:
+        """Load the library tables and footprint index once."""
+        if self._loaded:
+            return
+        with self._load_lock:
+            if self._loaded:
+                return
+            self._footprint_index, self._table_index = self._load_footprint_index()
+            self._load_libraries()
+            self._loaded = True
 
     def _load_libraries(self) -> None:
         """Load libraries from fp-lib-table files."""
+        # Probe the KiCAD install directories once for every URI in the tables
+        self._env_vars = self._build_env_vars()
+
         # Load global libraries
         global_table = self._get_global_fp_lib_table()
         if global_table and global_table.exists():
@@ -51,7 +214,7 @@ class LibraryManager:
                 logger.info("Loading project fp-lib-table from: %s", project_table)
                 self._parse_fp_lib_table(project_table)
 
-        logger.info("Loaded %d footprint libraries", len(self.libraries))
+        logger.info("Loaded %d footprint libraries", len(self._libraries))
 
     def _get_global_fp_lib_table(self) -> Path | None:
         """Get path to global fp-lib-table file."""
@@ -87,23 +250,17 @@ class LibraryManager:
             table_path: Path to the fp-lib-table file.
         """
         try:
-            content = table_path.read_text()
-
-            # Simple regex-based parser for lib entries
-            # Pattern: (lib (name "NAME")(type TYPE)(uri "URI")...)
-            lib_pattern = (
-                r'\(lib\s+\(name\s+"?([^")\s]+)"?\)\s*\(type\s+[^)]+\)\s*\(uri\s+"?([^")\s]+)"?'
-            )
-
-            for match in re.finditer(lib_pattern, content, re.IGNORECASE):
-                nickname = match.group(1)
-                uri = match.group(2)
-
+            for nickname, uri in self._read_lib_table_entries(table_path):
                 # Resolve environment variables in URI
                 resolved_uri = self._resolve_uri(uri)
 
                 if resolved_uri:
-                    self.libraries[nickname] = resolved_uri
+                    # A project table may override a global nickname with a new path
+                    previous = self._libraries.get(nickname)
+                    if previous and self._path_to_nickname.get(previous) == nickname:
+                        del self._path_to_nickname[previous]
+                    self._libraries[nickname] = resolved_uri
+                    self._path_to_nickname.setdefault(resolved_uri, nickname)
                     logger.debug("  Found library: %s -> %s", nickname, resolved_uri)
                 else:
                     logger.warning("  Could not resolve URI for library %s: %s", nickname, uri)
@@ -111,6 +268,66 @@ class LibraryManager:
         except OSError:
             logger.exception("Error parsing fp-lib-table at %s", table_path)
 
+    def _read_lib_table_entries(self, table_path: Path) -> list[tuple[str, str]]:
+        """Get the (nickname, uri) entries of a lib-table, reusing the persisted parse.
+
+        Args:
+            table_path: Path to the fp-lib-table file.
+
+        Returns:
+            List of (library nickname, unresolved URI) tuples.
+
+        Raises:
+            OSError: If the table cannot be read.
+        """
+        stat = table_path.stat()
+        key = str(table_path)
+        indexed = self._table_index.get(key)
+        if indexed and indexed[:2] == (stat.st_mtime_ns, stat.st_size):
+            return indexed[2]
+
+        data = table_path.read_bytes()
+        # KiCAD writes entries as "(lib ..."; skip tokenizing tables without any
+        if b"(lib" in data:
+            entries = list(_iter_lib_entries(data.decode("utf-8", errors="replace")))
+        else:
+            logger.debug("No library entries in %s", table_path)
+            entries = []
+
+        with self._cache_lock:
+            self._table_index[key] = (stat.st_mtime_ns, stat.st_size, entries)
+            self._index_dirty = True
+        return entries
+
+    def _build_env_vars(self) -> dict[str, str]:
+        """Build the environment variables used when resolving library URIs.
+
+        Returns:
+            Dict of variable name -> value, limited to variables that resolved.
+        """
+        footprint_dir = self._find_kicad_footprint_dir()
+        thirdparty_dir = self._find_kicad_3rdparty_dir()
+
+        # Common KiCAD environment variables
+        env_vars = {
+            "KICAD9_FOOTPRINT_DIR": footprint_dir,
+            "KICAD8_FOOTPRINT_DIR": footprint_dir,
+            "KICAD_FOOTPRINT_DIR": footprint_dir,
+            "KISYSMOD": footprint_dir,
+            "KICAD9_3RD_PARTY": thirdparty_dir,
+            "KICAD8_3RD_PARTY": thirdparty_dir,
+        }
+
+        # Project directory
+        if self.project_path:
+            env_vars["KIPRJMOD"] = str(self.project_path)
+
+        return {var: value for var, value in env_vars.items() if value}
+
+    def _substitute_env_var(self, match: re.Match[str]) -> str:
+        """Return the value for a ${VAR}/$VAR match, leaving unknown variables as-is."""
+        return self._env_vars.get(match.group(1) or match.group(2), match.group(0))
+
     def _resolve_uri(self, uri: str) -> str | None:
         """Resolve environment variables and paths in library URI.
 
@@ -127,28 +344,8 @@ class LibraryManager:
         Returns:
             Resolved path string or None if path doesn't exist.
         """
-        # Replace environment variables
-        resolved = uri
-
-        # Common KiCAD environment variables
-        env_vars = {
-            "KICAD9_FOOTPRINT_DIR": self._find_kicad_footprint_dir(),
-            "KICAD8_FOOTPRINT_DIR": self._find_kicad_footprint_dir(),
-            "KICAD_FOOTPRINT_DIR": self._find_kicad_footprint_dir(),
-            "KISYSMOD": self._find_kicad_footprint_dir(),
-            "KICAD9_3RD_PARTY": self._find_kicad_3rdparty_dir(),
-            "KICAD8_3RD_PARTY": self._find_kicad_3rdparty_dir(),
-        }
-
-        # Project directory
-        if self.project_path:
-            env_vars["KIPRJMOD"] = str(self.project_path)
-
-        # Replace environment variables
-        for var, value in env_vars.items():
-            if value:
-                resolved = resolved.replace(f"${{{var}}}", value)
-                resolved = resolved.replace(f"${var}", value)
+        # Replace environment variables in a single pass
+        resolved = _ENV_VAR_RE.sub(self._substitute_env_var, uri)
 
         # Expand ~ to home directory
         resolved = os.path.expanduser(resolved)  # noqa: PTH111
@@ -225,36 +422,59 @@ class LibraryManager:
 
         version = "9.0"  # Default version
         for config_path in kicad_common_paths:
-            if config_path.exists():
-                config_version = self._try_load_3rdparty_from_config(config_path)
-                if config_version:
-                    return config_version
+            # Open directly instead of probing with exists() first
+            config_data = self._read_config_file(config_path)
+            if config_data is None:
+                continue
+
+            config_version = self._try_load_3rdparty_from_config(config_data)
+            if config_version:
+                return config_version
 
-                # Derive version from config path location
-                version = config_path.parent.name  # e.g., "9.0"
-                break
+            # Derive version from config path location
+            version = config_path.parent.name  # e.g., "9.0"
+            break
 
         # 3. Use platform-specific defaults
         return self._find_3rdparty_default_path(version)
 
-    def _try_load_3rdparty_from_config(self, config_path: Path) -> str | None:
+    @staticmethod
+    def _read_config_file(config_path: Path) -> bytes | None:
+        """Read a KiCAD config file.
+
+        Args:
+            config_path: Path to the config file.
+
+        Returns:
+            File contents, or None if the file does not exist.
+        """
+        try:
+            return config_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            # Present but unreadable: treat like an empty config
+            logger.debug("Could not read %s: %s", config_path, e)
+            return b""
+
+    def _try_load_3rdparty_from_config(self, config_data: bytes) -> str | None:
         """Try to load KICAD9_3RD_PARTY from kicad_common.json config.
 
         Args:
-            config_path: Path to the kicad_common.json file.
+            config_data: Raw contents of the kicad_common.json file.
 
         Returns:
             Path to the 3rd party directory or None if not found.
         """
         try:
-            config = json.loads(config_path.read_text())
+            config = json.loads(config_data)
             env_vars = config.get("environment", {}).get("vars", {})
             if env_vars and "KICAD9_3RD_PARTY" in env_vars:
                 config_3rd_party = Path(env_vars["KICAD9_3RD_PARTY"])
                 if config_3rd_party.is_dir():
                     return str(config_3rd_party)
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
-            # Expected: config file may not exist, be invalid, or missing keys
+        except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError) as e:
+            # Expected: config file may be empty, invalid, or missing keys
             logger.debug("Could not load KICAD9_3RD_PARTY from config: %s", e)
         return None
 
@@ -292,6 +512,18 @@ class LibraryManager:
         """
         return list(self.libraries.keys())
 
+    def get_library_nickname(self, library_path: str) -> str | None:
+        """Get the library nickname for a filesystem path.
+
+        Args:
+            library_path: The filesystem path of the library.
+
+        Returns:
+            The library nickname or None if not found.
+        """
+        self._ensure_loaded()
+        return self._path_to_nickname.get(library_path)
+
     def get_library_path(self, nickname: str) -> str | None:
         """Get filesystem path for a library nickname.
 
@@ -322,13 +554,28 @@ class LibraryManager:
             return []
 
         try:
-            lib_dir = Path(library_path)
-
-            # List all .kicad_mod files
-            footprints = [fp_file.stem for fp_file in lib_dir.glob("*.kicad_mod")]
+            # Reuse the persisted listing while the directory is unchanged
+            mtime_ns = Path(library_path).stat().st_mtime_ns
+            indexed = self._footprint_index.get(library_path)
+            if indexed and indexed[0] == mtime_ns:
+                footprints = list(indexed[1])
+            else:
+                # List all .kicad_mod files
+                suffix_len = len(_FOOTPRINT_SUFFIX)
+                with os.scandir(library_path) as entries:
+                    footprints = [
+                        entry.name[:-suffix_len]
+                        for entry in entries
+                        if entry.name.endswith(_FOOTPRINT_SUFFIX)
+                    ]
+                with self._cache_lock:
+                    self._footprint_index[library_path] = (mtime_ns, footprints)
+                    self._index_dirty = True
 
             # Cache the results
-            self.footprint_cache[library_nickname] = footprints
+            with self._cache_lock:
+                self.footprint_cache[library_nickname] = footprints
+                self._footprint_sets[library_nickname] = frozenset(footprints)
             logger.debug("Found %d footprints in %s", len(footprints), library_nickname)
 
             return footprints
@@ -337,6 +584,122 @@ class LibraryManager:
             logger.exception("Error listing footprints in %s", library_nickname)
             return []
 
+    def _load_footprint_index(self) -> tuple[_LibraryIndex, _TableIndex]:
+        """Load the persistent footprint index.
+
+        Returns:
+            Tuple of (library path -> (directory mtime_ns, footprint names),
+            table path -> (mtime_ns, size, lib entries)). Both are empty if the
+            index is missing, unreadable or from another format version.
+        """
+        try:
+            data = json.loads(self._index_path.read_text())
+            if data.get("version") != _FOOTPRINT_INDEX_VERSION:
+                return {}, {}
+            libraries = {
+                path: (int(mtime_ns), list(names))
+                for path, (mtime_ns, names) in data["libraries"].items()
+            }
+            tables = {
+                path: (int(mtime_ns), int(size), [(name, uri) for name, uri in entries])
+                for path, (mtime_ns, size, entries) in data["tables"].items()
+            }
+        except FileNotFoundError:
+            return {}, {}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug("Ignoring unreadable footprint index %s: %s", self._index_path, e)
+            return {}, {}
+        return libraries, tables
+
+    def save_footprint_index(self) -> None:
+        """Write the footprint index to disk if any library or table was rescanned.
+
+        Entries already on disk are merged in, keeping whichever entry was
+        recorded for the newer mtime, so managers sharing the index file do
+        not drop each other's rescans. Called for every live manager at exit;
+        safe to call more than once.
+        """
+        if not self._index_dirty:
+            return
+
+        disk_libraries, disk_tables = self._load_footprint_index()
+        with self._cache_lock:
+            libraries = {**disk_libraries}
+            for path, entry in self._footprint_index.items():
+                if path not in libraries or libraries[path][0] <= entry[0]:
+                    libraries[path] = entry
+            tables = {**disk_tables}
+            for path, table_entry in self._table_index.items():
+                if path not in tables or tables[path][0] <= table_entry[0]:
+                    tables[path] = table_entry
+        data = {
+            "version": _FOOTPRINT_INDEX_VERSION,
+            "libraries": {path: [mtime_ns, names] for path, (mtime_ns, names) in libraries.items()},
+            "tables": {
+                path: [mtime_ns, size, entries]
+                for path, (mtime_ns, size, entries) in tables.items()
+            },
+        }
+        try:
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so a concurrent reader never sees a partial file
+            tmp_path = self._index_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data))
+            tmp_path.replace(self._index_path)
+            self._index_dirty = False
+        except OSError as e:
+            logger.warning("Could not save footprint index to %s: %s", self._index_path, e)
+
+    def _warm_cache(self, nicknames: list[str] | None = None) -> None:
+        """List every library not cached yet, scanning directories in parallel.
+
+        Args:
+            nicknames: Libraries to list (default: all libraries)
+        """
+        if nicknames is None:
+            nicknames = list(self.libraries)
+        pending = [nick for nick in nicknames if nick not in self.footprint_cache]
+        if len(pending) < 2:  # noqa: PLR2004
+            # Not worth a thread pool
+            for nick in pending:
+                self.list_footprints(nick)
+            return
+
+        workers = min(_WARM_CACHE_WORKERS, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consume the iterator so every scan finishes before returning
+            for _ in executor.map(self.list_footprints, pending):
+                pass
+
+    def _has_footprint(self, library_nickname: str, footprint_name: str) -> bool:
+        """Check footprint membership against the cached library listing.
+
+        A name missing from the listing is checked on disk, since the footprint
+        may have been added after the library was listed; the stale listing is
+        then dropped so the next lookup rescans the library.
+
+        Args:
+            library_nickname: Library name.
+            footprint_name: Footprint name without extension.
+
+        Returns:
+            True if the library contains the footprint.
+        """
+        if library_nickname not in self._footprint_sets:
+            self.list_footprints(library_nickname)
+        if footprint_name in self._footprint_sets.get(library_nickname, ()):
+            return True
+
+        library_path = self.libraries.get(library_nickname)
+        file_name = f"{footprint_name}{_FOOTPRINT_SUFFIX}"
+        if not library_path or not Path(library_path, file_name).exists():
+            return False
+        with self._cache_lock:
+            self.footprint_cache.pop(library_nickname, None)
+            self._footprint_sets.pop(library_nickname, None)
+        self._footprint_owners = None
+        return True
+
     def find_footprint(self, footprint_spec: str) -> tuple[str, str] | None:
         """Find a footprint by specification.
 
@@ -372,27 +735,89 @@ class LibraryManager:
             return None
 
         # Check if footprint exists
-        fp_file = Path(library_path) / f"{footprint_name}.kicad_mod"
-        if fp_file.exists():
+        if self._has_footprint(library_nickname, footprint_name):
             return (library_path, footprint_name)
         logger.warning("Footprint not found: %s", footprint_spec)
         return None
 
+    def _get_footprint_owners(self) -> dict[str, str]:
+        """Map every footprint name to the first library (in table order) providing it.
+
+        Libraries not listed in this session use their persisted listing as is;
+        only libraries missing from the footprint index are scanned. A lookup
+        that misses (or hits a deleted file) then stats the libraries and
+        relists the changed ones, see _refresh_changed_libraries.
+
+        Returns:
+            Dict of footprint name -> library nickname.
+        """
+        if self._footprint_owners is None:
+            unindexed = [
+                nick for nick, path in self.libraries.items() if path not in self._footprint_index
+            ]
+            self._warm_cache(unindexed)
+            owners: dict[str, str] = {}
+            for library_nickname, library_path in self.libraries.items():
+                footprints = self.footprint_cache.get(library_nickname)
+                if footprints is None:
+                    indexed = self._footprint_index.get(library_path)
+                    footprints = indexed[1] if indexed else []
+                for footprint in footprints:
+                    owners.setdefault(footprint, library_nickname)
+            self._footprint_owners = owners
+        return self._footprint_owners
+
+    def _refresh_changed_libraries(self) -> bool:
+        """Relist libraries whose directory changed since they were listed or indexed.
+
+        Returns:
+            True if any library was relisted (the owner map is then rebuilt).
+        """
+        changed = False
+        for library_nickname, library_path in self.libraries.items():
+            try:
+                mtime_ns = Path(library_path).stat().st_mtime_ns
+            except OSError as e:
+                logger.debug("Cannot stat library %s: %s", library_path, e)
+                continue
+            indexed = self._footprint_index.get(library_path)
+            if indexed is not None and indexed[0] == mtime_ns:
+                continue
+            with self._cache_lock:
+                self.footprint_cache.pop(library_nickname, None)
+                self._footprint_sets.pop(library_nickname, None)
+            self.list_footprints(library_nickname)
+            changed = True
+
+        if changed:
+            self._footprint_owners = None
+        return changed
+
     def _find_footprint_in_all_libraries(self, footprint_name: str) -> tuple[str, str] | None:
         """Find a footprint by searching all libraries.
 
+        The owner map is checked against the filesystem: a hit whose file is
+        gone, or a miss, relists the libraries whose directory changed and
+        looks the name up again.
+
         Args:
             footprint_name: Footprint name to search for.
 
         Returns:
             Tuple of (library_path, footprint_name) or None if not found.
         """
-        # Search in all libraries
-        for library_nickname, library_path in self.libraries.items():
-            fp_file = Path(library_path) / f"{footprint_name}.kicad_mod"
-            if fp_file.exists():
-                logger.info("Found footprint %s in library %s", footprint_name, library_nickname)
-                return (library_path, footprint_name)
+        file_name = f"{footprint_name}{_FOOTPRINT_SUFFIX}"
+        library_nickname = self._get_footprint_owners().get(footprint_name)
+        stale = (
+            library_nickname is None
+            or not (Path(self.libraries[library_nickname]) / file_name).exists()
+        )
+        if stale and self._refresh_changed_libraries():
+            library_nickname = self._get_footprint_owners().get(footprint_name)
+
+        if library_nickname:
+            logger.info("Found footprint %s in library %s", footprint_name, library_nickname)
+            return (self.libraries[library_nickname], footprint_name)
 
         logger.warning("Footprint not found in any library: %s", footprint_name)
         return None
@@ -410,27 +835,25 @@ class LibraryManager:
             List of dicts with 'library', 'footprint', and 'full_name' keys
         """
         results: list[dict[str, str]] = []
-        pattern_lower = pattern.lower()
+        regex = _compile_search_pattern(pattern)
 
-        # Convert wildcards to regex
-        regex_pattern = pattern_lower.replace("*", ".*")
-        regex = re.compile(regex_pattern)
+        # Scan uncached libraries concurrently rather than one by one below
+        self._warm_cache()
 
         for library_nickname in self.libraries:
             footprints = self.list_footprints(library_nickname)
 
-            for footprint in footprints:
-                if regex.search(footprint.lower()):
-                    results.append(
-                        {
-                            "library": library_nickname,
-                            "footprint": footprint,
-                            "full_name": f"{library_nickname}:{footprint}",
-                        }
-                    )
+            for footprint in filter(regex.search, footprints):
+                results.append(
+                    {
+                        "library": library_nickname,
+                        "footprint": footprint,
+                        "full_name": f"{library_nickname}:{footprint}",
+                    }
+                )
 
-                    if len(results) >= limit:
-                        return results
+                if len(results) >= limit:
+                    return results
 
         return results
 
@@ -463,6 +886,17 @@ class LibraryManager:
         }
 
 
+# Managers whose footprint index is saved at exit
+_live_managers: weakref.WeakSet[LibraryManager] = weakref.WeakSet()
+
+
+@atexit.register
+def _save_footprint_indexes() -> None:
+    """Save the footprint index of every manager still alive at exit."""
+    for manager in list(_live_managers):
+        manager.save_footprint_index()
+
+
 class LibraryCommands:
     """Command handlers for library operations."""
 
@@ -602,7 +1036,4 @@ class LibraryCommands:
         Returns:
             The library nickname or None if not found.
         """
-        for nick, path in self.library_manager.libraries.items():
-            if path == library_path:
-                return nick
-        return None
+        return self.library_manager.get_library_nickname(library_path)
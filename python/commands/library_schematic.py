@@ -4,8 +4,140 @@ This module provides functionality to discover, search, and manage
 KiCAD symbol libraries for schematic design.
 """
 
+from __future__ import annotations
+
+import contextlib
+import fnmatch
+from functools import lru_cache
+import os
 from pathlib import Path
-from typing import Any
+import re
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_GLOB_CHARS = "*?["
+
+# Common mappings from component type to library/symbol
+_COMMON_MAPPINGS: dict[str, dict[str, str]] = {
+    "resistor": {"library": "Device", "symbol": "R"},
+    "capacitor": {"library": "Device", "symbol": "C"},
+    "inductor": {"library": "Device", "symbol": "L"},
+    "diode": {"library": "Device", "symbol": "D"},
+    "led": {"library": "Device", "symbol": "LED"},
+    "transistor_npn": {"library": "Device", "symbol": "Q_NPN_BCE"},
+    "transistor_pnp": {"library": "Device", "symbol": "Q_PNP_BCE"},
+    "opamp": {"library": "Amplifier_Operational", "symbol": "OpAmp_Dual_Generic"},
+    "microcontroller": {"library": "MCU_Module", "symbol": "Arduino_UNO_R3"},
+}
+_DEFAULT_MAPPING_KEY = "resistor"
+
+
+@lru_cache(maxsize=128)
+def _mapping_key_for_component_type(component_type_lower: str) -> str:
+    """Resolve a lowercased component type to a _COMMON_MAPPINGS key."""
+    # Try direct match first
+    if component_type_lower in _COMMON_MAPPINGS:
+        return component_type_lower
+
+    # Try partial matches
+    for key in _COMMON_MAPPINGS:
+        if component_type_lower in key or key in component_type_lower:
+            return key
+
+    # Default fallback
+    return _DEFAULT_MAPPING_KEY
+
+
+def _split_glob_pattern(path_pattern: str) -> tuple[str, tuple[str, ...]]:
+    """Split a glob pattern into its literal root directory and remaining segments.
+
+    Args:
+        path_pattern: Glob pattern such as "/usr/share/kicad/symbols/*.kicad_sym".
+
+    Returns:
+        Tuple of (root directory, "" for the current directory, and the path
+        segments after it).
+    """
+    # Find the root directory (everything before the first wildcard)
+    wildcard_pos = next(
+        (i for i, c in enumerate(path_pattern) if c in _GLOB_CHARS),
+        len(path_pattern),
+    )
+    root_str = path_pattern[:wildcard_pos]
+    # Find the last directory separator
+    sep_pos = max(root_str.rfind("/"), root_str.rfind("\\"))
+
+    if sep_pos > 0:
+        root = path_pattern[:sep_pos]
+        pattern = path_pattern[sep_pos + 1 :]
+    elif path_pattern.startswith("/"):
+        root = "/"
+        pattern = path_pattern[1:]
+    else:
+        root = ""
+        pattern = path_pattern
+
+    return root, tuple(segment for segment in re.split(r"[/\\]", pattern) if segment)
+
+
+def _segment_matcher(segment: str) -> Callable[[str], object]:
+    """Build a name predicate for one wildcard path segment.
+
+    The common "*" and "*.ext" forms avoid fnmatch entirely.
+    """
+    if segment == "*":
+        return lambda _name: True
+    suffix = segment[1:]
+    if segment.startswith("*") and not any(c in suffix for c in _GLOB_CHARS):
+        return lambda name: name.endswith(suffix)
+    return re.compile(fnmatch.translate(segment)).match
+
+
+def _glob_paths(root: str, segments: tuple[str, ...]) -> list[str]:
+    """Expand glob segments below root, scanning one directory level at a time.
+
+    A "**" segment spans any number of directories, so those patterns are
+    handed to Path.glob instead.
+
+    Args:
+        root: Literal root directory ("" for the current directory).
+        segments: Path segments, the last of which must match files.
+
+    Returns:
+        Matching file paths.
+    """
+    if "**" in segments:
+        return [str(path) for path in Path(root).glob("/".join(segments)) if path.is_file()]
+
+    current = [root]
+    last = len(segments) - 1
+    for depth, segment in enumerate(segments):
+        want_file = depth == last
+        matched: list[str] = []
+
+        if not any(c in segment for c in _GLOB_CHARS):
+            for directory in current:
+                candidate = os.path.join(directory, segment)  # noqa: PTH118
+                if not want_file or Path(candidate).is_file():
+                    matched.append(candidate)
+        else:
+            matches = _segment_matcher(segment)
+            for directory in current:
+                # Missing or unreadable directory: nothing to match there
+                with contextlib.suppress(OSError), os.scandir(directory or ".") as entries:
+                    matched.extend(
+                        os.path.join(directory, entry.name)  # noqa: PTH118
+                        for entry in entries
+                        if matches(entry.name)
+                        and (entry.is_file() if want_file else entry.is_dir())
+                    )
+
+        current = matched
+        if not current:
+            break
+    return current
 
 
 class LibraryManager:
@@ -34,30 +166,13 @@ class LibraryManager:
                 str(Path("~/Documents/KiCad/*/symbols/*.kicad_sym").expanduser()),  # User libs
             ]
 
-        libraries: list[str] = []
+        # dict keeps discovery order while dropping libraries matched by several patterns
+        found: dict[str, None] = {}
         for path_pattern in search_paths:
-            # Find the root directory (everything before the first wildcard)
-            wildcard_pos = next(
-                (i for i, c in enumerate(path_pattern) if c in "*?["),
-                len(path_pattern),
-            )
-            root_str = path_pattern[:wildcard_pos]
-            # Find the last directory separator
-            sep_pos = max(root_str.rfind("/"), root_str.rfind("\\"))
-
-            if sep_pos > 0:
-                root = Path(root_str[:sep_pos])
-                pattern = path_pattern[sep_pos + 1 :]
-            elif path_pattern.startswith("/"):
-                root = Path("/")
-                pattern = path_pattern[1:]
-            else:
-                root = Path()
-                pattern = path_pattern
-
-            # Use Path.glob to find all matching files
-            matching_libs = [str(p) for p in root.glob(pattern)]
-            libraries.extend(matching_libs)
+            root, segments = _split_glob_pattern(path_pattern)
+            if segments:
+                found.update(dict.fromkeys(_glob_paths(root, segments)))
+        libraries = list(found)
 
         # Extract library names from paths
         library_names = [Path(lib).stem for lib in libraries]
@@ -145,33 +260,9 @@ class LibraryManager:
         Returns:
             Dictionary with 'library' and 'symbol' keys for the recommended symbol.
         """
-        # Define common mappings from component type to library/symbol
-        common_mappings = {
-            "resistor": {"library": "Device", "symbol": "R"},
-            "capacitor": {"library": "Device", "symbol": "C"},
-            "inductor": {"library": "Device", "symbol": "L"},
-            "diode": {"library": "Device", "symbol": "D"},
-            "led": {"library": "Device", "symbol": "LED"},
-            "transistor_npn": {"library": "Device", "symbol": "Q_NPN_BCE"},
-            "transistor_pnp": {"library": "Device", "symbol": "Q_PNP_BCE"},
-            "opamp": {"library": "Amplifier_Operational", "symbol": "OpAmp_Dual_Generic"},
-            "microcontroller": {"library": "MCU_Module", "symbol": "Arduino_UNO_R3"},
-        }
-
-        # Normalize input to lowercase
-        component_type_lower = component_type.lower()
-
-        # Try direct match first
-        if component_type_lower in common_mappings:
-            return common_mappings[component_type_lower]
-
-        # Try partial matches
-        for key, value in common_mappings.items():
-            if component_type_lower in key or key in component_type_lower:
-                return value
-
-        # Default fallback
-        return {"library": "Device", "symbol": "R"}
+        key = _mapping_key_for_component_type(component_type.lower())
+        # Copy so callers can't modify the shared mapping
+        return dict(_COMMON_MAPPINGS[key])
 
 
 if __name__ == "__main__":
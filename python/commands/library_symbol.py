@@ -4,12 +4,26 @@ Handles parsing sym-lib-table files, discovering symbols,
 and providing search functionality for component selection.
 """
 
-from dataclasses import asdict, dataclass
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+import heapq
 import logging
+import mmap
+from operator import itemgetter
 import os
 from pathlib import Path
 import re
-from typing import Any
+import sqlite3
+import threading
+from typing import TYPE_CHECKING, Any
+
+from utils.platform_helper import PlatformHelper
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
 
 logger = logging.getLogger("kicad_interface")
 
@@ -27,8 +41,158 @@ _SCORE_CATEGORY_MATCH = 20
 # Library testing/demo iteration limit
 LIBRARY_TEST_LIMIT = 10
 
+# Persistent cache of parsed symbols, keyed by library file path, mtime and size
+_SYMBOL_INDEX_FILE = "symbol_index.sqlite"
+_INDEXED_FIELDS = (
+    "name",
+    "value",
+    "description",
+    "footprint",
+    "lcsc_id",
+    "manufacturer",
+    "mpn",
+    "category",
+    "datasheet",
+    "stock",
+    "price",
+    "lib_class",
+)
+_SYMBOL_INDEX_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS libraries (
+        lib_path TEXT PRIMARY KEY,
+        mtime_ns INTEGER NOT NULL,
+        size INTEGER NOT NULL
+    )
+    """,
+    f"""
+    CREATE TABLE IF NOT EXISTS symbols (
+        lib_path TEXT NOT NULL,
+        seq INTEGER NOT NULL,
+        {", ".join(f"{field} TEXT NOT NULL" for field in _INDEXED_FIELDS)},
+        PRIMARY KEY (lib_path, seq)
+    ) WITHOUT ROWID
+    """,
+)
+_SELECT_INDEXED_SYMBOLS = (
+    f"SELECT {', '.join(_INDEXED_FIELDS)} FROM symbols WHERE lib_path = ? ORDER BY seq"  # noqa: S608
+)
+_INSERT_INDEXED_SYMBOL = (
+    f"INSERT INTO symbols (lib_path, seq, {', '.join(_INDEXED_FIELDS)}) "  # noqa: S608
+    f"VALUES (?, ?, {', '.join('?' for _ in _INDEXED_FIELDS)})"
+)
+
+# (lib (name "NAME")(type TYPE)(uri "URI")...) entry of a sym-lib-table
+_LIB_RE = re.compile(
+    r'\(lib\s+\(name\s+"?([^")\s]+)"?\)\s*\(type\s+[^)]+\)\s*\(uri\s+"?([^")\s]+)"?',
+    re.IGNORECASE,
+)
+
+# ${VAR} or $VAR reference in a library URI
+_ENV_VAR_RE = re.compile(r"\$\{(\w+)\}|\$(\w+)")
+
+# Parsed sym-lib-table entries shared by every manager in the process:
+# table path -> (mtime_ns, size, [(nickname, uri)]), re-read once the file changes
+_TABLE_CACHE: dict[str, tuple[int, int, list[tuple[str, str]]]] = {}
+
+# Head of a (symbol "NAME" or (property "KEY" "VALUE" list in a .kicad_sym file,
+# matched against the raw bytes so only the captured strings get decoded
+_SYM_TOKEN_RE = re.compile(
+    rb'\((symbol|property)\s+"([^"\\]*(?:\\.[^"\\]*)*)"(?:\s+"([^"\\]*(?:\\.[^"\\]*)*)")?'
+)
+_SEXP_ESCAPE_RE = re.compile(r"\\(.)")
+
+# Raw property keys kept from a .kicad_sym file -> slot in the extracted values;
+# every other property is skipped without being decoded
+_PROPERTY_SLOTS = {
+    key: slot
+    for slot, key in enumerate(
+        (
+            b"Value",
+            b"Description",
+            b"Footprint",
+            b"LCSC",
+            b"Manufacturer",
+            b"Part",
+            b"MPN",
+            b"Category",
+            b"Datasheet",
+            b"Stock",
+            b"Price",
+            b"Class",
+        )
+    )
+}
+# "Part" stays None when absent so that a present "MPN" can stand in for it
+_PART_SLOT = _PROPERTY_SLOTS[b"Part"]
+_EMPTY_PROPERTIES: tuple[str | None, ...] = tuple(
+    None if slot == _PART_SLOT else "" for slot in range(len(_PROPERTY_SLOTS))
+)
+
+# Length of the substrings keyed by the per-library search index
+_SEARCH_GRAM_SIZE = 3
+
+# Most recent search_symbols/find_symbol results remembered per manager
+_QUERY_CACHE_SIZE = 256
+
+# Lowercased search query shaped like an LCSC part number (e.g. "c25725")
+_LCSC_QUERY_RE = re.compile(r"c\d+")
+
+
+def _unescape(value: bytes) -> str:
+    """Decode a quoted string's contents and remove S-expression backslash escapes."""
+    text = value.decode("utf-8")
+    return _SEXP_ESCAPE_RE.sub(r"\1", text) if "\\" in text else text
+
+
+def _is_unit_of(name: str, parent: str) -> bool:
+    """Check whether name is a unit sub-symbol (PARENT_<unit>_<style>) of parent."""
+    if len(name) <= len(parent) or not name.startswith(parent) or name[len(parent)] != "_":
+        return False
+    unit, sep, style = name[len(parent) + 1 :].partition("_")
+    return bool(sep) and unit.isdigit() and style.isdigit()
+
+
+def _iter_top_level_symbols(
+    content: bytes | mmap.mmap,
+) -> Iterator[tuple[str, list[str | None]]]:
+    """Yield (name, property values) for each top-level symbol of a .kicad_sym file.
+
+    Makes a single pass over the file. KiCAD nests each symbol's units as
+    sub-symbols named PARENT_<unit>_<style>, and properties only appear on
+    the top-level symbol, so properties are attributed to the most recent
+    top-level symbol and unit sub-symbols are skipped.
+
+    Args:
+        content: Raw contents of a .kicad_sym file.
+
+    Yields:
+        Tuples of (symbol name, values of the properties in _PROPERTY_SLOTS
+        order, defaulting to _EMPTY_PROPERTIES).
+    """
+    name: str | None = None
+    values: list[str | None] = []
+
+    for kind, first, second in _SYM_TOKEN_RE.findall(content):
+        if kind == b"property":
+            slot = _PROPERTY_SLOTS.get(first)
+            if slot is not None and name is not None:
+                values[slot] = _unescape(second)
+            continue
+
+        symbol_name = _unescape(first)
+        if name is not None and _is_unit_of(symbol_name, name):
+            continue
+        if name is not None:
+            yield name, values
+        name = symbol_name
+        values = list(_EMPTY_PROPERTIES)
+
+    if name is not None:
+        yield name, values
 
-@dataclass
+
+@dataclass(slots=True)
 class SymbolInfo:
     """Information about a symbol in a library."""
 
@@ -47,6 +211,196 @@ class SymbolInfo:
     price: str = ""  # Price (from JLCPCB libs)
     lib_class: str = ""  # Basic/Preferred/Extended
 
+    def to_dict(self) -> dict[str, str]:
+        """Convert to a flat dict for JSON responses (cheaper than dataclasses.asdict)."""
+        return {
+            "name": self.name,
+            "library": self.library,
+            "full_ref": self.full_ref,
+            "value": self.value,
+            "description": self.description,
+            "footprint": self.footprint,
+            "lcsc_id": self.lcsc_id,
+            "manufacturer": self.manufacturer,
+            "mpn": self.mpn,
+            "category": self.category,
+            "datasheet": self.datasheet,
+            "stock": self.stock,
+            "price": self.price,
+            "lib_class": self.lib_class,
+        }
+
+
+@lru_cache(maxsize=1)
+def _global_sym_lib_table_candidates() -> tuple[Path, ...]:
+    """Get the possible global sym-lib-table locations on this platform, newest KiCAD first."""
+    home = Path.home()
+    linux_paths = (
+        home / ".config" / "kicad" / "9.0" / "sym-lib-table",
+        home / ".config" / "kicad" / "8.0" / "sym-lib-table",
+        home / ".config" / "kicad" / "sym-lib-table",
+    )
+    windows_paths = (
+        home / "AppData" / "Roaming" / "kicad" / "9.0" / "sym-lib-table",
+        home / "AppData" / "Roaming" / "kicad" / "8.0" / "sym-lib-table",
+    )
+    macos_paths = (
+        home / "Library" / "Preferences" / "kicad" / "9.0" / "sym-lib-table",
+        home / "Library" / "Preferences" / "kicad" / "8.0" / "sym-lib-table",
+    )
+
+    if PlatformHelper.is_linux():
+        return linux_paths
+    if PlatformHelper.is_windows():
+        return windows_paths
+    if PlatformHelper.is_macos():
+        return macos_paths
+    # Unknown platform: try every known location
+    return linux_paths + windows_paths + macos_paths
+
+
+class _LibrarySearchIndex:
+    """Lowercased searchable fields and a trigram index for one library.
+
+    Every field that can contribute to a match score is lowercased once, and
+    each trigram of those fields maps to the positions of the symbols that
+    contain it. A query only matches a field that contains all of its
+    trigrams, so intersecting their posting sets gives a superset of the
+    matching symbols without scanning the whole library. The fields of each
+    symbol are also joined into one NUL-separated blob, so a candidate that
+    matches none of them is rejected with a single substring search.
+    Symbols are also keyed by lowercased LCSC ID for direct part lookups.
+    """
+
+    __slots__ = ("blobs", "fields", "grams", "lcsc", "symbols")
+
+    def __init__(self, symbols: list[SymbolInfo]) -> None:
+        """Build the index for a library's symbols.
+
+        Args:
+            symbols: Symbols of the library, in library order.
+        """
+        self.symbols = symbols
+        self.fields = [_lowercase_fields(symbol) for symbol in symbols]
+        self.blobs = ["\0".join(fields) for fields in self.fields]
+        self.grams: dict[str, set[int]] = {}
+        self.lcsc: dict[str, list[int]] = {}
+        for position, fields in enumerate(self.fields):
+            if fields[0]:
+                self.lcsc.setdefault(fields[0], []).append(position)
+            for field in fields:
+                for start in range(len(field) - _SEARCH_GRAM_SIZE + 1):
+                    gram = field[start : start + _SEARCH_GRAM_SIZE]
+                    postings = self.grams.get(gram)
+                    if postings is None:
+                        self.grams[gram] = {position}
+                    else:
+                        postings.add(position)
+
+    def candidates(self, query: str) -> Iterable[int]:
+        """Get the positions of the symbols that may match a query.
+
+        Args:
+            query: Lowercase search query.
+
+        Returns:
+            Positions in ascending order; every symbol for queries shorter
+            than a trigram.
+        """
+        if len(query) < _SEARCH_GRAM_SIZE:
+            return range(len(self.symbols))
+        postings = []
+        for start in range(len(query) - _SEARCH_GRAM_SIZE + 1):
+            gram_postings = self.grams.get(query[start : start + _SEARCH_GRAM_SIZE])
+            if gram_postings is None:
+                return ()
+            postings.append(gram_postings)
+        postings.sort(key=len)
+        return sorted(set.intersection(*postings))
+
+
+def _lowercase_fields(symbol: SymbolInfo) -> tuple[str, ...]:
+    """Lowercase the scored fields of a symbol, in _score_fields order."""
+    return (
+        symbol.lcsc_id.lower(),
+        symbol.name.lower(),
+        symbol.value.lower(),
+        symbol.description.lower(),
+        symbol.mpn.lower(),
+        symbol.manufacturer.lower(),
+        symbol.category.lower(),
+    )
+
+
+def _score_fields(query: str, fields: tuple[str, ...]) -> int:
+    """Score how well a symbol's lowercased fields match a query.
+
+    Args:
+        query: Search query string (lowercase).
+        fields: Fields of the symbol as returned by _lowercase_fields.
+
+    Returns:
+        Score (0 = no match, higher = better match).
+    """
+    lcsc_id, name, value, description, mpn, manufacturer, category = fields
+    score = 0
+
+    # Exact LCSC ID match - highest priority
+    if lcsc_id and lcsc_id == query:
+        score += _SCORE_EXACT_LCSC
+
+    # Partial name match, which is exact when the lengths agree
+    if query in name:
+        score += _SCORE_PARTIAL_NAME
+        if len(name) == len(query):
+            score += _SCORE_EXACT_NAME
+
+    # Partial value match, which is exact when the lengths agree
+    if query in value:
+        score += _SCORE_PARTIAL_VALUE
+        if len(value) == len(query):
+            score += _SCORE_EXACT_VALUE
+
+    # Description match
+    if query in description:
+        score += _SCORE_DESCRIPTION_MATCH
+
+    # MPN match
+    if mpn and query in mpn:
+        score += _SCORE_MPN_MATCH
+
+    # Manufacturer match
+    if manufacturer and query in manufacturer:
+        score += _SCORE_MANUFACTURER_MATCH
+
+    # Category match
+    if category and query in category:
+        score += _SCORE_CATEGORY_MATCH
+
+    return score
+
+
+# (lowercase blob, lowercase fields, symbol) of a symbol matching a search query
+_SearchCandidate = tuple[str, tuple[str, ...], SymbolInfo]
+
+
+def _iter_scored_candidates(
+    query: str, candidates: list[_SearchCandidate]
+) -> Iterator[tuple[int, SymbolInfo]]:
+    """Yield (score, symbol) for every candidate scoring above zero.
+
+    Args:
+        query: Search query string (lowercase).
+        candidates: Candidates from SymbolLibraryManager._collect_candidates.
+
+    Yields:
+        Tuples of (score, SymbolInfo) with a positive score.
+    """
+    for _, fields, symbol in candidates:
+        score = _score_fields(query, fields)
+        if score > 0:
+            yield score, symbol
+
 
 class SymbolLibraryManager:
     """Manages KiCAD symbol libraries.
@@ -55,19 +409,44 @@ class SymbolLibraryManager:
     indexes available symbols, and provides search functionality.
     """
 
-    def __init__(self, project_path: Path | None = None) -> None:
+    def __init__(
+        self,
+        project_path: Path | None = None,
+        index_path: Path | None = None,
+    ) -> None:
         """Initialize symbol library manager.
 
         Args:
             project_path: Optional path to project directory for project-specific libraries
+            index_path: Optional path of the persistent symbol index database
+                (default: symbol_index.sqlite in the platform cache directory)
         """
         self.project_path = project_path
         self.libraries: dict[str, str] = {}  # nickname -> path mapping
+        self._lowercase_names: dict[str, str] = {}  # nickname -> nickname.lower()
         self.symbol_cache: dict[str, list[SymbolInfo]] = {}  # library -> [SymbolInfo]
+        self._search_indexes: dict[str, _LibrarySearchIndex] = {}  # library -> search index
+        # library -> (symbol list the map was built from, name -> first SymbolInfo)
+        self._name_indexes: dict[str, tuple[list[SymbolInfo], dict[str, SymbolInfo]]] = {}
+        # LRU caches of query results, cleared whenever another library gets loaded
+        self._search_cache: OrderedDict[tuple[str, int, str | None], tuple[SymbolInfo, ...]] = (
+            OrderedDict()
+        )
+        self._find_cache: OrderedDict[str, SymbolInfo | None] = OrderedDict()
+        # (query, library filter, matching candidates) of the last uncached search
+        self._last_search: tuple[str, str | None, list[_SearchCandidate]] = ("", None, [])
+        self._index_path = index_path or PlatformHelper.get_cache_dir() / _SYMBOL_INDEX_FILE
+        self._index_conn: sqlite3.Connection | None = None
+        self._index_disabled = False
+        self._index_lock = threading.Lock()
+        self._env_vars: dict[str, str] = {}  # variable name -> value
         self._load_libraries()
 
     def _load_libraries(self) -> None:
         """Load libraries from sym-lib-table files."""
+        # Probe the KiCAD install directories once for every URI in the tables
+        self._env_vars = self._build_env_vars()
+
         # Load global libraries
         global_table = self._get_global_sym_lib_table()
         if global_table and global_table.exists():
@@ -87,20 +466,7 @@ class SymbolLibraryManager:
 
     def _get_global_sym_lib_table(self) -> Path | None:
         """Get path to global sym-lib-table file."""
-        # Try different possible locations (same as fp-lib-table but for symbols)
-        kicad_config_paths = [
-            Path.home() / ".config" / "kicad" / "9.0" / "sym-lib-table",
-            Path.home() / ".config" / "kicad" / "8.0" / "sym-lib-table",
-            Path.home() / ".config" / "kicad" / "sym-lib-table",
-            # Windows paths
-            Path.home() / "AppData" / "Roaming" / "kicad" / "9.0" / "sym-lib-table",
-            Path.home() / "AppData" / "Roaming" / "kicad" / "8.0" / "sym-lib-table",
-            # macOS paths
-            Path.home() / "Library" / "Preferences" / "kicad" / "9.0" / "sym-lib-table",
-            Path.home() / "Library" / "Preferences" / "kicad" / "8.0" / "sym-lib-table",
-        ]
-
-        for path in kicad_config_paths:
+        for path in _global_sym_lib_table_candidates():
             if path.exists():
                 return path
 
@@ -115,24 +481,13 @@ class SymbolLibraryManager:
         )
         """
         try:
-            with Path(table_path).open(encoding="utf-8") as f:
-                content = f.read()
-
-            # Simple regex-based parser for lib entries
-            # Pattern: (lib (name "NAME")(type TYPE)(uri "URI")...)
-            lib_pattern = (
-                r'\(lib\s+\(name\s+"?([^")\s]+)"?\)\s*\(type\s+[^)]+\)\s*\(uri\s+"?([^")\s]+)"?'
-            )
-
-            for match in re.finditer(lib_pattern, content, re.IGNORECASE):
-                nickname = match.group(1)
-                uri = match.group(2)
-
+            for nickname, uri in self._read_sym_lib_table(Path(table_path)):
                 # Resolve environment variables in URI
                 resolved_uri = self._resolve_uri(uri)
 
                 if resolved_uri:
                     self.libraries[nickname] = resolved_uri
+                    self._lowercase_names[nickname] = nickname.lower()
                     logger.debug("  Found library: %s -> %s", nickname, resolved_uri)
                 else:
                     logger.debug("  Could not resolve URI for library %s: %s", nickname, uri)
@@ -140,37 +495,73 @@ class SymbolLibraryManager:
         except Exception:
             logger.exception("Error parsing sym-lib-table at %s", table_path)
 
-    def _resolve_uri(self, uri: str) -> str | None:
-        """Resolve environment variables and paths in library URI.
+    @staticmethod
+    def _read_sym_lib_table(table_path: Path) -> list[tuple[str, str]]:
+        """Read the (nickname, uri) entries of a sym-lib-table.
 
-        Handles:
-        - ${KICAD9_SYMBOL_DIR} -> /Applications/KiCad/KiCad.app/Contents/SharedSupport/symbols
-        - ${KICAD9_3RD_PARTY} -> ~/Documents/KiCad/9.0/3rdparty
-        - ${KIPRJMOD} -> project directory
-        - Relative paths
-        - Absolute paths
+        Entries are cached for the process until the file's mtime or size
+        changes. URIs are kept unresolved since resolution depends on the
+        manager's project path and install directories.
+
+        Args:
+            table_path: Path to the sym-lib-table file.
+
+        Returns:
+            List of (nickname, unresolved uri) tuples in table order.
+        """
+        stat = table_path.stat()
+        cached = _TABLE_CACHE.get(str(table_path))
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
+        content = table_path.read_text(encoding="utf-8")
+
+        # Simple regex-based parser for lib entries
+        entries = [(match.group(1), match.group(2)) for match in _LIB_RE.finditer(content)]
+        _TABLE_CACHE[str(table_path)] = (stat.st_mtime_ns, stat.st_size, entries)
+        return entries
+
+    def _build_env_vars(self) -> dict[str, str]:
+        """Build the environment variables used when resolving library URIs.
+
+        Returns:
+            Dict of variable name -> value, limited to variables that resolved.
         """
-        resolved = uri
+        symbol_dir = self._find_kicad_symbol_dir()
+        third_party_dir = self._find_3rd_party_dir()
 
         # Common KiCAD environment variables
         env_vars = {
-            "KICAD9_SYMBOL_DIR": self._find_kicad_symbol_dir(),
-            "KICAD8_SYMBOL_DIR": self._find_kicad_symbol_dir(),
-            "KICAD_SYMBOL_DIR": self._find_kicad_symbol_dir(),
-            "KICAD9_3RD_PARTY": self._find_3rd_party_dir(),
-            "KICAD8_3RD_PARTY": self._find_3rd_party_dir(),
-            "KISYSSYM": self._find_kicad_symbol_dir(),
+            "KICAD9_SYMBOL_DIR": symbol_dir,
+            "KICAD8_SYMBOL_DIR": symbol_dir,
+            "KICAD_SYMBOL_DIR": symbol_dir,
+            "KICAD9_3RD_PARTY": third_party_dir,
+            "KICAD8_3RD_PARTY": third_party_dir,
+            "KISYSSYM": symbol_dir,
         }
 
         # Project directory
         if self.project_path:
             env_vars["KIPRJMOD"] = str(self.project_path)
 
+        return {var: value for var, value in env_vars.items() if value}
+
+    def _substitute_env_var(self, match: re.Match[str]) -> str:
+        """Return the value for a ${VAR}/$VAR match, leaving unknown variables as-is."""
+        return self._env_vars.get(match.group(1) or match.group(2), match.group(0))
+
+    def _resolve_uri(self, uri: str) -> str | None:
+        """Resolve environment variables and paths in library URI.
+
+        Handles:
+        - ${KICAD9_SYMBOL_DIR} -> /Applications/KiCad/KiCad.app/Contents/SharedSupport/symbols
+        - ${KICAD9_3RD_PARTY} -> ~/Documents/KiCad/9.0/3rdparty
+        - ${KIPRJMOD} -> project directory
+        - Relative paths
+        - Absolute paths
+        """
         # Replace environment variables
-        for var, value in env_vars.items():
-            if value:
-                resolved = resolved.replace(f"${{{var}}}", value)
-                resolved = resolved.replace(f"${var}", value)
+        resolved = _ENV_VAR_RE.sub(self._substitute_env_var, uri) if "$" in uri else uri
 
         # Expand ~ to home directory
         resolved = Path(resolved).expanduser()
@@ -238,51 +629,44 @@ class SymbolLibraryManager:
         symbols = []
 
         try:
-            with Path(library_path).open(encoding="utf-8") as f:
-                content = f.read()
-
-            # Find all top-level symbol definitions
-            # Pattern: (symbol "SYMBOL_NAME" ... ) at the top level
-            # We need to find symbols that are direct children of kicad_symbol_lib
-            # and not sub-symbols (which have names like "PARENT_0_1")
-
-            # Simple approach: find all (symbol "NAME" and filter out sub-symbols
-            symbol_pattern = r'\(symbol\s+"([^"]+)"'
-
-            for match in re.finditer(symbol_pattern, content):
-                symbol_name = match.group(1)
-
-                # Skip sub-symbols (they contain _0_, _1_, etc. suffixes)
-                if re.search(r"_\d+_\d+$", symbol_name):
-                    continue
-
-                # Find the start position of this symbol
-                start_pos = match.start()
-
-                # Extract properties from this symbol block
-                # We need to find the matching closing paren - use a simple heuristic
-                # Look for the next 2000 characters for properties
-                block_end = min(start_pos + 5000, len(content))
-                symbol_block = content[start_pos:block_end]
-
-                # Extract properties
-                properties = self._extract_properties(symbol_block)
-
+            # Map the file rather than reading it into one large string; the
+            # regex scans the pages and only matched strings are decoded
+            with Path(library_path).open("rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return symbols
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    parsed = list(_iter_top_level_symbols(content))
+
+            for symbol_name, values in parsed:
+                (
+                    value,
+                    description,
+                    footprint,
+                    lcsc_id,
+                    manufacturer,
+                    part,
+                    mpn,
+                    category,
+                    datasheet,
+                    stock,
+                    price,
+                    lib_class,
+                ) = values
                 symbol_info = SymbolInfo(
                     name=symbol_name,
                     library=library_name,
                     full_ref=f"{library_name}:{symbol_name}",
-                    value=properties.get("Value", ""),
-                    description=properties.get("Description", ""),
-                    footprint=properties.get("Footprint", ""),
-                    lcsc_id=properties.get("LCSC", ""),
-                    manufacturer=properties.get("Manufacturer", ""),
-                    mpn=properties.get("Part", properties.get("MPN", "")),
-                    category=properties.get("Category", ""),
-                    datasheet=properties.get("Datasheet", ""),
-                    stock=properties.get("Stock", ""),
-                    price=properties.get("Price", ""),
-                    lib_class=properties.get("Class", ""),
+                    value=value,
+                    description=description,
+                    footprint=footprint,
+                    lcsc_id=lcsc_id,
+                    manufacturer=manufacturer,
+                    mpn=mpn if part is None else part,
+                    category=category,
+                    datasheet=datasheet,
+                    stock=stock,
+                    price=price,
+                    lib_class=lib_class,
                 )
 
                 symbols.append(symbol_info)
@@ -294,20 +678,6 @@ class SymbolLibraryManager:
 
         return symbols
 
-    def _extract_properties(self, symbol_block: str) -> dict[str, str]:
-        """Extract properties from a symbol block."""
-        properties = {}
-
-        # Pattern for properties: (property "KEY" "VALUE" ...)
-        prop_pattern = r'\(property\s+"([^"]+)"\s+"([^"]*)"'
-
-        for match in re.finditer(prop_pattern, symbol_block):
-            key = match.group(1)
-            value = match.group(2)
-            properties[key] = value
-
-        return properties
-
     def list_libraries(self) -> list[str]:
         """Get list of available library nicknames."""
         return list(self.libraries.keys())
@@ -334,14 +704,119 @@ class SymbolLibraryManager:
             logger.warning("Library not found: %s", library_nickname)
             return []
 
-        # Parse the library file
-        symbols = self._parse_kicad_sym_file(library_path, library_nickname)
+        # Reuse the persisted parse while the file is unchanged
+        try:
+            stat = Path(library_path).stat()
+        except OSError:
+            stat = None
+        symbols = None
+        if stat is not None:
+            symbols = self._load_indexed_symbols(library_path, library_nickname, stat)
+
+        if symbols is None:
+            # Parse the library file
+            symbols = self._parse_kicad_sym_file(library_path, library_nickname)
+            if symbols and stat is not None:
+                self._store_indexed_symbols(library_path, stat, symbols)
 
         # Cache the results
         self.symbol_cache[library_nickname] = symbols
+        self._search_cache.clear()
+        self._find_cache.clear()
+        self._last_search = ("", None, [])
 
         return symbols
 
+    def _get_index_conn(self) -> sqlite3.Connection | None:
+        """Open the persistent symbol index on first use.
+
+        Returns:
+            Connection to the index, or None if it cannot be opened.
+            Callers must hold _index_lock.
+        """
+        if self._index_conn is None and not self._index_disabled:
+            try:
+                self._index_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self._index_path, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                for statement in _SYMBOL_INDEX_DDL:
+                    conn.execute(statement)
+                conn.commit()
+            except (sqlite3.Error, OSError) as e:
+                logger.warning("Symbol index unavailable at %s: %s", self._index_path, e)
+                self._index_disabled = True
+            else:
+                self._index_conn = conn
+        return self._index_conn
+
+    def _load_indexed_symbols(
+        self, library_path: str, library_nickname: str, stat: os.stat_result
+    ) -> list[SymbolInfo] | None:
+        """Load a library's symbols from the persistent index.
+
+        Args:
+            library_path: Path to the .kicad_sym file.
+            library_nickname: Nickname to attach to the loaded symbols.
+            stat: Current stat of the library file.
+
+        Returns:
+            List of SymbolInfo, or None if the index has no up-to-date entry.
+        """
+        with self._index_lock:
+            conn = self._get_index_conn()
+            if conn is None:
+                return None
+            try:
+                entry = conn.execute(
+                    "SELECT mtime_ns, size FROM libraries WHERE lib_path = ?", (library_path,)
+                ).fetchone()
+                if entry != (stat.st_mtime_ns, stat.st_size):
+                    return None
+                rows = conn.execute(_SELECT_INDEXED_SYMBOLS, (library_path,)).fetchall()
+            except sqlite3.Error as e:
+                logger.debug("Could not read symbol index for %s: %s", library_path, e)
+                return None
+
+        return [
+            SymbolInfo(
+                library=library_nickname,
+                full_ref=f"{library_nickname}:{row[0]}",
+                **dict(zip(_INDEXED_FIELDS, row, strict=True)),
+            )
+            for row in rows
+        ]
+
+    def _store_indexed_symbols(
+        self, library_path: str, stat: os.stat_result, symbols: list[SymbolInfo]
+    ) -> None:
+        """Replace a library's entry in the persistent index.
+
+        Args:
+            library_path: Path to the .kicad_sym file.
+            stat: Stat of the library file the symbols were parsed from.
+            symbols: Parsed symbols.
+        """
+        rows = [
+            (library_path, seq, *(getattr(symbol, field) for field in _INDEXED_FIELDS))
+            for seq, symbol in enumerate(symbols)
+        ]
+        with self._index_lock:
+            conn = self._get_index_conn()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    conn.execute("DELETE FROM symbols WHERE lib_path = ?", (library_path,))
+                    conn.executemany(_INSERT_INDEXED_SYMBOL, rows)
+                    conn.execute(
+                        "INSERT OR REPLACE INTO libraries (lib_path, mtime_ns, size) "
+                        "VALUES (?, ?, ?)",
+                        (library_path, stat.st_mtime_ns, stat.st_size),
+                    )
+            except sqlite3.Error as e:
+                logger.debug("Could not update symbol index for %s: %s", library_path, e)
+
     def search_symbols(
         self, query: str, limit: int = 20, library_filter: str | None = None
     ) -> list[SymbolInfo]:
@@ -353,86 +828,137 @@ class SymbolLibraryManager:
             library_filter: Optional library name pattern to filter by
 
         Returns:
-            List of SymbolInfo objects sorted by relevance
+            List of SymbolInfo objects sorted by relevance; symbols with that
+            exact LCSC ID come first when the query is one
         """
-        results = []
-        query_lower = query.lower()
+        key = (query.lower(), limit, library_filter.lower() if library_filter else None)
+        results = self._search_cache.get(key)
+        if results is None:
+            results = tuple(self._run_search(*key))
+            self._search_cache[key] = results
+            if len(self._search_cache) > _QUERY_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        else:
+            self._search_cache.move_to_end(key)
+        return list(results)
+
+    def _run_search(
+        self, query_lower: str, limit: int, filter_lower: str | None
+    ) -> list[SymbolInfo]:
+        """Search for symbols matching a query, bypassing the result cache.
 
+        Args:
+            query_lower: Lowercased search query
+            limit: Maximum number of results to return
+            filter_lower: Optional lowercased library name pattern to filter by
+
+        Returns:
+            List of SymbolInfo objects sorted by relevance
+        """
         # Determine which libraries to search
         libraries_to_search = self.libraries.keys()
-        if library_filter:
-            filter_lower = library_filter.lower()
+        if filter_lower:
             libraries_to_search = [
-                lib for lib in libraries_to_search if filter_lower in lib.lower()
+                lib for lib, lib_lower in self._lowercase_names.items() if filter_lower in lib_lower
             ]
 
-        for library_nickname in libraries_to_search:
-            symbols = self.list_symbols(library_nickname)
-
-            for symbol in symbols:
-                score = self._score_match(query_lower, symbol)
-                if score > 0:
-                    results.append((score, symbol))
-
-                    if len(results) >= limit * 3:  # Get extra for sorting
-                        break
-
-            if len(results) >= limit * 3:
-                break
+        # An LCSC part number resolves straight to the symbols carrying it;
+        # those lead, and the ranked search fills the rest
+        direct: list[SymbolInfo] = []
+        if _LCSC_QUERY_RE.fullmatch(query_lower):
+            direct = [
+                index.symbols[position]
+                for index in map(self._get_search_index, libraries_to_search)
+                for position in index.lcsc.get(query_lower, ())
+            ]
+            if len(direct) >= limit:
+                return direct[:limit]
 
-        # Sort by score (descending) and return top results
-        results.sort(key=lambda x: x[0], reverse=True)
-        return [symbol for _, symbol in results[:limit]]
+        # Like a full scan, ranking stops loading libraries once it has plenty of hits
+        candidates = self._collect_candidates(
+            query_lower, filter_lower, libraries_to_search, limit * 3
+        )
 
-    def _score_match(self, query: str, symbol: SymbolInfo) -> int:
-        """Score how well a symbol matches a query.
+        # Keep the best matches across every library; ties keep library order
+        results = heapq.nlargest(
+            limit,
+            _iter_scored_candidates(query_lower, candidates),
+            key=itemgetter(0),
+        )
+        if not direct:
+            return [symbol for _, symbol in results]
+        seen = set(map(id, direct))
+        ranked = [symbol for _, symbol in results if id(symbol) not in seen]
+        return direct + ranked[: limit - len(direct)]
+
+    def _collect_candidates(
+        self,
+        query: str,
+        filter_lower: str | None,
+        library_nicknames: Iterable[str],
+        wanted: int,
+    ) -> list[_SearchCandidate]:
+        """Collect the symbols with a searchable field containing a query.
+
+        Libraries are loaded in order until they have yielded `wanted`
+        scoring matches; the rest are left unloaded. A field containing the
+        query also contains every substring of it, so when the query extends
+        the previous complete search's query (e.g. "esp" after "es") over the
+        same libraries, only that search's candidates are re-checked instead
+        of the library indexes.
 
         Args:
             query: Search query string (lowercase).
-            symbol: SymbolInfo to score against.
+            filter_lower: Lowercased library filter the libraries came from.
+            library_nicknames: Libraries to search, in order.
+            wanted: Number of scoring matches after which to stop loading libraries.
 
         Returns:
-            Score (0 = no match, higher = better match).
+            Candidates in library order.
         """
-        score = 0
-
-        # Exact LCSC ID match - highest priority
-        if symbol.lcsc_id and symbol.lcsc_id.lower() == query:
-            score += _SCORE_EXACT_LCSC
-
-        # Exact name match
-        if symbol.name.lower() == query:
-            score += _SCORE_EXACT_NAME
-
-        # Exact value match
-        if symbol.value.lower() == query:
-            score += _SCORE_EXACT_VALUE
-
-        # Partial name match
-        if query in symbol.name.lower():
-            score += _SCORE_PARTIAL_NAME
-
-        # Partial value match
-        if query in symbol.value.lower():
-            score += _SCORE_PARTIAL_VALUE
-
-        # Description match
-        if query in symbol.description.lower():
-            score += _SCORE_DESCRIPTION_MATCH
+        last_query, last_filter, last_candidates = self._last_search
+        if last_query and last_query in query and last_filter == filter_lower:
+            candidates = [candidate for candidate in last_candidates if query in candidate[0]]
+            self._last_search = (query, filter_lower, candidates)
+            return candidates
+
+        candidates = []
+        hits = 0
+        for library_nickname in library_nicknames:
+            index = self._get_search_index(library_nickname)
+            blobs = index.blobs
+            start = len(candidates)
+            candidates.extend(
+                (blobs[position], index.fields[position], index.symbols[position])
+                for position in index.candidates(query)
+                if query in blobs[position]
+            )
+            hits += sum(
+                1 for _, fields, _ in candidates[start:] if _score_fields(query, fields) > 0
+            )
+            if hits >= wanted:
+                # Later libraries were skipped, so this cannot seed a refined search
+                self._last_search = ("", None, [])
+                return candidates
 
-        # MPN match
-        if symbol.mpn and query in symbol.mpn.lower():
-            score += _SCORE_MPN_MATCH
+        self._last_search = (query, filter_lower, candidates)
+        return candidates
 
-        # Manufacturer match
-        if symbol.manufacturer and query in symbol.manufacturer.lower():
-            score += _SCORE_MANUFACTURER_MATCH
+    def _get_search_index(self, library_nickname: str) -> _LibrarySearchIndex:
+        """Get the search index of a library, building it on first use.
 
-        # Category match
-        if symbol.category and query in symbol.category.lower():
-            score += _SCORE_CATEGORY_MATCH
+        Args:
+            library_nickname: Library name
 
-        return score
+        Returns:
+            Search index over the library's current symbol list.
+        """
+        symbols = self.list_symbols(library_nickname)
+        index = self._search_indexes.get(library_nickname)
+        if index is None or index.symbols is not symbols:
+            index = _LibrarySearchIndex(symbols)
+            self._search_indexes[library_nickname] = index
+        return index
 
     def get_symbol_info(self, library_nickname: str, symbol_name: str) -> SymbolInfo | None:
         """Get information about a specific symbol.
@@ -445,12 +971,15 @@ class SymbolLibraryManager:
             SymbolInfo or None if not found
         """
         symbols = self.list_symbols(library_nickname)
+        cached = self._name_indexes.get(library_nickname)
+        if cached is None or cached[0] is not symbols:
+            by_name: dict[str, SymbolInfo] = {}
+            for symbol in symbols:
+                by_name.setdefault(symbol.name, symbol)
+            cached = (symbols, by_name)
+            self._name_indexes[library_nickname] = cached
 
-        for symbol in symbols:
-            if symbol.name == symbol_name:
-                return symbol
-
-        return None
+        return cached[1].get(symbol_name)
 
     def find_symbol(self, symbol_spec: str) -> SymbolInfo | None:
         """Find a symbol by specification.
@@ -465,17 +994,45 @@ class SymbolLibraryManager:
         Returns:
             SymbolInfo or None if not found
         """
-        if ":" in symbol_spec:
+        if symbol_spec in self._find_cache:
+            self._find_cache.move_to_end(symbol_spec)
+            return self._find_cache[symbol_spec]
+
+        result = None
+        library_nickname, sep, symbol_name = symbol_spec.partition(":")
+        if sep:
             # Format: Library:Symbol
-            library_nickname, symbol_name = symbol_spec.split(":", 1)
-            return self.get_symbol_info(library_nickname, symbol_name)
-        # Search all libraries
-        for library_nickname in self.libraries:
-            result = self.get_symbol_info(library_nickname, symbol_spec)
-            if result:
-                return result
+            result = self.get_symbol_info(library_nickname, symbol_name)
+        else:
+            # Search all libraries
+            for library_nickname in self.libraries:
+                result = self.get_symbol_info(library_nickname, symbol_spec)
+                if result:
+                    break
 
-        return None
+        self._find_cache[symbol_spec] = result
+        if len(self._find_cache) > _QUERY_CACHE_SIZE:
+            self._find_cache.popitem(last=False)
+        return result
+
+
+# Manager shared by command handlers that are not given one, so the parsed
+# tables and symbol cache survive across SymbolLibraryCommands instances
+_default_manager: SymbolLibraryManager | None = None
+_default_manager_lock = threading.Lock()
+
+
+def _get_default_manager() -> SymbolLibraryManager:
+    """Get the process-wide symbol library manager, creating it on first use.
+
+    Returns:
+        The shared SymbolLibraryManager for the global sym-lib-table.
+    """
+    global _default_manager  # noqa: PLW0603
+    with _default_manager_lock:
+        if _default_manager is None:
+            _default_manager = SymbolLibraryManager()
+        return _default_manager
 
 
 class SymbolLibraryCommands:
@@ -485,9 +1042,10 @@ class SymbolLibraryCommands:
         """Initialize with optional library manager.
 
         Args:
-            library_manager: Optional library manager instance.
+            library_manager: Optional library manager instance
+                (default: the shared process-wide manager).
         """
-        self.library_manager = library_manager or SymbolLibraryManager()
+        self.library_manager = library_manager or _get_default_manager()
 
     def list_symbol_libraries(self, params: dict[str, Any]) -> dict[str, Any]:
         """List all available symbol libraries.
@@ -531,7 +1089,7 @@ class SymbolLibraryCommands:
 
             return {
                 "success": True,
-                "symbols": [asdict(s) for s in results],
+                "symbols": [s.to_dict() for s in results],
                 "count": len(results),
                 "query": query,
             }
@@ -578,7 +1136,7 @@ class SymbolLibraryCommands:
             return {
                 "success": True,
                 "library": library,
-                "symbols": [asdict(s) for s in symbols],
+                "symbols": [s.to_dict() for s in symbols],
                 "count": len(symbols),
             }
         except Exception as e:
@@ -606,7 +1164,7 @@ class SymbolLibraryCommands:
             result = self.library_manager.find_symbol(symbol_spec)
 
             if result:
-                return {"success": True, "symbol_info": asdict(result)}
+                return {"success": True, "symbol_info": result.to_dict()}
             return {"success": False, "message": f"Symbol not found: {symbol_spec}"}
 
         except Exception as e:
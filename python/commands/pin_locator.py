@@ -1,120 +1,476 @@
 """Pin Locator for KiCad Schematics.
 
 Discovers pin locations on symbol instances, accounting for position, rotation, and mirroring.
-Uses S-expression parsing to extract pin data from symbol definitions.
+Scans the schematic's lib_symbols section to extract pin data from symbol definitions.
 """
 
 from __future__ import annotations
 
+import contextlib
+from functools import lru_cache
+import hashlib
+import json
 import logging
 import math
+import mmap
+import os
+from pathlib import Path
+import re
 from typing import TYPE_CHECKING, Any
 
-import sexpdata
 from sexpdata import Symbol
-from skip import Schematic
+
+from utils.platform_helper import PlatformHelper
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
-    from pathlib import Path
+    from collections.abc import Iterator, Sequence
 
 # Type alias for S-expressions parsed by sexpdata
 # Can be: list, Symbol, str, int, float, or None
 SExpression = list | Symbol | str | int | float | None
 
-logger = logging.getLogger("kicad_interface")
-
-
-class PinLocator:
-    """Locate pins on symbol instances in KiCad schematics."""
-
-    def __init__(self) -> None:
-        """Initialize pin locator with empty cache."""
-        self.pin_definition_cache: dict[str, dict[str, dict[str, Any]]] = {}
+# Identifies one version of a schematic file: (path, mtime_ns, size)
+SchematicKey = tuple[str, int, int]
+
+# Number of schematic versions kept parsed in memory
+_SCHEMATIC_CACHE_SIZE = 16
+
+# One S-expression token: "(", ")", a double-quoted string, a bare atom or
+# a ;-comment, which matches no group
+_SEXP_TOKEN_RE = re.compile(rb'(\()|(\))|"((?:[^"\\]|\\.)*)"|;[^\n]*|([^\s()";]+)')
+_SEXP_ESCAPE_RE = re.compile(r"\\(.)")
+# Only the tokens that affect nesting, for skipping over a section: "(",
+# ")", and the strings and comments that may contain parentheses
+_SEXP_NESTING_RE = re.compile(rb'(\()|(\))|"(?:[^"\\]|\\.)*"|;[^\n]*')
+
+# Depth of the sections inside the root (kicad_sch ...) list
+_SECTION_DEPTH = 2
+
+# Persistent cache of pin definitions, one JSON file per lib_symbols content
+# hash; bump the format when the pin data layout changes. Past the file
+# limit the least recently used files are deleted.
+_LIB_PINS_CACHE_DIR = "lib_pins"
+_LIB_PINS_FORMAT = 1
+_LIB_PINS_CACHE_LIMIT = 256
+
+# Heads of the S-expression lists read when extracting pins
+_SYMBOL = Symbol("symbol")
+_PIN = Symbol("pin")
+_AT = Symbol("at")
+_LENGTH = Symbol("length")
+_NAME = Symbol("name")
+_NUMBER = Symbol("number")
+_LIB_ID = Symbol("lib_id")
+_PROPERTY = Symbol("property")
+
+# List heads produced by _read_list are interned here, so trees built by
+# this module can be matched against the constants above with `is`
+_HEADS: dict[bytes, Symbol] = {
+    str(head).encode(): head
+    for head in (_SYMBOL, _PIN, _AT, _LENGTH, _NAME, _NUMBER, _LIB_ID, _PROPERTY)
+}
+
+# Placement of a symbol instance: (x, y, rotation, lib_id)
+SymbolInstance = tuple[float, float, float, str]
+
+# Exact (cos, sin) of the rotations KiCAD places symbols at
+_RIGHT_ANGLE_ROTATIONS = {0.0: (1.0, 0.0), 90.0: (0.0, 1.0), 180.0: (-1.0, 0.0), 270.0: (0.0, -1.0)}
 
-    @staticmethod
-    def _is_pin_definition(sexp: SExpression) -> bool:
-        """Check if an S-expression is a pin definition.
+logger = logging.getLogger("kicad_interface")
 
-        Args:
-            sexp: S-expression to check
 
-        Returns:
-            True if this is a pin definition, False otherwise
-        """
-        return isinstance(sexp, list) and len(sexp) > 0 and sexp[0] == Symbol("pin")
+def _schematic_key(schematic_path: Path) -> SchematicKey:
+    """Identify the current version of a schematic file for the parse caches."""
+    stat = schematic_path.stat()
+    return (str(schematic_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _read_list(tokens: Iterator[re.Match[bytes]], head: Symbol) -> list[Any]:
+    """Build the list whose "(" and head atom were just consumed from tokens.
+
+    Bare atoms become Symbols and quoted strings become str, as with
+    sexpdata, so the result works with the same Symbol comparisons. Atoms
+    heading a list are shared instances from _HEADS. Only the tokens kept
+    in the list are decoded.
+
+    Args:
+        tokens: _SEXP_TOKEN_RE matches positioned after the head atom
+        head: Head atom of the list
+
+    Returns:
+        The list, ending at its matching ")"
+    """
+    root: list[Any] = [head]
+    stack = [root]
+    for match in tokens:
+        opening, closing, string, atom = match.groups()
+        if match.lastindex is None:  # Comment
+            continue
+        if opening:
+            child: list[Any] = []
+            stack[-1].append(child)
+            stack.append(child)
+        elif closing:
+            stack.pop()
+            if not stack:
+                break
+        elif atom is not None:
+            current = stack[-1]
+            if current:
+                current.append(Symbol(atom.decode()))
+            else:
+                head = _HEADS.get(atom)
+                if head is None:
+                    head = _HEADS[atom] = Symbol(atom.decode())
+                current.append(head)
+        elif string is not None:
+            text = string.decode()
+            stack[-1].append(_SEXP_ESCAPE_RE.sub(r"\1", text) if "\\" in text else text)
+    return root
+
+
+def _iter_sections(content: bytes | mmap.mmap, head: bytes) -> Iterator[list[Any]]:
+    """Yield each section with the given head inside the root (kicad_sch ...) list.
+
+    Only matching sections are turned into lists; everything else is just
+    tokenized, and nothing past the last section consumed is scanned.
+
+    Args:
+        content: Raw contents of a .kicad_sch file
+        head: Head atom of the sections (e.g. b"lib_symbols", b"symbol")
+
+    Yields:
+        The S-expression of each matching section, in file order
+    """
+    tokens = _SEXP_TOKEN_RE.finditer(content)
+    depth = 0
+    after_open = False
+    for match in tokens:
+        opening, closing, _, atom = match.groups()
+        if match.lastindex is None:  # Comment
+            continue
+        if opening:
+            depth += 1
+        elif closing:
+            depth -= 1
+        elif after_open and depth == _SECTION_DEPTH and atom == head:
+            # The section's closing paren is consumed by _read_list
+            yield _read_list(tokens, _HEADS.get(atom) or Symbol(atom.decode()))
+            depth -= 1
+        after_open = bool(opening)
+
+
+def _iter_schematic_sections(schematic_path: str, head: bytes) -> Iterator[list[Any]]:
+    """Yield each section with the given head from a schematic file.
+
+    The file is memory-mapped rather than read into a str, so it is not
+    copied and decoded as a whole; the map is closed when the iteration
+    finishes or is abandoned.
+
+    Args:
+        schematic_path: Path to .kicad_sch file
+        head: Head atom of the sections (e.g. b"lib_symbols", b"symbol")
+
+    Yields:
+        The S-expression of each matching section, in file order
+    """
+    with Path(schematic_path).open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            yield from _iter_sections(content, head)
+
+
+def _find_section(content: bytes | mmap.mmap, head: bytes) -> tuple[int, int] | None:
+    """Locate the first section with the given head inside the root list.
+
+    Args:
+        content: Raw contents of a .kicad_sch file
+        head: Head atom of the section (e.g. b"lib_symbols")
+
+    Returns:
+        (start, end) offsets of the section's contents after the head atom,
+        including its closing paren, or None if there is no such section
+    """
+    tokens = _SEXP_TOKEN_RE.finditer(content)
+    depth = 0
+    after_open = False
+    for match in tokens:
+        opening, closing, _, atom = match.groups()
+        if match.lastindex is None:  # Comment
+            continue
+        if opening:
+            depth += 1
+        elif closing:
+            depth -= 1
+        elif after_open and depth == _SECTION_DEPTH and atom == head:
+            for inner in _SEXP_NESTING_RE.finditer(content, match.end()):
+                if inner.group(1):
+                    depth += 1
+                elif inner.group(2):
+                    depth -= 1
+                    if depth < _SECTION_DEPTH:
+                        return match.end(), inner.end()
+            return None
+        after_open = bool(opening)
+    return None
 
-    @staticmethod
-    def _create_pin_data(sexp: list[Any]) -> dict[str, Any]:
-        """Create initial pin data structure with default values.
 
-        Args:
-            sexp: Pin S-expression
+def _read_lib_symbols_section(schematic_path: str) -> bytes | None:
+    """Read the raw contents of a schematic's (lib_symbols ...) section.
 
-        Returns:
-            Pin data dictionary with defaults
-        """
-        return {
-            "x": 0,
-            "y": 0,
-            "angle": 0,
-            "length": 0,
-            "name": "",
-            "number": "",
-            "type": str(sexp[1]) if len(sexp) > 1 else "passive",
-        }
+    Scanning stops once the section closes; KiCAD writes lib_symbols near
+    the top of the file, before instances, wires and labels.
 
-    @staticmethod
-    def _extract_pin_attributes(sexp: list[Any], pin_data: dict[str, Any]) -> None:
-        """Extract pin attributes from S-expression.
+    Args:
+        schematic_path: Path to .kicad_sch file
 
-        Args:
-            sexp: Pin S-expression
-            pin_data: Pin data dictionary to populate (modified in place)
-        """
-        for item in sexp:
-            if not isinstance(item, list) or len(item) == 0:
+    Returns:
+        The section after its head atom, or None if the schematic has none
+    """
+    with Path(schematic_path).open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            span = _find_section(content, b"lib_symbols")
+            return None if span is None else content[span[0] : span[1]]
+
+
+def _lib_pins_cache_path(lib_symbols: bytes) -> Path:
+    """Get the persistent cache file for the pins of a lib_symbols section.
+
+    Args:
+        lib_symbols: Raw lib_symbols section
+
+    Returns:
+        Path of the JSON file named after the section's content hash
+    """
+    digest = hashlib.blake2b(lib_symbols, digest_size=16).hexdigest()
+    cache_dir = PlatformHelper.get_cache_dir() / _LIB_PINS_CACHE_DIR
+    return cache_dir / f"{digest}.v{_LIB_PINS_FORMAT}.json"
+
+
+def _store_lib_pins(cache_path: Path, lib_pins: dict[str, dict[str, dict[str, Any]]]) -> None:
+    """Write pin definitions to the persistent cache, replacing the file atomically.
+
+    Args:
+        cache_path: Cache file from _lib_pins_cache_path
+        lib_pins: Pin definitions by lib_id
+    """
+    temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path.write_text(json.dumps(lib_pins), encoding="utf-8")
+        temp_path.replace(cache_path)
+    except OSError as e:
+        logger.debug("Could not cache pin definitions at %s: %s", cache_path, e)
+        return
+    _prune_lib_pins_cache(cache_path.parent)
+
+
+def _prune_lib_pins_cache(cache_dir: Path) -> None:
+    """Delete the least recently used pin cache files past _LIB_PINS_CACHE_LIMIT.
+
+    Cache hits refresh a file's mtime, so the oldest mtimes go first.
+
+    Args:
+        cache_dir: Directory holding the pin cache files
+    """
+    try:
+        with os.scandir(cache_dir) as entries:
+            cached = [
+                (entry.stat().st_mtime, entry.path)
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
+    except OSError as e:
+        logger.debug("Could not list pin cache at %s: %s", cache_dir, e)
+        return
+
+    if len(cached) <= _LIB_PINS_CACHE_LIMIT:
+        return
+    cached.sort()
+    for _mtime, path in cached[: len(cached) - _LIB_PINS_CACHE_LIMIT]:
+        with contextlib.suppress(OSError):  # Already removed by another process
+            os.remove(path)  # noqa: PTH107
+
+
+@lru_cache(maxsize=_SCHEMATIC_CACHE_SIZE)
+def _index_symbol_instances(schematic_key: SchematicKey) -> dict[str, SymbolInstance]:
+    """Map reference -> placement for the symbol instances of a schematic.
+
+    Built in one scan of the file and cached until it changes, so each
+    instance lookup is a dict access.
+
+    Args:
+        schematic_key: Schematic version from _schematic_key
+
+    Returns:
+        Dictionary of (x, y, rotation, lib_id) by reference designator (first
+        instance wins); lib_id is "" if the instance has none
+    """
+    instances: dict[str, SymbolInstance] = {}
+    for symbol in _iter_schematic_sections(schematic_key[0], b"symbol"):
+        reference = None
+        position = (0.0, 0.0, 0.0)
+        lib_id = ""
+        for item in symbol[1:]:
+            if not isinstance(item, list) or len(item) < 2:  # noqa: PLR2004
                 continue
-
-            if item[0] == Symbol("at") and len(item) >= 3:  # noqa: PLR2004
-                pin_data["x"] = float(item[1])
-                pin_data["y"] = float(item[2])
+            # Heads are interned by _read_list
+            head = item[0]
+            if head is _LIB_ID:
+                lib_id = str(item[1])
+            elif head is _AT and len(item) >= 3:  # noqa: PLR2004
+                rotation = float(item[3]) if len(item) > 3 else 0.0  # noqa: PLR2004
+                position = (float(item[1]), float(item[2]), rotation)
+            elif head is _PROPERTY and len(item) >= 3 and item[1] == "Reference":  # noqa: PLR2004
+                reference = str(item[2])
+        if reference is not None:
+            instances.setdefault(reference, (*position, lib_id))
+    return instances
+
+
+@lru_cache(maxsize=_SCHEMATIC_CACHE_SIZE)
+def _index_lib_pins(
+    schematic_key: SchematicKey,
+) -> dict[str, dict[str, dict[str, Any]]] | None:
+    """Map lib_id -> pin definitions for a schematic's lib_symbols section.
+
+    Cached in memory until the file changes, and on disk by the content of
+    the section: editing wires or instances leaves lib_symbols untouched, and
+    sheets and projects using the same symbols share one cache file.
+
+    Args:
+        schematic_key: Schematic version from _schematic_key
+
+    Returns:
+        Dictionary of pin definitions by lib_id (first definition wins), or
+        None if the schematic has no lib_symbols section
+    """
+    section = _read_lib_symbols_section(schematic_key[0])
+    if section is None:
+        return None
+
+    cache_path = _lib_pins_cache_path(section)
+    try:
+        lib_pins = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError) as e:
+        logger.debug("No cached pin definitions at %s: %s", cache_path, e)
+    else:
+        # Mark the file recently used so pruning keeps it
+        with contextlib.suppress(OSError):
+            os.utime(cache_path)
+        return lib_pins
+
+    lib_symbols = _read_list(_SEXP_TOKEN_RE.finditer(section), Symbol("lib_symbols"))
+    lib_pins: dict[str, dict[str, dict[str, Any]]] = {}
+    for symbol_def in lib_symbols[1:]:  # Skip 'lib_symbols' itself
+        if isinstance(symbol_def, list) and len(symbol_def) > 1 and symbol_def[0] == _SYMBOL:
+            lib_id = str(symbol_def[1]).strip('"')
+            if lib_id not in lib_pins:
+                lib_pins[lib_id] = PinLocator.parse_symbol_definition(symbol_def)
+    _store_lib_pins(cache_path, lib_pins)
+    return lib_pins
+
+
+@lru_cache(maxsize=64)
+def _rotation_terms(angle_degrees: float) -> tuple[float, float]:
+    """Get (cos, sin) of a rotation, exact for multiples of 90 degrees.
+
+    Args:
+        angle_degrees: Rotation angle in degrees (counterclockwise)
+
+    Returns:
+        (cos, sin) of the angle
+    """
+    terms = _RIGHT_ANGLE_ROTATIONS.get(angle_degrees % 360)
+    if terms is not None:
+        return terms
+    angle_rad = math.radians(angle_degrees)
+    return (math.cos(angle_rad), math.sin(angle_rad))
+
+
+def _read_pin(sexp: list[Any]) -> dict[str, Any] | None:
+    """Read a (pin TYPE STYLE (at X Y ANGLE) (length L) (name N) (number #)) definition.
+
+    Args:
+        sexp: Pin S-expression
+
+    Returns:
+        Pin data dictionary, with defaults for missing attributes, or None if
+        the pin has no number
+    """
+    x = y = angle = length = 0.0
+    name = number = ""
+    for item in sexp:
+        if not isinstance(item, list) or len(item) < 2:  # noqa: PLR2004
+            continue
+
+        head = item[0]
+        if head == _AT:
+            if len(item) >= 3:  # noqa: PLR2004
+                x = float(item[1])
+                y = float(item[2])
                 if len(item) >= 4:  # noqa: PLR2004
-                    pin_data["angle"] = float(item[3])
+                    angle = float(item[3])
+        elif head == _NUMBER:
+            number = str(item[1]).strip('"')
+        elif head == _NAME:
+            name = str(item[1]).strip('"')
+        elif head == _LENGTH:
+            length = float(item[1])
+
+    if not number:
+        return None
+    return {
+        "x": x,
+        "y": y,
+        "angle": angle,
+        "length": length,
+        "name": name,
+        "number": number,
+        "type": str(sexp[1]) if len(sexp) > 1 else "passive",
+    }
 
-            elif item[0] == Symbol("length") and len(item) >= 2:  # noqa: PLR2004
-                pin_data["length"] = float(item[1])
 
-            elif item[0] == Symbol("name") and len(item) >= 2:  # noqa: PLR2004
-                pin_data["name"] = str(item[1]).strip('"')
+class PinLocator:
+    """Locate pins on symbol instances in KiCad schematics."""
 
-            elif item[0] == Symbol("number") and len(item) >= 2:  # noqa: PLR2004
-                pin_data["number"] = str(item[1]).strip('"')
+    def __init__(self) -> None:
+        """Initialize pin locator with empty cache."""
+        # "path:lib_id" -> (schematic version the pins were read from, pins)
+        self.pin_definition_cache: dict[str, tuple[SchematicKey, dict[str, dict[str, Any]]]] = {}
 
     @staticmethod
-    def _extract_pins_recursive(sexp: SExpression, pins: dict[str, dict[str, Any]]) -> None:
-        """Recursively search for pin definitions in S-expression.
+    def _extract_pins(sexp: SExpression, pins: dict[str, dict[str, Any]]) -> None:
+        """Search a symbol definition for pin definitions.
+
+        Walks the tree depth-first with an explicit stack rather than one
+        Python call per nested list. Pins only occur directly inside a
+        (symbol ...) or its unit sub-symbols, so only symbol lists are
+        descended into; properties, graphics and pin contents are skipped.
 
         Args:
             sexp: S-expression to search through
             pins: Dictionary to store found pins (modified in place)
         """
-        if not isinstance(sexp, list):
-            return
-
-        # Check if this is a pin definition
-        if PinLocator._is_pin_definition(sexp):
-            pin_data = PinLocator._create_pin_data(sexp)
-            PinLocator._extract_pin_attributes(sexp, pin_data)
+        stack = [sexp]
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, list) or not node:
+                continue
 
-            # Store by pin number
-            if pin_data["number"]:
-                pins[pin_data["number"]] = pin_data
+            # Check if this is a pin definition, stored by pin number
+            head = node[0]
+            if head == _PIN:
+                pin_data = _read_pin(node)
+                if pin_data is not None:
+                    pins[pin_data["number"]] = pin_data
 
-        # Recurse into sublists
-        for item in sexp:
-            if isinstance(item, list):
-                PinLocator._extract_pins_recursive(item, pins)
+            # Visit a symbol's sublists next, in document order
+            elif head == _SYMBOL:
+                stack.extend([item for item in reversed(node) if isinstance(item, list)])
 
     @staticmethod
     def parse_symbol_definition(symbol_def: Sequence[Any]) -> dict[str, dict[str, Any]]:
@@ -131,7 +487,7 @@ class PinLocator:
             }
         """
         pins: dict[str, dict[str, Any]] = {}
-        PinLocator._extract_pins_recursive(list(symbol_def), pins)
+        PinLocator._extract_pins(list(symbol_def), pins)
         return pins
 
     def get_symbol_pins(self, schematic_path: Path, lib_id: str) -> dict[str, dict[str, Any]]:
@@ -144,40 +500,44 @@ class PinLocator:
         Returns:
             Dictionary mapping pin number -> pin data
         """
-        # Check cache
-        cache_key = f"{schematic_path}:{lib_id}"
-        if cache_key in self.pin_definition_cache:
-            logger.debug("Using cached pin data for %s", lib_id)
-            return self.pin_definition_cache[cache_key]
-
         try:
-            # Read schematic
-            with schematic_path.open(encoding="utf-8") as f:
-                sch_content = f.read()
+            schematic_key = _schematic_key(schematic_path)
+        except OSError:
+            logger.exception("Error reading schematic %s", schematic_path)
+            return {}
+        return self._get_symbol_pins(schematic_key, lib_id)
+
+    def _get_symbol_pins(
+        self, schematic_key: SchematicKey, lib_id: str
+    ) -> dict[str, dict[str, Any]]:
+        """Get pin definitions for a symbol in one version of a schematic.
 
-            sch_data = sexpdata.loads(sch_content)
+        Args:
+            schematic_key: Schematic version from _schematic_key
+            lib_id: Library identifier
 
-            # Find lib_symbols section
-            lib_symbols = None
-            for item in sch_data:
-                if isinstance(item, list) and len(item) > 0 and item[0] == Symbol("lib_symbols"):
-                    lib_symbols = item
-                    break
+        Returns:
+            Dictionary mapping pin number -> pin data
+        """
+        # Check cache
+        cache_key = f"{schematic_key[0]}:{lib_id}"
+        cached = self.pin_definition_cache.get(cache_key)
+        if cached is not None and cached[0] == schematic_key:
+            logger.debug("Using cached pin data for %s", lib_id)
+            return cached[1]
 
-            if not lib_symbols:
+        try:
+            lib_pins = _index_lib_pins(schematic_key)
+            if not lib_pins:
                 logger.error("No lib_symbols section found in schematic")
                 return {}
 
             # Find the specific symbol definition
-            for item in lib_symbols[1:]:  # Skip 'lib_symbols' itself
-                if isinstance(item, list) and len(item) > 1 and item[0] == Symbol("symbol"):
-                    symbol_name = str(item[1]).strip('"')
-                    if symbol_name == lib_id:
-                        # Found the symbol, parse pins
-                        pins = self.parse_symbol_definition(item)
-                        self.pin_definition_cache[cache_key] = pins
-                        logger.info("Extracted %d pins from %s", len(pins), lib_id)
-                        return pins
+            pins = lib_pins.get(lib_id)
+            if pins is not None:
+                self.pin_definition_cache[cache_key] = (schematic_key, pins)
+                logger.info("Extracted %d pins from %s", len(pins), lib_id)
+                return pins
 
             logger.warning("Symbol %s not found in lib_symbols", lib_id)
 
@@ -198,18 +558,57 @@ class PinLocator:
         Returns:
             (rotated_x, rotated_y)
         """
-        if angle_degrees == 0:
+        # KiCAD places symbols at right angles: swap and negate, no trig
+        quadrant = angle_degrees % 360
+        if quadrant == 0:
             return (x, y)
+        if quadrant == 90:  # noqa: PLR2004
+            return (-y, x)
+        if quadrant == 180:  # noqa: PLR2004
+            return (-x, -y)
+        if quadrant == 270:  # noqa: PLR2004
+            return (y, -x)
 
-        angle_rad = math.radians(angle_degrees)
-        cos_a = math.cos(angle_rad)
-        sin_a = math.sin(angle_rad)
+        cos_a, sin_a = _rotation_terms(angle_degrees)
 
         rotated_x = x * cos_a - y * sin_a
         rotated_y = x * sin_a + y * cos_a
 
         return (rotated_x, rotated_y)
 
+    @staticmethod
+    def _find_symbol_instance(
+        schematic_key: SchematicKey, symbol_reference: str
+    ) -> SymbolInstance | None:
+        """Find the placement and lib_id of a symbol instance.
+
+        Args:
+            schematic_key: Schematic version from _schematic_key
+            symbol_reference: Symbol reference designator (e.g., "R1", "U1")
+
+        Returns:
+            (x, y, rotation, lib_id) of the instance, or None if not found
+        """
+        instance = _index_symbol_instances(schematic_key).get(symbol_reference)
+        if instance is None:
+            logger.error("Symbol %s not found in schematic", symbol_reference)
+            return None
+
+        symbol_x, symbol_y, symbol_rotation, lib_id = instance
+        if not lib_id:
+            logger.error("Symbol %s has no lib_id", symbol_reference)
+            return None
+
+        logger.debug(
+            "Symbol %s: pos=(%s, %s), rot=%s, lib_id=%s",
+            symbol_reference,
+            symbol_x,
+            symbol_y,
+            symbol_rotation,
+            lib_id,
+        )
+        return symbol_x, symbol_y, symbol_rotation, lib_id
+
     def get_pin_location(
         self, schematic_path: Path, symbol_reference: str, pin_number: str
     ) -> list[float] | None:
@@ -224,44 +623,14 @@ class PinLocator:
             [x, y] absolute coordinates of the pin, or None if not found
         """
         try:
-            # Load schematic with kicad-skip to get symbol instance
-            sch = Schematic(str(schematic_path))
-
-            # Find the symbol instance
-            target_symbol = None
-            for symbol in sch.symbol:
-                ref = symbol.property.Reference.value
-                if ref == symbol_reference:
-                    target_symbol = symbol
-                    break
-
-            if not target_symbol:
-                logger.error("Symbol %s not found in schematic", symbol_reference)
-                return None
-
-            # Get symbol position and rotation
-            symbol_at = target_symbol.at.value
-            symbol_x = float(symbol_at[0])
-            symbol_y = float(symbol_at[1])
-            symbol_rotation = float(symbol_at[2]) if len(symbol_at) > 2 else 0.0  # noqa: PLR2004
-
-            # Get symbol lib_id
-            lib_id = target_symbol.lib_id.value if hasattr(target_symbol, "lib_id") else None
-            if not lib_id:
-                logger.error("Symbol %s has no lib_id", symbol_reference)
+            schematic_key = _schematic_key(schematic_path)
+            instance = self._find_symbol_instance(schematic_key, symbol_reference)
+            if instance is None:
                 return None
-
-            logger.debug(
-                "Symbol %s: pos=(%s, %s), rot=%s, lib_id=%s",
-                symbol_reference,
-                symbol_x,
-                symbol_y,
-                symbol_rotation,
-                lib_id,
-            )
+            symbol_x, symbol_y, symbol_rotation, lib_id = instance
 
             # Get pin definitions for this symbol
-            pins = self.get_symbol_pins(schematic_path, lib_id)
+            pins = self._get_symbol_pins(schematic_key, lib_id)
             if not pins:
                 logger.error("No pin definitions found for %s", lib_id)
                 return None
@@ -284,14 +653,10 @@ class PinLocator:
 
             logger.debug("Pin %s relative position: (%s, %s)", pin_number, pin_rel_x, pin_rel_y)
 
-            # Apply symbol rotation to pin position
-            if symbol_rotation != 0:
-                pin_rel_x, pin_rel_y = self.rotate_point(pin_rel_x, pin_rel_y, symbol_rotation)
-                logger.debug("After rotation %s deg: (%s, %s)", symbol_rotation, pin_rel_x, pin_rel_y)
-
-            # Calculate absolute position
-            abs_x = symbol_x + pin_rel_x
-            abs_y = symbol_y + pin_rel_y
+            # Apply symbol rotation and position to the pin
+            cos_a, sin_a = _rotation_terms(symbol_rotation)
+            abs_x = symbol_x + pin_rel_x * cos_a - pin_rel_y * sin_a
+            abs_y = symbol_y + pin_rel_x * sin_a + pin_rel_y * cos_a
 
             logger.info("Pin %s/%s located at (%s, %s)", symbol_reference, pin_number, abs_x, abs_y)
             return [abs_x, abs_y]
@@ -313,37 +678,28 @@ class PinLocator:
             Dictionary mapping pin number -> [x, y] coordinates
         """
         try:
-            # Load schematic
-            sch = Schematic(str(schematic_path))
-
-            # Find symbol
-            target_symbol = None
-            for symbol in sch.symbol:
-                if symbol.property.Reference.value == symbol_reference:
-                    target_symbol = symbol
-                    break
-
-            if not target_symbol:
-                logger.error("Symbol %s not found", symbol_reference)
-                return {}
-
-            # Get lib_id
-            lib_id = target_symbol.lib_id.value if hasattr(target_symbol, "lib_id") else None
-            if not lib_id:
-                logger.error("Symbol %s has no lib_id", symbol_reference)
+            # Resolve the instance and its pins once for every pin
+            schematic_key = _schematic_key(schematic_path)
+            instance = self._find_symbol_instance(schematic_key, symbol_reference)
+            if instance is None:
                 return {}
+            symbol_x, symbol_y, symbol_rotation, lib_id = instance
 
             # Get pin definitions
-            pins = self.get_symbol_pins(schematic_path, lib_id)
+            pins = self._get_symbol_pins(schematic_key, lib_id)
             if not pins:
                 return {}
 
-            # Calculate location for each pin
+            # Apply the instance's rotation and position to every pin
+            cos_a, sin_a = _rotation_terms(symbol_rotation)
             result: dict[str, list[float]] = {}
-            for pin_num in pins:
-                location = self.get_pin_location(schematic_path, symbol_reference, pin_num)
-                if location:
-                    result[pin_num] = location
+            for pin_num, pin_data in pins.items():
+                pin_rel_x = pin_data["x"]
+                pin_rel_y = pin_data["y"]
+                result[pin_num] = [
+                    symbol_x + pin_rel_x * cos_a - pin_rel_y * sin_a,
+                    symbol_y + pin_rel_x * sin_a + pin_rel_y * cos_a,
+                ]
 
             logger.info("Located %d pins on %s", len(result), symbol_reference)
             return result
@@ -1,15 +1,37 @@
 """Project-related command implementations for KiCAD interface."""
 
 from datetime import UTC, datetime
+from functools import lru_cache
+import json
 import logging
 from pathlib import Path
-import shutil
 from typing import Any
 
 import pcbnew  # type: ignore[import-untyped]
 
 logger = logging.getLogger("kicad_interface")
 
+# Schematic copied into new projects (expanded template with many component types)
+_TEMPLATE_SCHEMATIC_PATH = (
+    Path(__file__).parent / ".." / "templates" / "template_with_symbols_expanded.kicad_sch"
+).resolve()
+
+
+@lru_cache(maxsize=1)
+def _template_schematic_bytes() -> bytes:
+    """Read the new-project schematic template once per process.
+
+    A failed read raises instead of being cached, so a template restored
+    later is picked up by the next project.
+
+    Returns:
+        Contents of the template
+
+    Raises:
+        OSError: If the template is missing or unreadable
+    """
+    return _TEMPLATE_SCHEMATIC_PATH.read_bytes()
+
 
 class ProjectCommands:
     """Handles project-related KiCAD operations."""
@@ -39,8 +61,8 @@ class ProjectCommands:
 
             # Generate the full project path
             project_path = Path(path) / project_name
-            if not str(project_path).endswith(".kicad_pro"):
-                project_path = Path(f"{project_path}.kicad_pro")
+            if project_path.suffix != ".kicad_pro":
+                project_path = project_path.with_name(f"{project_path.name}.kicad_pro")
 
             # Create project directory if it doesn't exist
             project_path.parent.mkdir(parents=True, exist_ok=True)
@@ -65,25 +87,19 @@ class ProjectCommands:
                     board.SetLayerStack(template_board.GetLayerStack())
 
             # Save the board
-            board_path = Path(str(project_path).replace(".kicad_pro", ".kicad_pcb"))
+            board_path = project_path.with_suffix(".kicad_pcb")
             board.SetFileName(str(board_path))
             pcbnew.SaveBoard(str(board_path), board)
 
-            # Create schematic from template (use expanded template with many component types)
-            schematic_path = Path(str(project_path).replace(".kicad_pro", ".kicad_sch"))
-            template_sch_path = (
-                Path(__file__).parent / ".." / "templates" / "template_with_symbols_expanded.kicad_sch"
-            ).resolve()
-
-            if template_sch_path.exists():
-                # Copy template schematic
-                shutil.copy(template_sch_path, schematic_path)
-                logger.info("Created schematic from template: %s", schematic_path)
-            else:
+            # Create schematic from template
+            schematic_path = project_path.with_suffix(".kicad_sch")
+            try:
+                template_sch = _template_schematic_bytes()
+            except OSError:
                 # Fallback: create minimal schematic
                 logger.warning(
                     "Template not found at %s, creating minimal schematic",
-                    template_sch_path,
+                    _TEMPLATE_SCHEMATIC_PATH,
                 )
                 schematic_path.write_text(
                     '(kicad_sch (version 20230121) (generator "KiCAD-MCP-Server")\n\n'
@@ -93,19 +109,17 @@ class ProjectCommands:
                     '  (sheet_instances\n    (path "/" (page "1"))\n  )\n'
                     ")\n"
                 )
+            else:
+                # Copy template schematic
+                schematic_path.write_bytes(template_sch)
+                logger.info("Created schematic from template: %s", schematic_path)
 
             # Create project file with schematic reference
-            project_content = (
-                "{\n"
-                '  "board": {\n'
-                f'    "filename": "{board_path.name}"\n'
-                "  },\n"
-                '  "sheets": [\n'
-                f'    ["root", "{schematic_path.name}"]\n'
-                "  ]\n"
-                "}\n"
-            )
-            project_path.write_text(project_content)
+            project_content = {
+                "board": {"filename": board_path.name},
+                "sheets": [["root", schematic_path.name]],
+            }
+            project_path.write_text(json.dumps(project_content, indent=2) + "\n", encoding="utf-8")
 
             self.board = board
 
@@ -150,8 +164,8 @@ class ProjectCommands:
             file_path = Path(filename).expanduser().resolve()
 
             # If it's a project file, get the board file
-            if str(file_path).endswith(".kicad_pro"):
-                board_path = Path(str(file_path).replace(".kicad_pro", ".kicad_pcb"))
+            if file_path.suffix == ".kicad_pro":
+                board_path = file_path.with_suffix(".kicad_pcb")
             else:
                 board_path = file_path
 
@@ -1,5 +1,6 @@
 """Routing-related command implementations for KiCAD interface."""
 
+from collections.abc import Iterator
 import logging
 import math
 from typing import Any
@@ -14,6 +15,34 @@ MIN_POLYGON_POINTS = 3
 # Track search radius in nanometers (KiCAD internal unit: 1mm = 1,000,000 nm)
 TRACK_SEARCH_RADIUS_NM = 1_000_000  # 1mm
 
+# Nanometers per coordinate unit (KiCAD internal unit); any unit other than
+# "mm" is taken as inches
+_NM_PER_UNIT = {"mm": 1_000_000, "inch": 25_400_000}
+_NM_PER_INCH = _NM_PER_UNIT["inch"]
+
+# Cell size of the spatial grid over track bounding boxes, in nanometers
+TRACK_GRID_CELL_NM = 10_000_000  # 10mm
+
+# (tracks in board order, grid cell -> indices of the tracks overlapping it)
+TrackGrid = tuple[list[pcbnew.PCB_TRACK], dict[tuple[int, int], list[int]]]
+
+
+def _grid_cells(left: int, top: int, right: int, bottom: int) -> Iterator[tuple[int, int]]:
+    """Yield the TRACK_GRID_CELL_NM grid cells overlapping a rectangle.
+
+    Args:
+        left: Left edge in nanometers.
+        top: Top edge in nanometers.
+        right: Right edge in nanometers.
+        bottom: Bottom edge in nanometers.
+
+    Yields:
+        (column, row) of each cell.
+    """
+    for column in range(left // TRACK_GRID_CELL_NM, right // TRACK_GRID_CELL_NM + 1):
+        for row in range(top // TRACK_GRID_CELL_NM, bottom // TRACK_GRID_CELL_NM + 1):
+            yield column, row
+
 
 class RoutingCommands:
     """Handles routing-related KiCAD operations."""
@@ -21,6 +50,65 @@ class RoutingCommands:
     def __init__(self, board: pcbnew.BOARD | None = None) -> None:
         """Initialize with optional board instance."""
         self.board = board
+        # Lookups into _cache_board, each built on first use
+        self._cache_board: pcbnew.BOARD | None = None
+        self._uuid_index: dict[str, pcbnew.PCB_TRACK] | None = None
+        self._track_grid: TrackGrid | None = None
+        self._nets_map: Any | None = None
+
+    def _sync_board_caches(self) -> None:
+        """Drop the cached lookups if they were built for another board."""
+        if self._cache_board is not self.board:
+            self._invalidate_track_index()
+            self._nets_map = None
+            self._cache_board = self.board
+
+    def _nets_by_name(self) -> Any:  # noqa: ANN401
+        """Get the current board's net name -> NETINFO_ITEM map, fetching it once.
+
+        Returns:
+            The board's NetsByName() map.
+        """
+        self._sync_board_caches()
+        if self._nets_map is None:
+            self._nets_map = self.board.GetNetInfo().NetsByName()
+        return self._nets_map
+
+    def _get_uuid_index(self) -> dict[str, pcbnew.PCB_TRACK]:
+        """Get the UUID -> track index of the current board, building it if needed.
+
+        Returns:
+            Dictionary mapping UUID strings to the board's tracks and vias.
+        """
+        self._sync_board_caches()
+        if self._uuid_index is None:
+            self._uuid_index = {str(track.m_Uuid): track for track in self.board.Tracks()}
+        return self._uuid_index
+
+    def _get_track_grid(self) -> TrackGrid:
+        """Get a spatial grid over the current board's tracks, building it if needed.
+
+        Returns:
+            Tuple of (tracks in board order, grid cell -> indices of the tracks
+            whose bounding box overlaps the cell).
+        """
+        self._sync_board_caches()
+        if self._track_grid is None:
+            tracks = list(self.board.Tracks())
+            cells: dict[tuple[int, int], list[int]] = {}
+            for i, track in enumerate(tracks):
+                bbox = track.GetBoundingBox()
+                for cell in _grid_cells(
+                    bbox.GetLeft(), bbox.GetTop(), bbox.GetRight(), bbox.GetBottom()
+                ):
+                    cells.setdefault(cell, []).append(i)
+            self._track_grid = (tracks, cells)
+        return self._track_grid
+
+    def _invalidate_track_index(self) -> None:
+        """Drop the track indexes after tracks are added to or removed from the board."""
+        self._uuid_index = None
+        self._track_grid = None
 
     def _apply_netclass_properties(
         self, netclass: pcbnew.NETCLASS, params: dict[str, Any]
@@ -61,8 +149,7 @@ class RoutingCommands:
             netclass: The netclass to assign nets to.
             net_names: List of net names to assign.
         """
-        netinfo = self.board.GetNetInfo()
-        nets_map = netinfo.NetsByName()
+        nets_map = self._nets_by_name()
         for net_name in net_names:
             if net_name in nets_map:
                 net = nets_map[net_name]
@@ -89,13 +176,13 @@ class RoutingCommands:
                 }
 
             # Create new net
-            netinfo = self.board.GetNetInfo()
-            nets_map = netinfo.NetsByName()
+            nets_map = self._nets_by_name()
             if name in nets_map:
                 net = nets_map[name]
             else:
                 net = pcbnew.NETINFO_ITEM(self.board, name)
                 self.board.Add(net)
+                self._nets_map = None
 
             # Set net class if provided
             if net_class:
@@ -168,14 +255,14 @@ class RoutingCommands:
 
             # Set net if provided
             if net:
-                netinfo = self.board.GetNetInfo()
-                nets_map = netinfo.NetsByName()
+                nets_map = self._nets_by_name()
                 if net in nets_map:
                     net_obj = nets_map[net]
                     track.SetNet(net_obj)
 
             # Add track to board
             self.board.Add(track)
+            self._invalidate_track_index()
 
             # Add via if requested and net is specified
             if via and net:
@@ -239,10 +326,7 @@ class RoutingCommands:
             via = pcbnew.PCB_VIA(self.board)
 
             # Set position
-            scale = 1000000 if position["unit"] == "mm" else 25400000  # mm or inch to nm
-            x_nm = int(position["x"] * scale)
-            y_nm = int(position["y"] * scale)
-            via.SetPosition(pcbnew.VECTOR2I(x_nm, y_nm))
+            via.SetPosition(self._point_to_vec2i(position))
 
             # Set size and drill (default to board's current via settings)
             design_settings = self.board.GetDesignSettings()
@@ -262,14 +346,14 @@ class RoutingCommands:
 
             # Set net if provided
             if net:
-                netinfo = self.board.GetNetInfo()
-                nets_map = netinfo.NetsByName()
+                nets_map = self._nets_by_name()
                 if net in nets_map:
                     net_obj = nets_map[net]
                     via.SetNet(net_obj)
 
             # Add via to board
             self.board.Add(via)
+            self._invalidate_track_index()
 
             return {
                 "success": True,
@@ -307,6 +391,7 @@ class RoutingCommands:
             }
 
         self.board.Remove(track)
+        self._invalidate_track_index()
         return {"success": True, "message": f"Deleted track: {trace_uuid}"}
 
     def _delete_trace_by_position(self, position: dict[str, Any]) -> dict[str, Any]:
@@ -318,15 +403,13 @@ class RoutingCommands:
         Returns:
             Success/failure dictionary.
         """
-        scale = 1000000 if position["unit"] == "mm" else 25400000  # mm or inch to nm
-        x_nm = int(position["x"] * scale)
-        y_nm = int(position["y"] * scale)
-        point = pcbnew.VECTOR2I(x_nm, y_nm)
+        point = self._point_to_vec2i(position)
 
         closest_track, min_distance = self._find_closest_track(point)
 
         if closest_track and min_distance < TRACK_SEARCH_RADIUS_NM:  # Within 1mm
             self.board.Remove(closest_track)
+            self._invalidate_track_index()
             return {"success": True, "message": "Deleted track at specified position"}
 
         return {
@@ -344,28 +427,52 @@ class RoutingCommands:
         Returns:
             Track object if found, None otherwise.
         """
-        for item in self.board.Tracks():
-            if str(item.m_Uuid) == trace_uuid:
-                return item
-        return None
+        return self._get_uuid_index().get(trace_uuid)
 
     def _find_closest_track(self, point: pcbnew.VECTOR2I) -> tuple[pcbnew.PCB_TRACK | None, float]:
         """Find the track closest to a given point.
 
+        Candidates come from the grid cells within TRACK_SEARCH_RADIUS_NM of
+        the point, and only those whose bounding box, grown by that radius,
+        contains the point are measured; any other track is at least that
+        far away.
+
         Args:
             point: Point to search near.
 
         Returns:
-            Tuple of (closest_track, min_distance). Track may be None if no tracks exist.
+            Tuple of (closest_track, min_distance). Track may be None if no
+            track lies within TRACK_SEARCH_RADIUS_NM.
         """
         closest_track = None
         min_distance = float("inf")
 
-        for track in self.board.Tracks():
+        tracks, cells = self._get_track_grid()
+        candidates = {
+            i
+            for cell in _grid_cells(
+                point.x - TRACK_SEARCH_RADIUS_NM,
+                point.y - TRACK_SEARCH_RADIUS_NM,
+                point.x + TRACK_SEARCH_RADIUS_NM,
+                point.y + TRACK_SEARCH_RADIUS_NM,
+            )
+            for i in cells.get(cell, ())
+        }
+
+        # Visit candidates in board order, so ties resolve as before
+        for i in sorted(candidates):
+            track = tracks[i]
+            bbox = track.GetBoundingBox()
+            bbox.Inflate(TRACK_SEARCH_RADIUS_NM)
+            if not bbox.Contains(point):
+                continue
+
             dist = self._point_to_track_distance(point, track)
             if dist < min_distance:
                 min_distance = dist
                 closest_track = track
+                if dist == 0:
+                    break
 
         return closest_track, min_distance
 
@@ -528,8 +635,7 @@ class RoutingCommands:
 
             # Set net if provided
             if net:
-                netinfo = self.board.GetNetInfo()
-                nets_map = netinfo.NetsByName()
+                nets_map = self._nets_by_name()
                 if net in nets_map:
                     net_obj = nets_map[net]
                     zone.SetNet(net_obj)
@@ -549,16 +655,12 @@ class RoutingCommands:
             else:
                 zone.SetFillMode(pcbnew.ZONE_FILL_MODE_POLYGONS)
 
-            # Create outline
-            outline = zone.Outline()
-            outline.NewOutline()  # Create a new outline contour first
-
-            # Add points to outline
+            # Build the closed outline contour, then hand it to the zone at once
+            chain = pcbnew.SHAPE_LINE_CHAIN()
             for point in points:
-                scale = 1000000 if point.get("unit", "mm") == "mm" else 25400000
-                x_nm = int(point["x"] * scale)
-                y_nm = int(point["y"] * scale)
-                outline.Append(pcbnew.VECTOR2I(x_nm, y_nm))  # Add point to outline
+                chain.Append(self._point_to_vec2i(point))
+            chain.SetClosed(True)  # noqa: FBT003
+            zone.Outline().AddOutline(chain)
 
             # Add zone to board
             self.board.Add(zone)
@@ -617,6 +719,7 @@ class RoutingCommands:
             # Add to board and return response
             self.board.Add(pos_track)
             self.board.Add(neg_track)
+            self._invalidate_track_index()
             return self._build_diff_pair_response(
                 validated["net_pos"],
                 validated["net_neg"],
@@ -694,8 +797,7 @@ class RoutingCommands:
         Returns:
             Dict with net_pos_obj and net_neg_obj, or dict with 'error' key.
         """
-        netinfo = self.board.GetNetInfo()
-        nets_map = netinfo.NetsByName()
+        nets_map = self._nets_by_name()
 
         net_pos_obj = nets_map.get(net_pos, None)
         net_neg_obj = nets_map.get(net_neg, None)
@@ -721,11 +823,13 @@ class RoutingCommands:
         """
         start_point = self._get_point(start_pos)
         end_point = self._get_point(end_pos)
+        start_x, start_y = start_point.x, start_point.y
+        end_x, end_y = end_point.x, end_point.y
 
         # Calculate direction vector
-        dx = end_point.x - start_point.x
-        dy = end_point.y - start_point.y
-        length = math.sqrt(dx * dx + dy * dy)
+        dx = end_x - start_x
+        dy = end_y - start_y
+        length = math.hypot(dx, dy)
 
         if length <= 0:
             return {
@@ -736,23 +840,17 @@ class RoutingCommands:
                 }
             }
 
-        # Normalize and get perpendicular
-        dx /= length
-        dy /= length
-        px = -dy
-        py = dx
-
-        # Calculate offsets
-        gap_nm = int(gap * 1000000)
-        offset_x = int(px * gap_nm / 2)
-        offset_y = int(py * gap_nm / 2)
+        # Offset each trace by half the gap along the unit perpendicular
+        half_gap_nm = int(gap * 1000000) / 2
+        offset_x = int(-dy / length * half_gap_nm)
+        offset_y = int(dx / length * half_gap_nm)
 
         # Create trace points
         return {
-            "pos_start": pcbnew.VECTOR2I(int(start_point.x + offset_x), int(start_point.y + offset_y)),
-            "pos_end": pcbnew.VECTOR2I(int(end_point.x + offset_x), int(end_point.y + offset_y)),
-            "neg_start": pcbnew.VECTOR2I(int(start_point.x - offset_x), int(start_point.y - offset_y)),
-            "neg_end": pcbnew.VECTOR2I(int(end_point.x - offset_x), int(end_point.y - offset_y)),
+            "pos_start": pcbnew.VECTOR2I(start_x + offset_x, start_y + offset_y),
+            "pos_end": pcbnew.VECTOR2I(end_x + offset_x, end_y + offset_y),
+            "neg_start": pcbnew.VECTOR2I(start_x - offset_x, start_y - offset_y),
+            "neg_end": pcbnew.VECTOR2I(end_x - offset_x, end_y - offset_y),
             "length": length,
         }
 
@@ -809,13 +907,23 @@ class RoutingCommands:
             },
         }
 
+    @staticmethod
+    def _point_to_vec2i(point: dict[str, Any]) -> pcbnew.VECTOR2I:
+        """Convert an {x, y, unit} point (unit defaults to mm) to a KiCAD point.
+
+        Args:
+            point: Point specification with x, y and optional unit.
+
+        Returns:
+            The point in nanometers.
+        """
+        scale = _NM_PER_UNIT.get(point.get("unit", "mm"), _NM_PER_INCH)
+        return pcbnew.VECTOR2I(int(point["x"] * scale), int(point["y"] * scale))
+
     def _get_point(self, point_spec: dict[str, Any]) -> pcbnew.VECTOR2I:
         """Convert point specification to KiCAD point."""
         if "x" in point_spec and "y" in point_spec:
-            scale = 1000000 if point_spec.get("unit", "mm") == "mm" else 25400000
-            x_nm = int(point_spec["x"] * scale)
-            y_nm = int(point_spec["y"] * scale)
-            return pcbnew.VECTOR2I(x_nm, y_nm)
+            return self._point_to_vec2i(point_spec)
         if "pad" in point_spec and "componentRef" in point_spec:
             module = self.board.FindFootprintByReference(point_spec["componentRef"])
             if module:
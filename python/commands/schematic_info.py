@@ -299,12 +299,12 @@ class SchematicInspector:
         if not lib_id or not self._pin_locator:
             return pins
 
-        # Get pin definitions from lib_symbols
+        # Get pin definitions from lib_symbols and every absolute pin position
         pin_defs = self._pin_locator.get_symbol_pins(schematic_path, lib_id)
+        pin_locs = self._pin_locator.get_all_symbol_pins(schematic_path, reference)
 
         for pin_num, pin_data in pin_defs.items():
-            # Get absolute pin position
-            pin_loc = self._pin_locator.get_pin_location(schematic_path, reference, pin_num)
+            pin_loc = pin_locs.get(pin_num)
 
             pin_info: dict[str, Any] = {
                 "number": pin_num,
@@ -435,11 +435,12 @@ class SchematicInspector:
         """
         unconnected: list[dict[str, Any]] = []
 
-        # Get all pins for this symbol
+        # Get all pins for this symbol, located in one pass
         pin_defs = self._pin_locator.get_symbol_pins(schematic_path, lib_id)
+        pin_locs = self._pin_locator.get_all_symbol_pins(schematic_path, ref)
 
         for pin_num, pin_data in pin_defs.items():
-            pin_loc = self._pin_locator.get_pin_location(schematic_path, ref, pin_num)
+            pin_loc = pin_locs.get(pin_num)
 
             if pin_loc:
                 pin_x = round(pin_loc[0], 1)
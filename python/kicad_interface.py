@@ -2242,13 +2242,15 @@ class KiCADInterface:
 
             logger.info("Downloading JLCPCB parts database from JLCSearch...")
 
-            parts = self.jlcsearch_client.download_all_components(
+            # Parts are streamed straight from the download into the import
+            parts = self.jlcsearch_client.iter_all_components(
                 callback=lambda _total, msg: logger.info("%s", msg)
             )
 
-            logger.info("Importing %d parts into database...", len(parts))
             self.jlcpcb_parts.import_jlcsearch_parts(
-                parts, progress_callback=lambda _curr, _total, msg: logger.info("%s", msg)
+                parts,
+                progress_callback=lambda _curr, _total, msg: logger.info("%s", msg),
+                bulk=True,
             )
 
             stats = self.jlcpcb_parts.get_database_stats()
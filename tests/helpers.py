@@ -0,0 +1,40 @@
+"""Shared helpers for the unit tests."""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+PYTHON_DIR = Path(__file__).parent.parent / "python"
+
+# Modules import their siblings' dependencies (e.g. utils) from python/
+sys.path.insert(0, str(PYTHON_DIR))
+
+
+def load_command_module(name: str) -> ModuleType:
+    """Import one module from python/commands by file path.
+
+    The commands package __init__ imports KiCAD's pcbnew, which the parsing
+    and database modules under test do not need.
+
+    Args:
+        name: Module name inside python/commands (e.g. "pin_locator")
+
+    Returns:
+        The imported module, registered in sys.modules as commands_<name>
+    """
+    module_name = f"commands_{name}"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(
+        module_name, PYTHON_DIR / "commands" / f"{name}.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,407 @@
+"""Tests for the local JLCPCB parts database."""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.helpers import load_command_module
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+jlcpcb_parts = load_command_module("jlcpcb_parts")
+JLCPCBPartsManager = jlcpcb_parts.JLCPCBPartsManager
+
+
+def jlcpcb_part(lcsc: str, **fields: object) -> dict[str, object]:
+    """Build a JLCPCB API part dict with in-stock defaults."""
+    part: dict[str, object] = {
+        "componentCode": lcsc,
+        "firstSortName": "Resistors",
+        "secondSortName": "Chip Resistor - Surface Mount",
+        "componentModelEn": f"RC-{lcsc}",
+        "componentSpecificationEn": "0402",
+        "componentBrandEn": "YAGEO",
+        "describe": "10kΩ resistor",
+        "stockCount": 1000,
+        "prices": [{"startNumber": 1, "price": "0.001"}],
+    }
+    part.update(fields)
+    return part
+
+
+def jlcsearch_part(lcsc: int, package: str = "0402", **fields: object) -> dict[str, object]:
+    """Build a JLCSearch part dict with in-stock defaults."""
+    part: dict[str, object] = {
+        "lcsc": lcsc,
+        "mfr": f"MFR{lcsc}",
+        "package": package,
+        "stock": 500,
+        "price": 0.05,
+        "description": "MOSFET",
+    }
+    part.update(fields)
+    return part
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> str:
+    return str(tmp_path / "parts.db")
+
+
+@pytest.fixture
+def manager(db_path: str):
+    """Parts manager backed by a database file in a temporary directory."""
+    parts_manager = JLCPCBPartsManager(db_path)
+    yield parts_manager
+    parts_manager.close()
+
+
+class TestStats:
+    """Test the database statistics"""
+
+    def test_counts_by_library_type_and_stock(self, manager):
+        """All figures come from one aggregate over the table"""
+        manager.import_jlcsearch_parts(
+            [
+                jlcsearch_part(1, is_basic=True),
+                jlcsearch_part(2),
+                jlcsearch_part(3, stock=0),
+            ]
+        )
+
+        stats = manager.get_database_stats()
+
+        assert stats["total_parts"] == 3
+        assert stats["basic_parts"] == 1
+        assert stats["extended_parts"] == 2
+        assert stats["in_stock"] == 2
+
+    def test_empty_database(self, manager):
+        """An empty table reports zeros rather than None"""
+        stats = manager.get_database_stats()
+
+        assert (stats["total_parts"], stats["basic_parts"], stats["in_stock"]) == (0, 0, 0)
+
+    def test_sees_writes_from_another_connection(self, manager, db_path):
+        """Stats are current even when another manager wrote the parts"""
+        assert manager.get_database_stats()["total_parts"] == 0
+
+        writer = JLCPCBPartsManager(db_path)
+        try:
+            writer.import_parts([jlcpcb_part("C1"), jlcpcb_part("C2")])
+        finally:
+            writer.close()
+
+        assert manager.get_database_stats()["total_parts"] == 2
+
+
+class TestImport:
+    """Test importing parts and skipping malformed ones"""
+
+    def test_malformed_parts_are_skipped(self, manager, caplog):
+        """Parts without an LCSC number or with unbindable fields are counted as skipped"""
+        parts = [
+            jlcpcb_part("C1"),
+            jlcpcb_part("C2", componentModelEn={"nested": "dict"}),
+            jlcpcb_part("C3", prices="not a list"),
+            jlcpcb_part(""),
+            jlcpcb_part("C5", describe=["a", "list"]),
+            jlcpcb_part("C6"),
+        ]
+
+        with caplog.at_level(logging.INFO, logger="kicad_interface"):
+            manager.import_parts(parts)
+
+        assert "2 parts imported, 4 skipped" in caplog.text
+        assert manager.get_database_stats()["total_parts"] == 2
+        assert manager.get_part_info("C1") is not None
+        assert manager.get_part_info("C2") is None
+
+    def test_out_of_range_integer_is_skipped(self, manager, caplog):
+        """An integer too large for sqlite drops only its own part"""
+        parts = [jlcpcb_part("C1", stockCount=2**70), jlcpcb_part("C2")]
+
+        with caplog.at_level(logging.INFO, logger="kicad_interface"):
+            manager.import_parts(parts)
+
+        assert "1 parts imported, 1 skipped" in caplog.text
+        assert manager.get_part_info("C1") is None
+        assert manager.get_part_info("C2") is not None
+
+    def test_unbindable_row_does_not_abort_chunk(self, manager, caplog):
+        """A row sqlite rejects is skipped while the rest of its chunk is kept"""
+
+        def build_row(part, now_ts):
+            row = manager._jlcpcb_row(part, now_ts)
+            # Bypass the builder's own checks so the insert itself fails
+            if part["componentCode"] == "C2":
+                return (*row[:3], object(), *row[4:])
+            if part["componentCode"] == "C3":
+                return (*row[:3], 2**64, *row[4:])
+            return row
+
+        parts = [jlcpcb_part(f"C{n}") for n in range(1, 5)]
+        with caplog.at_level(logging.INFO, logger="kicad_interface"):
+            manager._import_rows(parts, build_row, None, bulk=False)
+
+        assert "2 parts imported, 2 skipped" in caplog.text
+        assert manager.get_part_info("C2") is None
+        assert manager.get_part_info("C3") is None
+        assert manager.get_part_info("C4") is not None
+
+    def test_stream_is_consumed_before_the_transaction(self, manager):
+        """Converting a lazy stream never holds the write transaction open"""
+        in_transaction = []
+
+        def stream():
+            for n in range(3):
+                in_transaction.append(manager._write_conn.in_transaction)
+                yield jlcpcb_part(f"C{n}")
+
+        manager.import_parts(stream())
+
+        assert in_transaction == [False, False, False]
+        assert manager.get_database_stats()["total_parts"] == 3
+
+
+def fts_is_consistent(manager) -> bool:
+    """Run FTS5's integrity check of components_fts against the components table."""
+    with manager._read_cursor() as cursor:
+        try:
+            cursor.execute(
+                "INSERT INTO components_fts(components_fts, rank) VALUES('integrity-check', 1)"
+            )
+        except sqlite3.DatabaseError:
+            return False
+    return True
+
+
+def fts_matches(manager, query: str) -> list[str]:
+    return sorted(part["lcsc"] for part in manager.search_parts(query=query, in_stock=False))
+
+
+class TestUpsertAndFullTextIndex:
+    """Test re-imports updating rows in place and the FTS triggers following them"""
+
+    def test_reimport_updates_the_row_and_its_text(self, manager):
+        """A part imported again keeps its rowid and is found by its new text only"""
+        manager.import_parts([jlcpcb_part("C1", describe="alpha widget")])
+        with manager._read_cursor() as cursor:
+            (rowid,) = cursor.execute("SELECT rowid FROM components WHERE lcsc = 'C1'").fetchone()
+
+        manager.import_parts([jlcpcb_part("C1", describe="beta widget", stockCount=7)])
+
+        with manager._read_cursor() as cursor:
+            row = cursor.execute("SELECT rowid, stock FROM components WHERE lcsc = 'C1'").fetchone()
+        assert row == (rowid, 7)
+        assert manager.get_database_stats()["total_parts"] == 1
+        assert fts_matches(manager, "alpha") == []
+        assert fts_matches(manager, "beta") == ["C1"]
+        assert fts_is_consistent(manager)
+
+    def test_deleted_rows_leave_the_index(self, manager):
+        """The delete trigger removes a part's text from the index"""
+        manager.import_parts([jlcpcb_part("C1", describe="gamma"), jlcpcb_part("C2")])
+
+        with manager._transaction() as cursor:
+            cursor.execute("DELETE FROM components WHERE lcsc = 'C1'")
+
+        assert fts_matches(manager, "gamma") == []
+        assert fts_is_consistent(manager)
+
+    def test_bulk_import_rebuilds_indexes(self, manager):
+        """A bulk load drops the indexes and FTS, then rebuilds them once at the end"""
+        manager.import_parts([jlcpcb_part("C1", describe="delta")])
+
+        manager.import_parts(
+            [jlcpcb_part(f"C{i}", describe=f"part{i} delta") for i in range(2, 5)], bulk=True
+        )
+
+        assert fts_matches(manager, "delta") == ["C1", "C2", "C3", "C4"]
+        assert fts_is_consistent(manager)
+        with manager._read_cursor() as cursor:
+            names = {row[0] for row in cursor.execute("SELECT name FROM sqlite_master")}
+        assert set(jlcpcb_parts._INDEX_DDL) <= names
+        assert set(jlcpcb_parts._FTS_TRIGGER_DDL) <= names
+
+
+class TestConnections:
+    """Test the writer connection and the lazily opened reader pool"""
+
+    def test_readers_open_on_demand(self, manager):
+        """No reader exists until a query needs one, and idle ones are reused"""
+        assert manager._readers == []
+
+        manager.get_database_stats()
+        manager.get_database_stats()
+
+        assert len(manager._readers) == 1
+
+    def test_concurrent_readers_are_capped(self, manager):
+        """Nested borrows open new readers only up to the cap"""
+        with manager._read_cursor(), manager._read_cursor():
+            assert len(manager._readers) == 2
+        for _ in range(jlcpcb_parts._MAX_READERS + 2):
+            manager.get_database_stats()
+
+        assert len(manager._readers) == 2
+
+    def test_close_reaches_borrowed_readers(self, db_path):
+        """A reader still checked out when the manager closes is closed too"""
+        parts_manager = JLCPCBPartsManager(db_path)
+        with parts_manager._read_cursor() as cursor:
+            parts_manager.close()
+            with pytest.raises(sqlite3.ProgrammingError):
+                cursor.execute("SELECT 1")
+
+    def test_memory_database_reads_through_the_writer(self):
+        """Each :memory: connection is its own database, so reads share the writer"""
+        parts_manager = JLCPCBPartsManager(":memory:")
+        try:
+            parts_manager.import_parts([jlcpcb_part("C1")])
+
+            assert parts_manager.get_part_info("C1") is not None
+            assert parts_manager._readers == [parts_manager._write_conn]
+        finally:
+            parts_manager.close()
+
+
+class TestPackageSearch:
+    """Test substring and prefix filters on the package column"""
+
+    @pytest.fixture(autouse=True)
+    def packages(self, manager):
+        """Import parts in packages around "SOT-23", in mixed case."""
+        manager.import_jlcsearch_parts(
+            [
+                jlcsearch_part(1, "SOT-23"),
+                jlcsearch_part(2, "SOT-23-5"),
+                jlcsearch_part(3, "SOT-223"),
+                jlcsearch_part(4, "sot-23"),
+                jlcsearch_part(5, "TO-SOT-23"),
+                jlcsearch_part(6, "SOT-23", stock=0),
+                jlcsearch_part(7, "SOT_23"),
+            ]
+        )
+
+    @staticmethod
+    def lcsc_numbers(results):
+        return sorted(part["lcsc"] for part in results)
+
+    def test_prefix_search_is_anchored_and_ignores_case(self, manager):
+        """A trailing "*" matches packages starting with the prefix, in any case"""
+        results = manager.search_parts(package="sot-23*")
+
+        assert self.lcsc_numbers(results) == ["C1", "C2", "C4"]
+
+    def test_plain_search_matches_anywhere(self, manager):
+        """Without "*" the package matches anywhere, ignoring case"""
+        results = manager.search_parts(package="SOT-23")
+
+        assert self.lcsc_numbers(results) == ["C1", "C2", "C4", "C5"]
+
+    def test_prefix_wildcards_are_literal(self, manager):
+        """ "_" in a prefix matches only an underscore, not any character"""
+        assert self.lcsc_numbers(manager.search_parts(package="SOT_*")) == ["C7"]
+
+    def test_out_of_stock_parts(self, manager):
+        """Out-of-stock parts are only returned when in_stock is False"""
+        results = manager.search_parts(package="SOT-23*", in_stock=False)
+
+        assert self.lcsc_numbers(results) == ["C1", "C2", "C4", "C6"]
+
+    def test_prefix_search_uses_the_package_index(self, manager):
+        """The prefix pattern is answered by a range scan on the NOCASE index"""
+        sql_parts = ["SELECT lcsc FROM components c WHERE 1=1"]
+        params: list[object] = []
+        manager._add_text_filter(sql_parts, params, "c.package", "SOT-23*")
+
+        with manager._read_cursor() as cursor:
+            plan = cursor.execute("EXPLAIN QUERY PLAN " + " ".join(sql_parts), params).fetchall()
+
+        assert any("idx_package_nocase" in row[-1] for row in plan)
+
+    def test_binary_indexes_are_replaced(self, manager, db_path):
+        """Reopening a database drops the binary-collation package index"""
+        manager._write_conn.execute("CREATE INDEX idx_package ON components(package)")
+        manager._write_conn.commit()
+
+        JLCPCBPartsManager(db_path).close()
+
+        with manager._read_cursor() as cursor:
+            names = {row[0] for row in cursor.execute("SELECT name FROM sqlite_master")}
+        assert "idx_package" not in names
+        assert "idx_package_nocase" in names
+
+
+class TestFirstPrice:
+    """Test the first_price column used to rank parts by price"""
+
+    def test_old_database_is_migrated(self, db_path):
+        """A database from before first_price gets the column backfilled"""
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            """
+            CREATE TABLE components (
+                lcsc TEXT PRIMARY KEY, category TEXT, subcategory TEXT, mfr_part TEXT,
+                package TEXT, solder_joints INTEGER, manufacturer TEXT, library_type TEXT,
+                description TEXT, datasheet TEXT, stock INTEGER, price_json TEXT,
+                last_updated INTEGER
+            )
+            """
+        )
+        conn.execute(
+            "INSERT INTO components (lcsc, stock, price_json) VALUES (?, ?, ?)",
+            ("C1", 10, '[{"qty": 1, "price": 0.25}, {"qty": 100, "price": 0.2}]'),
+        )
+        conn.commit()
+        conn.close()
+
+        manager = JLCPCBPartsManager(db_path)
+        try:
+            part = manager.get_part_info("C1")
+        finally:
+            manager.close()
+
+        assert part["first_price"] == pytest.approx(0.25)
+        assert part["price_breaks"][1] == {"qty": 100, "price": 0.2}
+
+    def test_unparseable_price_is_null(self, manager):
+        """A price that is not a number is stored as NULL rather than skipping the part"""
+        manager.import_parts([jlcpcb_part("C1", prices=[{"startNumber": 1, "price": "n/a"}])])
+
+        assert manager.get_part_info("C1")["first_price"] is None
+
+
+class TestSuggestAlternatives:
+    """Test ranking alternatives from the same subcategory and package"""
+
+    def test_basic_then_cheapest_then_stock(self, manager):
+        """Basic parts come first, then ascending price with unknown prices last"""
+        manager.import_jlcsearch_parts(
+            [
+                jlcsearch_part(1, price=0.10),
+                jlcsearch_part(2, price=0.30, is_basic=True),
+                jlcsearch_part(3, price=0.05),
+                jlcsearch_part(4, price=None),
+                jlcsearch_part(5, price=0.05, stock=9000),
+                jlcsearch_part(6, price=0.01, stock=0),
+                jlcsearch_part(7, "0603", price=0.01),
+            ]
+        )
+
+        alternatives = manager.suggest_alternatives("C1", limit=10)
+
+        assert [part["lcsc"] for part in alternatives] == ["C2", "C5", "C3", "C4"]
+
+    def test_limit_and_unknown_part(self, manager):
+        """The limit caps the result and an unknown part has no alternatives"""
+        manager.import_jlcsearch_parts([jlcsearch_part(n) for n in range(1, 6)])
+
+        assert len(manager.suggest_alternatives("C1", limit=2)) == 2
+        assert manager.suggest_alternatives("C99") == []
@@ -0,0 +1,139 @@
+"""Tests for streaming the catalog from the JLCSearch client."""
+
+from __future__ import annotations
+
+from itertools import pairwise
+import threading
+import time
+
+import pytest
+import requests
+
+from tests.helpers import load_command_module
+
+jlcsearch = load_command_module("jlcsearch")
+
+CATALOG = [{"lcsc": number} for number in range(25)]
+
+
+class FakeCatalog:
+    """Serve CATALOG pages in place of JLCSearchClient._search, recording each request."""
+
+    def __init__(self, fail_at: int | None = None) -> None:
+        self.fail_at = fail_at
+        self.offsets: list[int] = []
+        self.sessions: dict[int, requests.Session] = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, session, _category, limit, offset, _filters):
+        with self.lock:
+            self.offsets.append(offset)
+            self.sessions.setdefault(threading.get_ident(), session)
+        # Later pages answer first, so order depends on the consumer, not arrival
+        time.sleep(0.01 * (3 - offset // limit % 3))
+        if offset == self.fail_at:
+            raise requests.exceptions.ConnectionError(offset)
+        return CATALOG[offset : offset + limit]
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch):
+    """Client with no request spacing."""
+    monkeypatch.setattr(jlcsearch, "_MIN_REQUEST_INTERVAL", 0.0)
+    search_client = jlcsearch.JLCSearchClient()
+    yield search_client
+    search_client.close()
+
+
+def serve(monkeypatch: pytest.MonkeyPatch, catalog: FakeCatalog) -> FakeCatalog:
+    monkeypatch.setattr(jlcsearch.JLCSearchClient, "_search", catalog)
+    return catalog
+
+
+class TestIterAllComponents:
+    """Test the page prefetching behind iter_all_components"""
+
+    def test_parts_arrive_in_catalog_order(self, client, monkeypatch):
+        """Pages fetched concurrently are still yielded in offset order"""
+        catalog = serve(monkeypatch, FakeCatalog())
+        progress = []
+
+        parts = list(
+            client.iter_all_components(
+                lambda count, _msg: progress.append(count), batch_size=10, max_workers=3
+            )
+        )
+
+        assert parts == CATALOG
+        assert progress == [10, 20, 25]
+        assert sorted(catalog.offsets) == [0, 10, 20]
+
+    def test_each_worker_thread_has_its_own_session(self, client, monkeypatch):
+        """Workers never share a session with each other or the client"""
+        catalog = serve(monkeypatch, FakeCatalog())
+
+        list(client.iter_all_components(batch_size=5, max_workers=3))
+
+        sessions = list(catalog.sessions.values())
+        assert len({id(session) for session in sessions}) == len(sessions)
+        assert client.session not in sessions
+
+    def test_closing_the_stream_stops_fetching(self, client, monkeypatch):
+        """A consumer that stops early leaves no pages being requested"""
+        catalog = serve(monkeypatch, FakeCatalog())
+
+        stream = client.iter_all_components(batch_size=5, max_workers=2)
+        assert next(stream) == CATALOG[0]
+        stream.close()
+        requested = len(catalog.offsets)
+        time.sleep(0.05)
+
+        assert len(catalog.offsets) == requested
+        assert requested <= 3
+
+    def test_first_page_failure_raises(self, client, monkeypatch):
+        """Nothing downloaded yet: the error reaches the caller"""
+        serve(monkeypatch, FakeCatalog(fail_at=0))
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            list(client.iter_all_components(batch_size=10, max_workers=2))
+
+    def test_later_failure_ends_the_stream(self, client, monkeypatch):
+        """After the first page a failure ends the stream with the parts so far"""
+        serve(monkeypatch, FakeCatalog(fail_at=10))
+
+        parts = list(client.iter_all_components(batch_size=10, max_workers=2))
+
+        assert parts == CATALOG[:10]
+
+    def test_download_all_components_returns_a_list(self, client, monkeypatch):
+        """The list wrapper returns the same parts as the stream"""
+        serve(monkeypatch, FakeCatalog())
+
+        assert client.download_all_components(batch_size=10) == CATALOG
+
+
+class TestRateLimiter:
+    """Test spacing requests from several threads"""
+
+    def test_calls_are_spaced_across_threads(self):
+        """Every call waits for its own slot in the shared schedule"""
+        limiter = jlcsearch._RateLimiter(0.02)
+        times: list[float] = []
+        lock = threading.Lock()
+
+        def call():
+            limiter.wait()
+            with lock:
+                times.append(time.monotonic())
+
+        threads = [threading.Thread(target=call) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        times.sort()
+        gaps = [later - earlier for earlier, later in pairwise(times)]
+        assert min(gaps) >= 0.015
+        assert times[-1] - times[0] >= 0.075
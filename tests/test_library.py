@@ -0,0 +1,203 @@
+"""Tests for the footprint library manager."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from tests.helpers import load_command_module
+
+library = load_command_module("library")
+LibraryManager = library.LibraryManager
+
+
+@pytest.fixture
+def write_library(tmp_path: Path):
+    """Create a .pretty directory holding empty footprint files."""
+
+    def write(name: str, *footprints: str) -> Path:
+        library_dir = tmp_path / f"{name}.pretty"
+        library_dir.mkdir()
+        for footprint in footprints:
+            (library_dir / f"{footprint}.kicad_mod").write_text("(footprint)")
+        return library_dir
+
+    return write
+
+
+@pytest.fixture
+def project(tmp_path: Path, write_library, monkeypatch) -> Path:
+    """Project whose fp-lib-table lists Resistor, Capacitor and Diode libraries."""
+    monkeypatch.setattr(LibraryManager, "_get_global_fp_lib_table", lambda _self: None)
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    entries = [
+        (name, write_library(name, *footprints))
+        for name, footprints in (
+            ("Resistor", ("R_0402", "R_0603")),
+            ("Capacitor", ("C_0402", "R_0603")),
+            ("Diode", ("D_SOD123",)),
+        )
+    ]
+    lib_lines = "\n".join(
+        f'  (lib (name "{name}")(type "KiCad")(uri "{path}")(options "")(descr ""))'
+        for name, path in entries
+    )
+    (project_dir / "fp-lib-table").write_text(f"(fp_lib_table\n{lib_lines}\n)\n")
+    return project_dir
+
+
+@pytest.fixture
+def index_path(tmp_path: Path) -> Path:
+    return tmp_path / "cache" / "footprint_index.json"
+
+
+@pytest.fixture
+def listed(monkeypatch):
+    """Record every library a manager lists, whether from disk or the index."""
+    nicknames: list[str] = []
+    real_list_footprints = LibraryManager.list_footprints
+
+    def list_footprints(self, library_nickname):
+        if library_nickname not in self.footprint_cache:
+            nicknames.append(library_nickname)
+        return real_list_footprints(self, library_nickname)
+
+    monkeypatch.setattr(LibraryManager, "list_footprints", list_footprints)
+    return nicknames
+
+
+def saved_manager(project: Path, index_path: Path) -> None:
+    """List every library once and persist the footprint index."""
+    manager = LibraryManager(project, index_path=index_path)
+    for nickname in manager.libraries:
+        manager.list_footprints(nickname)
+    manager.save_footprint_index()
+
+
+class TestUnqualifiedLookup:
+    """Test finding a footprint without a library prefix"""
+
+    def test_first_library_in_table_order_wins(self, project, index_path):
+        """A name in several libraries resolves to the first listed one"""
+        manager = LibraryManager(project, index_path=index_path)
+
+        library_path, name = manager.find_footprint("R_0603")
+
+        assert library_path.endswith("Resistor.pretty")
+        assert name == "R_0603"
+
+    def test_owner_map_comes_from_the_persisted_index(self, project, index_path, listed):
+        """With every library indexed, the first lookup lists no library"""
+        saved_manager(project, index_path)
+        listed.clear()
+
+        manager = LibraryManager(project, index_path=index_path)
+
+        assert manager.find_footprint("D_SOD123") is not None
+        assert listed == []
+
+    def test_unindexed_libraries_are_scanned(self, project, index_path, listed):
+        """Without an index every library is listed once"""
+        manager = LibraryManager(project, index_path=index_path)
+
+        manager.find_footprint("D_SOD123")
+
+        assert sorted(listed) == ["Capacitor", "Diode", "Resistor"]
+
+    def test_miss_relists_only_changed_libraries(self, project, index_path, listed):
+        """A footprint added since indexing is found by rescanning its library alone"""
+        saved_manager(project, index_path)
+        manager = LibraryManager(project, index_path=index_path)
+        manager.find_footprint("D_SOD123")
+        listed.clear()
+
+        diode_dir = project.parent / "Diode.pretty"
+        (diode_dir / "D_SMA.kicad_mod").write_text("(footprint)")
+        # Guarantee a new directory mtime on filesystems with coarse timestamps
+        stat = diode_dir.stat()
+        os.utime(diode_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        library_path, _ = manager.find_footprint("D_SMA")
+
+        assert library_path.endswith("Diode.pretty")
+        assert listed == ["Diode"]
+
+    def test_deleted_footprint_is_not_found(self, project, index_path):
+        """A stale owner whose file is gone triggers a rescan and then a miss"""
+        manager = LibraryManager(project, index_path=index_path)
+        assert manager.find_footprint("C_0402") is not None
+
+        capacitor_dir = project.parent / "Capacitor.pretty"
+        (capacitor_dir / "C_0402.kicad_mod").unlink()
+        stat = capacitor_dir.stat()
+        os.utime(capacitor_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert manager.find_footprint("C_0402") is None
+
+
+class TestFootprintIndex:
+    """Test the persistent footprint_index.json"""
+
+    def test_listing_is_reused_across_managers(self, project, index_path, monkeypatch):
+        """A saved listing is read back without scanning an unchanged directory"""
+        saved_manager(project, index_path)
+
+        def fail_scandir(path):
+            pytest.fail(f"scanned {path}")
+
+        monkeypatch.setattr(library.os, "scandir", fail_scandir)
+        manager = LibraryManager(project, index_path=index_path)
+
+        assert sorted(manager.list_footprints("Resistor")) == ["R_0402", "R_0603"]
+
+    def test_changed_directory_is_rescanned(self, project, index_path):
+        """A newer directory mtime invalidates the saved listing"""
+        saved_manager(project, index_path)
+        diode_dir = project.parent / "Diode.pretty"
+        (diode_dir / "D_SMA.kicad_mod").write_text("(footprint)")
+        stat = diode_dir.stat()
+        os.utime(diode_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        manager = LibraryManager(project, index_path=index_path)
+
+        assert sorted(manager.list_footprints("Diode")) == ["D_SMA", "D_SOD123"]
+
+    def test_save_merges_with_the_file_on_disk(self, project, index_path):
+        """Managers sharing the index file keep each other's listings"""
+        first = LibraryManager(project, index_path=index_path)
+        second = LibraryManager(project, index_path=index_path)
+        first.list_footprints("Resistor")
+        second.list_footprints("Diode")
+
+        first.save_footprint_index()
+        second.save_footprint_index()
+
+        data = json.loads(index_path.read_text())
+        assert {Path(path).name for path in data["libraries"]} == {
+            "Resistor.pretty",
+            "Diode.pretty",
+        }
+
+    def test_unreadable_index_is_ignored(self, project, index_path):
+        """A corrupt index file is treated as empty"""
+        index_path.parent.mkdir(parents=True)
+        index_path.write_text("{not json")
+
+        manager = LibraryManager(project, index_path=index_path)
+
+        assert sorted(manager.list_footprints("Resistor")) == ["R_0402", "R_0603"]
+
+    def test_nothing_is_written_without_changes(self, project, index_path):
+        """Saving a manager that rescanned nothing leaves the file alone"""
+        saved_manager(project, index_path)
+        before = index_path.stat().st_mtime_ns
+
+        manager = LibraryManager(project, index_path=index_path)
+        manager.list_footprints("Resistor")
+        manager.save_footprint_index()
+
+        assert index_path.stat().st_mtime_ns == before
@@ -0,0 +1,223 @@
+"""Tests for reading and searching .kicad_sym symbol libraries."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.helpers import load_command_module
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+library_symbol = load_command_module("library_symbol")
+SymbolLibraryManager = library_symbol.SymbolLibraryManager
+
+
+LIBRARY = rb"""(kicad_symbol_lib (version 20231120) (generator "kicad_symbol_editor")
+  (symbol "R"
+    (property "Reference" "R" (at 0 0 0))
+    (property "Value" "R" (at 0 0 0))
+    (property "Description" "Resistor, \"thick (film)\"" (at 0 0 0))
+    (property "LCSC" "C25804" (at 0 0 0))
+    (symbol "R_0_1" (rectangle (start -1 2) (end 1 -2)))
+    (symbol "R_1_1"
+      (pin passive line (at 0 3.81 270) (length 1.27) (name "~") (number "1"))
+    )
+  )
+  (symbol "R_Small"
+    (property "Value" "R_Small" (at 0 0 0))
+    (property "MPN" "RC0402" (at 0 0 0))
+    (symbol "R_Small_1_1")
+  )
+  (symbol "R_2"
+    (property "Value" "R_2" (at 0 0 0))
+    (property "Part" "RC0603" (at 0 0 0))
+  )
+)
+"""
+
+
+def property_value(values: list[str | None], key: bytes) -> str | None:
+    """Pick one property out of the values yielded for a symbol."""
+    return values[library_symbol._PROPERTY_SLOTS[key]]
+
+
+def write_library(path: Path, symbols: list[tuple[str, dict[str, str]]]) -> None:
+    """Write a .kicad_sym file with one unit sub-symbol per symbol."""
+    lines = ['(kicad_symbol_lib (version 20231120) (generator "kicad_symbol_editor")']
+    for name, properties in symbols:
+        lines.append(f'  (symbol "{name}"')
+        lines.extend(
+            f'    (property "{key}" "{value}" (at 0 0 0))' for key, value in properties.items()
+        )
+        lines.append(f'    (symbol "{name}_1_1")')
+        lines.append("  )")
+    lines.append(")")
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Project whose sym-lib-table lists the libraries Passives, Extra and Parts."""
+    write_library(
+        tmp_path / "Passives.kicad_sym",
+        [(f"R{i}", {"Value": f"{i}k", "Description": "Resistor"}) for i in range(10)],
+    )
+    write_library(
+        tmp_path / "Extra.kicad_sym",
+        [("R_Array", {"Value": "R_Array", "Description": "Resistor array"})],
+    )
+    write_library(
+        tmp_path / "Parts.kicad_sym",
+        [
+            ("ESP32", {"Value": "ESP32", "Description": "WiFi MCU", "LCSC": "C82899"}),
+            ("Holder", {"Value": "Holder", "Description": "Replaces C82899 and C82899X"}),
+        ],
+    )
+    entries = "\n".join(
+        f'  (lib (name "{name}")(type "KiCad")(uri "${{KIPRJMOD}}/{name}.kicad_sym")'
+        '(options "")(descr ""))'
+        for name in ("Passives", "Extra", "Parts")
+    )
+    (tmp_path / "sym-lib-table").write_text(f"(sym_lib_table\n  (version 7)\n{entries}\n)\n")
+    return tmp_path
+
+
+@pytest.fixture
+def manager(project: Path, monkeypatch: pytest.MonkeyPatch):
+    """Manager that sees only the project's libraries, indexed inside the project."""
+    monkeypatch.setattr(SymbolLibraryManager, "_get_global_sym_lib_table", lambda _self: None)
+    symbol_manager = SymbolLibraryManager(project, index_path=project / "index.sqlite")
+    yield symbol_manager
+    if symbol_manager._index_conn is not None:
+        symbol_manager._index_conn.close()
+
+
+def names(symbols) -> list[str]:
+    return [symbol.full_ref for symbol in symbols]
+
+
+class TestSearch:
+    """Test ranking symbols and how many libraries a search loads"""
+
+    def test_search_stops_loading_libraries_once_it_has_enough_hits(self, manager):
+        """Later libraries stay unloaded when earlier ones hold plenty of matches"""
+        results = manager.search_symbols("resistor", limit=2)
+
+        assert len(results) == 2
+        assert set(manager.symbol_cache) == {"Passives"}
+
+    def test_search_loads_more_libraries_for_a_larger_limit(self, manager):
+        """A limit the first library cannot fill brings in the next ones"""
+        results = manager.search_symbols("resistor", limit=20)
+
+        assert len(results) == 11
+        assert "Extra:R_Array" in names(results)
+
+    def test_extended_query_matches_a_fresh_search(self, manager, project):
+        """Refining the previous search's candidates finds what a new search finds"""
+        manager.search_symbols("re", limit=50)
+        refined = manager.search_symbols("resistor a", limit=50)
+
+        fresh = SymbolLibraryManager(project, index_path=project / "index.sqlite")
+        try:
+            assert names(refined) == names(fresh.search_symbols("resistor a", limit=50))
+        finally:
+            fresh._index_conn.close()
+        assert names(refined) == ["Extra:R_Array"]
+
+    def test_lcsc_query_lists_exact_parts_before_other_matches(self, manager):
+        """Exact LCSC hits lead and symbols mentioning the number fill the rest"""
+        results = manager.search_symbols("C82899", limit=5)
+
+        assert names(results) == ["Parts:ESP32", "Parts:Holder"]
+
+    def test_lcsc_query_limited_to_exact_parts(self, manager):
+        """A limit the exact hits already fill returns only those"""
+        assert names(manager.search_symbols("c82899", limit=1)) == ["Parts:ESP32"]
+
+
+def symbol_info(name: str, **fields: str):
+    return library_symbol.SymbolInfo(name=name, library="Lib", full_ref=f"Lib:{name}", **fields)
+
+
+class TestSearchIndex:
+    """Test the per-library trigram index and field scoring"""
+
+    @pytest.fixture
+    def index(self):
+        return library_symbol._LibrarySearchIndex(
+            [
+                symbol_info("LM358", description="Dual op amp"),
+                symbol_info("NE555", description="Timer"),
+                symbol_info("TL072", description="Dual JFET op amp", manufacturer="TI"),
+                symbol_info("R", value="R", lcsc_id="C25804"),
+            ]
+        )
+
+    def test_candidates_contain_every_trigram_of_the_query(self, index):
+        """Only symbols holding all of the query's trigrams are candidates"""
+        assert list(index.candidates("op amp")) == [0, 2]
+        assert list(index.candidates("dual jfet")) == [2]
+        assert list(index.candidates("zzz")) == []
+
+    def test_short_queries_consider_every_symbol(self, index):
+        """Queries shorter than a trigram cannot use the index"""
+        assert list(index.candidates("r")) == [0, 1, 2, 3]
+
+    def test_lcsc_ids_are_keyed_lowercase(self, index):
+        assert index.lcsc == {"c25804": [3]}
+
+    def test_scores_rank_exact_fields_above_partial_ones(self, index):
+        """An exact name beats a partial one, and an exact LCSC ID beats both"""
+        fields = index.fields
+
+        assert library_symbol._score_fields("r", fields[3]) > library_symbol._score_fields(
+            "r", fields[0]
+        )
+        assert library_symbol._score_fields("c25804", fields[3]) >= 1000
+        assert library_symbol._score_fields("c2580", fields[3]) == 0
+        assert library_symbol._score_fields("timer", fields[0]) == 0
+
+
+class TestTopLevelSymbols:
+    """Test finding top-level symbols and skipping their unit sub-symbols"""
+
+    def test_units_are_not_symbols(self):
+        """PARENT_<unit>_<style> sub-symbols belong to the symbol before them"""
+        names = [name for name, _ in library_symbol._iter_top_level_symbols(LIBRARY)]
+
+        assert names == ["R", "R_Small", "R_2"]
+
+    def test_properties_are_attributed_to_their_symbol(self):
+        """Properties are unescaped and default when a symbol does not set them"""
+        symbols = dict(library_symbol._iter_top_level_symbols(LIBRARY))
+
+        assert property_value(symbols["R"], b"Description") == 'Resistor, "thick (film)"'
+        assert property_value(symbols["R"], b"LCSC") == "C25804"
+        assert property_value(symbols["R_Small"], b"LCSC") == ""
+        assert property_value(symbols["R_Small"], b"MPN") == "RC0402"
+        assert property_value(symbols["R_Small"], b"Part") is None
+        assert property_value(symbols["R_2"], b"Part") == "RC0603"
+
+    def test_empty_library(self):
+        """A library without symbols yields nothing"""
+        assert list(library_symbol._iter_top_level_symbols(b"(kicad_symbol_lib)")) == []
+
+    @pytest.mark.parametrize(
+        ("name", "parent", "expected"),
+        [
+            ("R_0_1", "R", True),
+            ("R_12_3", "R", True),
+            ("R_Small", "R", False),
+            ("R_2", "R", False),
+            ("R_1_x", "R", False),
+            ("RX_1_1", "R", False),
+            ("R", "R", False),
+        ],
+    )
+    def test_is_unit_of(self, name, parent, expected):
+        """Only PARENT_<digits>_<digits> names are units of PARENT"""
+        assert library_symbol._is_unit_of(name, parent) is expected
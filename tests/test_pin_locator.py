@@ -0,0 +1,160 @@
+"""Tests for locating pins in schematic files."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+from sexpdata import Symbol
+
+from tests.helpers import load_command_module
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pin_locator = load_command_module("pin_locator")
+PinLocator = pin_locator.PinLocator
+
+SCHEMATIC = r"""(kicad_sch (version 20231120) (generator "eeschema")
+  (lib_symbols
+    (symbol "Test:R"
+      (property "Value" "R (\"quoted)\" value" (at 0 0 0))
+      (property "Description" "closes ) early; opens ( late" (at 0 0 0))
+      (symbol "R_0_1" (rectangle (start -1 2) (end 1 -2)))
+      (symbol "R_1_1"
+        (pin passive line (at 0 PIN_Y 270) (length 1.27) (name "~") (number "1"))
+        (pin passive line (at 0 -3.81 90) (length 1.27) (name "A(B)") (number "2"))
+      )
+    )
+  )
+  (symbol (lib_id "Test:R") (at R1_X 50 0) (unit 1)
+    (property "Reference" "R1" (at 0 0 0))
+    (property "Value" "x)y(" (at 0 0 0))
+  )
+  (symbol (lib_id "Test:R") (at 100 50 90) (unit 1)
+    (property "Reference" "R2" (at 0 0 0))
+  )
+  (symbol (lib_id "Test:R") (at 100 50 180) (unit 1)
+    (property "Reference" "R3" (at 0 0 0))
+  )
+)
+"""
+
+
+def write_schematic(path: Path, *, r1_x: str = "100", pin_y: str = "3.81", mtime_ns: int) -> None:
+    """Write the test schematic with R1's x position and pin 1's y offset filled in."""
+    path.write_text(SCHEMATIC.replace("R1_X", r1_x).replace("PIN_Y", pin_y), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep the persistent pin cache inside the test's temporary directory."""
+    directory = tmp_path / "cache"
+    monkeypatch.setattr(pin_locator.PlatformHelper, "get_cache_dir", lambda: directory)
+    return directory
+
+
+@pytest.fixture
+def schematic(tmp_path: Path) -> Path:
+    """Test schematic with R1 unrotated, R2 at 90 degrees and R3 at 180 degrees."""
+    path = tmp_path / "test.kicad_sch"
+    write_schematic(path, mtime_ns=1_000_000_000)
+    return path
+
+
+class TestTokenizer:
+    """Test reading S-expressions with the pin locator's tokenizer"""
+
+    def test_quoted_parens_and_escapes(self):
+        """Parens inside strings do not nest and escaped quotes are unescaped"""
+        tokens = pin_locator._SEXP_TOKEN_RE.finditer(rb' "a \"(b\"" (c ")") d) (ignored)')
+        result = pin_locator._read_list(tokens, Symbol("x"))
+
+        # Bare atoms become Symbols and quoted strings stay str
+        assert result == [Symbol("x"), 'a "(b"', [Symbol("c"), ")"], Symbol("d")]
+        assert type(result[1]) is str
+
+    def test_symbol_definition_pins(self, schematic):
+        """Pins are read from unit sub-symbols past properties holding parens"""
+        pins = PinLocator().get_symbol_pins(schematic, "Test:R")
+
+        assert set(pins) == {"1", "2"}
+        assert pins["1"]["y"] == pytest.approx(3.81)
+        assert pins["1"]["angle"] == 270
+        assert pins["2"]["name"] == "A(B)"
+
+
+class TestPinLocation:
+    """Test absolute pin positions on placed symbol instances"""
+
+    @pytest.mark.parametrize(
+        ("reference", "expected"),
+        [
+            ("R1", {"1": [100, 53.81], "2": [100, 46.19]}),
+            ("R2", {"1": [96.19, 50], "2": [103.81, 50]}),
+            ("R3", {"1": [100, 46.19], "2": [100, 53.81]}),
+        ],
+    )
+    def test_rotated_instances(self, schematic, reference, expected):
+        """Pin offsets are rotated with the instance before being translated"""
+        locator = PinLocator()
+
+        all_pins = locator.get_all_symbol_pins(schematic, reference)
+
+        assert set(all_pins) == set(expected)
+        for number, location in expected.items():
+            assert all_pins[number] == pytest.approx(location)
+            assert locator.get_pin_location(schematic, reference, number) == pytest.approx(location)
+
+    def test_unknown_reference_and_pin(self, schematic):
+        """Missing references and pin numbers are reported as not found"""
+        locator = PinLocator()
+
+        assert locator.get_pin_location(schematic, "R9", "1") is None
+        assert locator.get_pin_location(schematic, "R1", "3") is None
+        assert locator.get_all_symbol_pins(schematic, "R9") == {}
+
+
+class TestCacheInvalidation:
+    """Test that cached schematic data follows changes to the file"""
+
+    def test_modified_schematic_is_reparsed(self, schematic):
+        """A new mtime drops cached instances and pin definitions"""
+        locator = PinLocator()
+        assert locator.get_pin_location(schematic, "R1", "1") == pytest.approx([100, 53.81])
+
+        # Same size, so only the mtime tells the versions apart
+        write_schematic(schematic, r1_x="200", pin_y="5.08", mtime_ns=2_000_000_000)
+
+        assert locator.get_pin_location(schematic, "R1", "1") == pytest.approx([200, 55.08])
+
+    def test_pin_definitions_are_cached_on_disk(self, schematic, cache_dir):
+        """Pin definitions are stored once and read back for an unchanged lib_symbols"""
+        first = PinLocator().get_symbol_pins(schematic, "Test:R")
+        cached_files = list((cache_dir / pin_locator._LIB_PINS_CACHE_DIR).glob("*.json"))
+        assert len(cached_files) == 1
+
+        # Moving an instance leaves lib_symbols, and so the cache file, unchanged
+        write_schematic(schematic, r1_x="300", mtime_ns=3_000_000_000)
+
+        assert PinLocator().get_symbol_pins(schematic, "Test:R") == first
+        assert list((cache_dir / pin_locator._LIB_PINS_CACHE_DIR).glob("*.json")) == cached_files
+
+    def test_cache_is_pruned_least_recently_used_first(self, schematic, cache_dir, monkeypatch):
+        """Past the limit the least recently used files are deleted first"""
+        monkeypatch.setattr(pin_locator, "_LIB_PINS_CACHE_LIMIT", 2)
+        pins_dir = cache_dir / pin_locator._LIB_PINS_CACHE_DIR
+        pins_dir.mkdir(parents=True)
+        for age, name in enumerate(("newest", "older", "oldest"), start=1):
+            stale = pins_dir / f"{name}.json"
+            stale.write_text("{}")
+            os.utime(stale, (1_000_000 - age, 1_000_000 - age))
+
+        PinLocator().get_symbol_pins(schematic, "Test:R")
+
+        remaining = {path.name for path in pins_dir.glob("*.json")}
+        assert len(remaining) == 2
+        assert "newest.json" in remaining
+        assert remaining.isdisjoint({"older.json", "oldest.json"})
@@ -0,0 +1,104 @@
+"""Tests for the track lookups behind trace routing and deletion."""
+
+from __future__ import annotations
+
+import pytest
+
+from tests.helpers import load_command_module
+
+pcbnew = pytest.importorskip("pcbnew", reason="KiCAD pcbnew module not available")
+routing = load_command_module("routing")
+RoutingCommands = routing.RoutingCommands
+
+CELL = routing.TRACK_GRID_CELL_NM
+NM_PER_MM = 1_000_000
+
+
+def add_track(board, start: tuple[float, float], end: tuple[float, float]):
+    """Add a 0.25mm F.Cu track between two points given in mm."""
+    track = pcbnew.PCB_TRACK(board)
+    track.SetStart(pcbnew.VECTOR2I(int(start[0] * NM_PER_MM), int(start[1] * NM_PER_MM)))
+    track.SetEnd(pcbnew.VECTOR2I(int(end[0] * NM_PER_MM), int(end[1] * NM_PER_MM)))
+    track.SetWidth(int(0.25 * NM_PER_MM))
+    track.SetLayer(board.GetLayerID("F.Cu"))
+    board.Add(track)
+    return track
+
+
+def point(x: float, y: float):
+    """Build a board point from mm coordinates."""
+    return pcbnew.VECTOR2I(int(x * NM_PER_MM), int(y * NM_PER_MM))
+
+
+class TestGridCells:
+    """Test mapping rectangles to spatial grid cells"""
+
+    def test_rectangle_inside_one_cell(self):
+        assert list(routing._grid_cells(0, 0, CELL - 1, CELL - 1)) == [(0, 0)]
+
+    def test_rectangle_across_cells_and_negative_coordinates(self):
+        """Edges on either side of zero land in cells -1 and 0"""
+        cells = list(routing._grid_cells(-1, 0, CELL, 0))
+
+        assert cells == [(-1, 0), (0, 0), (1, 0)]
+
+
+class TestTrackGrid:
+    """Test finding tracks near a point through the spatial grid"""
+
+    @pytest.fixture
+    def board(self):
+        board = pcbnew.BOARD()
+        add_track(board, (0, 0), (5, 0))
+        add_track(board, (50, 50), (55, 50))
+        return board
+
+    def test_closest_track_within_radius(self, board):
+        """Only a track within TRACK_SEARCH_RADIUS_NM of the point is returned"""
+        commands = RoutingCommands(board)
+
+        track, distance = commands._find_closest_track(point(52, 50.5))
+        assert track.GetStart() == point(50, 50)
+        assert distance < routing.TRACK_SEARCH_RADIUS_NM
+
+        assert commands._find_closest_track(point(30, 30))[0] is None
+
+    def test_long_track_is_found_from_a_distant_cell(self, board):
+        """A track spanning many cells is indexed in every cell it crosses"""
+        add_track(board, (0, 100), (100, 100))
+        commands = RoutingCommands(board)
+
+        track, _ = commands._find_closest_track(point(95, 100.5))
+
+        assert track.GetEnd() == point(100, 100)
+
+    def test_routed_track_is_indexed(self, board):
+        """Adding a track drops the grid, so the next lookup sees the new track"""
+        commands = RoutingCommands(board)
+        assert commands._find_closest_track(point(20, 20))[0] is None
+
+        result = commands.route_trace(
+            {"start": {"x": 15, "y": 20}, "end": {"x": 25, "y": 20}, "width": 0.25}
+        )
+
+        assert result["success"]
+        assert commands._find_closest_track(point(20, 20))[0] is not None
+
+    def test_deleted_track_leaves_the_index(self, board):
+        """Deleting by position drops the grid, so the track cannot be found again"""
+        commands = RoutingCommands(board)
+        position = {"x": 2, "y": 0, "unit": "mm"}
+
+        assert commands.delete_trace({"position": position})["success"]
+
+        assert commands._find_closest_track(point(2, 0))[0] is None
+        assert commands._find_closest_track(point(52, 50))[0] is not None
+
+    def test_new_board_gets_a_new_index(self, board):
+        """Switching boards rebuilds the grid from the new board's tracks"""
+        commands = RoutingCommands(board)
+        assert commands._find_closest_track(point(2, 0))[0] is not None
+
+        commands.board = pcbnew.BOARD()
+
+        assert commands._find_closest_track(point(2, 0))[0] is None